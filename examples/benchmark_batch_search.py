@@ -0,0 +1,50 @@
+# examples/benchmark_batch_search.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import random
+import time
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.search_algorithms.batch_search import solve_batch, SEARCH_FUNCTIONS
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch pathfinding throughput vs number of worker processes')
+    parser.add_argument('--algorithm', type=str, default='astar', choices=list(SEARCH_FUNCTIONS),
+                        help='Search algorithm to use (default: astar)')
+    parser.add_argument('--grid_size', type=int, default=200, help='Size of the grid (default: 200)')
+    parser.add_argument('--queries', type=int, default=400, help='Number of (start, goal) queries (default: 400)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker counts to compare (default: 1 2 4 8)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    env = GridEnvironment(args.grid_size, num_tasks=1, seed=args.seed)
+    grid = env.get_grid()
+    free_cells = [(x, y) for y in range(args.grid_size) for x in range(args.grid_size) if grid[y][x] == 0]
+    queries = [(random.choice(free_cells), random.choice(free_cells)) for _ in range(args.queries)]
+
+    print(f"{os.cpu_count()} CPUs available")
+    print(f"{'workers':>8} {'time':>10} {'queries/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        started = time.perf_counter()
+        results = solve_batch(queries, grid, algorithm=args.algorithm, workers=workers)
+        elapsed = time.perf_counter() - started
+        if baseline is None:
+            baseline = elapsed
+        assert len(results) == len(queries)
+        print(f"{workers:>8} {elapsed:>9.2f}s {len(queries) / elapsed:>10.1f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# examples/benchmark_csp.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+
+from modules.csp_algorithms import (CSPStats, solve, count_solutions, n_queens, map_coloring, random_map, sudoku,
+                                   HARD_SUDOKUS)
+
+# Solver setups from plain backtracking up to MAC with every ordering heuristic:
+# (label, inference, variable order, value order)
+CONFIGS = [
+    ('backtracking', 'none', 'static', 'static'),
+    ('fc', 'fc', 'static', 'static'),
+    ('fc+mrv', 'fc', 'mrv', 'static'),
+    ('mac+mrv', 'mac', 'mrv', 'static'),
+    ('mac+mrv+degree+lcv', 'mac', 'mrv_degree', 'lcv'),
+]
+# Setups without MRV are only run on the problems small enough for them
+WEAK_CONFIGS = {'backtracking', 'fc'}
+
+
+def run(label, csp, config, count):
+    _, inference, variable_order, value_order = config
+    stats = CSPStats()
+    if count:
+        found = count_solutions(csp, inference, variable_order, value_order, stats=stats)
+    else:
+        solution = solve(csp, inference, variable_order, value_order, stats=stats)
+        found = int(solution is not None)
+        if solution is not None and not csp.is_solution(solution):
+            print(f"warning: {config[0]} returned an invalid solution for {label}")
+    print(f"{label:>14} {config[0]:>20} {found:>9} {stats.assignments:>10} {stats.backtracks:>10} "
+          f"{stats.revisions:>10} {stats.prunings:>9} {stats.elapsed:>8.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backtracking CSP solver with forward checking, MAC and ordering heuristics')
+    parser.add_argument('--queens', type=int, nargs='+', default=[8, 16, 32, 64],
+                        help='N-Queens sizes solved for one solution (default: 8 16 32 64)')
+    parser.add_argument('--count_queens', type=int, default=8,
+                        help='N-Queens size whose solutions are all counted (default: 8)')
+    parser.add_argument('--weak_queens', type=int, default=16,
+                        help='Largest N-Queens size tried without MRV (default: 16)')
+    parser.add_argument('--regions', type=int, default=30, help='Regions of the random map (default: 30)')
+    parser.add_argument('--colors', type=int, default=4, help='Colors for the random map (default: 4)')
+    parser.add_argument('--seed', type=int, default=1, help='Seed of the random map (default: 1)')
+    args = parser.parse_args()
+
+    print(f"{'problem':>14} {'solver':>20} {'solutions':>9} {'assigned':>10} {'backtracks':>10} "
+          f"{'revisions':>10} {'prunings':>9} {'time':>9}")
+    for n in args.queens:
+        for config in CONFIGS:
+            if n <= args.weak_queens or config[0] not in WEAK_CONFIGS:
+                run(f"queens {n}", n_queens(n), config, count=False)
+    for config in CONFIGS:
+        run(f"all queens {args.count_queens}", n_queens(args.count_queens), config, count=True)
+
+    borders = random_map(args.regions, seed=args.seed)
+    for config in CONFIGS:
+        run(f"map {args.regions}", map_coloring(borders, args.colors), config, count=False)
+
+    # Plain backtracking and forward checking without MRV take far too long on hard Sudokus
+    totals = {}
+    for number, puzzle in enumerate(HARD_SUDOKUS):
+        for config in CONFIGS:
+            if config[0] in WEAK_CONFIGS:
+                continue
+            # The counters of one CSPStats add up over all the puzzles
+            stats = totals.setdefault(config[0], CSPStats())
+            csp = sudoku(puzzle)
+            solution = solve(csp, *config[1:], stats=stats)
+            if solution is None or not csp.is_solution(solution):
+                print(f"warning: {config[0]} did not solve sudoku {number}")
+    for label, stats in totals.items():
+        print(f"{f'{len(HARD_SUDOKUS)} sudokus':>14} {label:>20} {stats.solutions:>9} {stats.assignments:>10} "
+              f"{stats.backtracks:>10} {stats.revisions:>10} {stats.prunings:>9} {stats.elapsed:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# examples/benchmark_exact_cover.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import time
+
+from modules.csp_algorithms import (ExactCover, ParallelExactCover, queens_cover, sudoku_cover, sudoku_solution,
+                                    CSPStats, count_solutions, solve, n_queens, sudoku, HARD_SUDOKUS)
+
+# Number of N-Queens solutions, to check the counts against
+QUEENS_SOLUTIONS = {8: 92, 9: 352, 10: 724, 11: 2680, 12: 14200, 13: 73712, 14: 365596, 15: 2279184}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dancing Links exact cover vs the backtracking CSP solver')
+    parser.add_argument('--queens', type=int, nargs='+', default=[8, 9, 10, 11, 12],
+                        help='N-Queens sizes whose solutions are all enumerated (default: 8 to 12; 14 takes minutes)')
+    parser.add_argument('--csp_queens', type=int, default=10,
+                        help='Largest size also counted by the CSP solver (default: 10)')
+    parser.add_argument('--workers', type=int, nargs='*', default=[2, 4],
+                        help='Worker counts for the parallel split (default: 2 4)')
+    parser.add_argument('--split_depth', type=int, default=2, help='Levels split across workers (default: 2)')
+    args = parser.parse_args()
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'queens':>6} {'solver':>14} {'solutions':>10} {'time':>9} {'solutions/s':>12} {'nodes':>10}")
+    for n in args.queens:
+        problem = ExactCover(*queens_cover(n))
+        started = time.perf_counter()
+        solutions = sum(1 for _ in problem.solutions())
+        elapsed = time.perf_counter() - started
+        if solutions != QUEENS_SOLUTIONS.get(n, solutions):
+            print(f"warning: {solutions} solutions for {n} queens, expected {QUEENS_SOLUTIONS[n]}")
+        print(f"{n:>6} {'dlx':>14} {solutions:>10} {elapsed:>8.2f}s {solutions / elapsed:>12.0f} {problem.nodes:>10}")
+
+        if n <= args.csp_queens:
+            stats = CSPStats()
+            solutions = count_solutions(n_queens(n), 'fc', 'mrv', stats=stats)
+            print(f"{n:>6} {'csp fc+mrv':>14} {solutions:>10} {stats.elapsed:>8.2f}s "
+                  f"{solutions / stats.elapsed:>12.0f} {stats.assignments:>10}")
+
+        for workers in args.workers:
+            # The pool is started outside the timing, as a program solving many problems would keep it
+            with ParallelExactCover(*queens_cover(n), workers=workers, split_depth=args.split_depth) as engine:
+                started = time.perf_counter()
+                solutions = engine.count()
+                elapsed = time.perf_counter() - started
+            print(f"{n:>6} {f'dlx x{workers}':>14} {solutions:>10} {elapsed:>8.2f}s {solutions / elapsed:>12.0f} "
+                  f"{'':>10}")
+
+    print(f"\n{'sudoku':>6} {'solver':>14} {'time':>9} {'nodes':>10} {'unique':>7}")
+    totals = {'dlx': 0.0, 'csp mac': 0.0}
+    for number, puzzle in enumerate(HARD_SUDOKUS):
+        columns, rows, primary = sudoku_cover(puzzle)
+        problem = ExactCover(columns, rows, primary)
+        started = time.perf_counter()
+        solution = problem.solve()
+        elapsed = time.perf_counter() - started
+        nodes = problem.nodes
+        totals['dlx'] += elapsed
+        # A proper Sudoku has exactly one solution; counting them searches the whole tree
+        unique = sum(1 for _ in problem.solutions()) == 1
+        if solution is None or not sudoku(puzzle).is_solution(sudoku_solution(rows, solution)):
+            print(f"warning: dlx did not solve sudoku {number}")
+        print(f"{number:>6} {'dlx':>14} {elapsed:>8.4f}s {nodes:>10} {str(unique):>7}")
+
+        stats = CSPStats()
+        solve(sudoku(puzzle), 'mac', 'mrv_degree', 'lcv', stats=stats)
+        totals['csp mac'] += stats.elapsed
+        print(f"{number:>6} {'csp mac':>14} {stats.elapsed:>8.4f}s {stats.assignments:>10}")
+    for solver, elapsed in totals.items():
+        print(f"{'total':>6} {solver:>14} {elapsed:>8.4f}s, {len(HARD_SUDOKUS) / elapsed:.0f} sudokus/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# examples/benchmark_genetic_algorithm.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import random
+import time
+
+from modules.search_algorithms import local_search
+from modules.search_algorithms.genetic_algorithm import QueensGA
+
+
+def run_list_ga(max_generations, seed):
+    """Runs the list-based 8-Queens GA from local_search the way examples/main_8_queen.py does.
+
+    Returns (solved, generations, seconds).
+    """
+    random.seed(seed)
+    local_search.fitness_cache.clear()
+    started = time.perf_counter()
+    population = [local_search.generate_individual() for _ in range(local_search.POPULATION_SIZE)]
+    for generation in range(max_generations):
+        population = local_search.select_population(population)
+        if local_search.fitness_cache(population[0]) == 28:
+            return True, generation, time.perf_counter() - started
+        next_generation = []
+        while len(next_generation) < local_search.POPULATION_SIZE:
+            child = local_search.crossover(random.choice(population), random.choice(population))
+            local_search.mutate(child)
+            next_generation.append(child)
+        population = next_generation
+    return False, max_generations, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized N-Queens GA vs the list-based 8-Queens GA')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[8, 32, 64],
+                        help='Board sizes for the vectorized GA (default: 8 32 64)')
+    parser.add_argument('--populations', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='Population sizes for the vectorized GA (default: 100 1000 10000)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per configuration (default: 3)')
+    parser.add_argument('--max_generations', type=int, default=2000,
+                        help='Generation limit per run (default: 2000)')
+    parser.add_argument('--time_limit', type=float, default=30.0, help='Seconds allowed per run (default: 30)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'engine':>10} {'n':>5} {'population':>11} {'solved':>7} {'generations':>12} "
+          f"{'gen/s':>9} {'time':>9}")
+
+    solved = generations = 0
+    seconds = 0.0
+    for run in range(args.runs):
+        found, run_generations, run_seconds = run_list_ga(args.max_generations, args.seed + run)
+        solved += found
+        generations += run_generations
+        seconds += run_seconds
+    print(f"{'list':>10} {8:>5} {local_search.POPULATION_SIZE:>11} {solved:>4}/{args.runs:<2} "
+          f"{generations / args.runs:>12.0f} {generations / seconds if seconds else 0:>9.0f} "
+          f"{seconds / args.runs:>8.2f}s")
+
+    for n in args.sizes:
+        for population_size in args.populations:
+            solved = generations = 0
+            seconds = 0.0
+            for run in range(args.runs):
+                ga = QueensGA(n, population_size, seed=args.seed + run)
+                started = time.perf_counter()
+                solved += ga.run(args.max_generations, args.time_limit) is not None
+                seconds += time.perf_counter() - started
+                generations += ga.generation
+            print(f"{'numpy':>10} {n:>5} {population_size:>11} {solved:>4}/{args.runs:<2} "
+                  f"{generations / args.runs:>12.0f} {generations / seconds if seconds else 0:>9.0f} "
+                  f"{seconds / args.runs:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# examples/benchmark_graph_search.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import random
+import tempfile
+import time
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.search_algorithms import bfs, ucs, astar, search_grid, graph_bfs, graph_ucs
+from modules.utils.graph import CSRGraph, grid_graph
+
+
+def write_road_network(path, side, rng):
+    """Writes a side x side street grid with random missing streets and random lengths as an edge list."""
+    with open(path, 'w') as file:
+        file.write("# source target length\n")
+        for y in range(side):
+            for x in range(side):
+                if x + 1 < side and rng.random() < 0.9:
+                    file.write(f"{y * side + x} {y * side + x + 1} {rng.uniform(50, 200):.1f}\n")
+                if y + 1 < side and rng.random() < 0.9:
+                    file.write(f"{y * side + x} {(y + 1) * side + x} {rng.uniform(50, 200):.1f}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Grid searches vs the same searches over a cached CSR graph')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[200, 500],
+                        help='Grid sizes to benchmark (default: 200 500)')
+    parser.add_argument('--queries', type=int, default=20, help='Searches per grid (default: 20)')
+    parser.add_argument('--edges', type=str, default=None,
+                        help='Edge list file to load (default: a generated road network)')
+    parser.add_argument('--road_side', type=int, default=300,
+                        help='Intersections per side of the generated road network (default: 300)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'size':>6} {'build':>9} {'cached':>9} {'algorithm':>10} {'grid':>10} {'csr':>10} {'speedup':>8}")
+    for size in args.sizes:
+        grid = GridEnvironment(size, num_tasks=1, seed=args.seed).get_grid()
+        free_cells = [grid.position_of(index) for index in grid.reachable_from(0)]
+        queries = [(rng.choice(free_cells), rng.choice(free_cells)) for _ in range(args.queries)]
+        started = time.perf_counter()
+        grid_graph(grid)
+        build_time = time.perf_counter() - started
+        started = time.perf_counter()
+        grid_graph(grid)
+        cached_time = time.perf_counter() - started
+        for name, search in [('bfs', bfs), ('ucs', ucs), ('astar', astar)]:
+            grid_time = csr_time = 0.0
+            for start, goal in queries:
+                started = time.perf_counter()
+                path = search(start, goal, grid, set(), size)
+                grid_time += time.perf_counter() - started
+                started = time.perf_counter()
+                graph_path = search_grid(name, start, goal, grid, set(), size)
+                csr_time += time.perf_counter() - started
+                if len(path) != len(graph_path):
+                    print(f"warning: {name} path lengths differ ({len(path)} vs {len(graph_path)})")
+            print(f"{size:>6} {build_time:>8.3f}s {cached_time * 1000:>7.2f}ms {name:>10} "
+                  f"{grid_time / len(queries) * 1000:>8.1f}ms {csr_time / len(queries) * 1000:>8.1f}ms "
+                  f"{grid_time / csr_time:>7.2f}x")
+
+    if args.edges is not None:
+        benchmark_edge_list(args.edges, args.queries, rng)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'roads.txt')
+            write_road_network(path, args.road_side, rng)
+            benchmark_edge_list(path, args.queries, rng)
+
+
+def benchmark_edge_list(path, queries, rng):
+    started = time.perf_counter()
+    graph = CSRGraph.from_edge_list(path)
+    load_time = time.perf_counter() - started
+    print(f"\n{path}: {graph.vertex_count} vertices, {graph.edge_count} directed edges, loaded in {load_time:.2f}s")
+    for name, search in [('bfs', graph_bfs), ('ucs', graph_ucs)]:
+        total = 0.0
+        found = 0
+        for _ in range(queries):
+            source, target = rng.randrange(graph.vertex_count), rng.randrange(graph.vertex_count)
+            started = time.perf_counter()
+            found += search(graph, source, target) is not None
+            total += time.perf_counter() - started
+        print(f"{name:>10} {found}/{queries} connected, {total / queries * 1000:.1f}ms per query")
+
+
+if __name__ == "__main__":
+    main()
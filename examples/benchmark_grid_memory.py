@@ -0,0 +1,44 @@
+# examples/benchmark_grid_memory.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import tracemalloc
+
+from modules.utils.grid import Grid
+
+
+def traced_peak(build):
+    """Returns (object, peak_bytes) for the allocation performed by build()."""
+    tracemalloc.start()
+    result = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List-of-lists vs Grid memory footprint')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[256, 1024, 4096],
+                        help='Square grid sizes to measure (default: 256 1024 4096)')
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'list of lists':>14} {'Grid':>10} {'ratio':>7}")
+    for size in args.sizes:
+        # Built the same way the environments used to build their grids
+        rows, rows_peak = traced_peak(lambda: [[0 for _ in range(size)] for _ in range(size)])
+        del rows
+        grid, grid_peak = traced_peak(lambda: Grid(size, size))
+        del grid
+        print(f"{size:>6} {rows_peak / 2 ** 20:>12.1f}MB {grid_peak / 2 ** 20:>8.1f}MB "
+              f"{rows_peak / grid_peak:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
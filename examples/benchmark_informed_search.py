@@ -0,0 +1,55 @@
+# examples/benchmark_informed_search.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import time
+
+from modules.environments.maze_environment import MazeEnvironment
+from modules.search_algorithms.informed_search import astar, jps, bidirectional_astar
+from modules.search_algorithms.search_stats import SearchStats
+
+ALGORITHMS = [('astar', astar), ('jps', jps), ('bidirectional_astar', bidirectional_astar)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='A* vs JPS vs bidirectional A* on generated mazes')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[101, 201, 401],
+                        help='Maze sizes (odd numbers, default: 101 201 401)')
+    parser.add_argument('--mazes', type=int, default=5, help='Mazes per size (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'algorithm':>20} {'expanded':>10} {'time':>10} {'path':>7}")
+    for size in args.sizes:
+        if size % 2 == 0:
+            size += 1
+        mazes = [MazeEnvironment(size, size, seed=args.seed + number).get_grid() for number in range(args.mazes)]
+        start, goal = (1, 0), (size - 2, size - 1)
+        reference_lengths = None
+        for name, search in ALGORITHMS:
+            stats = SearchStats()
+            elapsed = 0.0
+            lengths = []
+            for grid in mazes:
+                started = time.perf_counter()
+                path = search(start, goal, grid, set(), size, stats=stats)
+                elapsed += time.perf_counter() - started
+                lengths.append(len(path) if path else 0)
+            expanded = stats.expansions
+            if reference_lengths is None:
+                reference_lengths = lengths
+            elif lengths != reference_lengths:
+                print(f"warning: {name} path lengths differ from astar")
+            print(f"{size:>6} {name:>20} {expanded / len(mazes):>10.0f} {elapsed / len(mazes) * 1000:>8.2f}ms "
+                  f"{sum(lengths) / len(lengths):>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# examples/benchmark_island_ga.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+
+from modules.search_algorithms.genetic_algorithm import run_islands
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Island-model N-Queens GA: time to solution vs number of islands')
+    parser.add_argument('--n', type=int, default=32, help='Number of queens (default: 32)')
+    parser.add_argument('--islands', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Island counts to compare, one process each (default: 1 2 4 8)')
+    parser.add_argument('--population', type=int, default=200, help='Population of each island (default: 200)')
+    parser.add_argument('--migration_interval', type=int, default=20,
+                        help='Generations between migrations (default: 20)')
+    parser.add_argument('--migrants', type=int, default=2, help='Individuals sent per migration (default: 2)')
+    parser.add_argument('--max_generations', type=int, default=10000,
+                        help='Generation limit per island (default: 10000)')
+    parser.add_argument('--time_limit', type=float, default=30.0, help='Seconds allowed per run (default: 30)')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per island count (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs available")
+    print(f"{'islands':>8} {'solved':>7} {'generations':>12} {'gen/s':>9} {'time':>9} {'speedup':>8}")
+    baseline = None
+    for islands in args.islands:
+        solved = generations = 0
+        seconds = 0.0
+        for run in range(args.runs):
+            result = run_islands(args.n, islands, args.population, args.migration_interval, args.migrants,
+                                 args.max_generations, args.time_limit, seed=args.seed + 1000 * run)
+            solved += result.solution is not None
+            generations += sum(result.generations)
+            seconds += result.wall_time
+        if baseline is None:
+            baseline = seconds
+        print(f"{islands:>8} {solved:>4}/{args.runs:<2} {generations / args.runs:>12.0f} "
+              f"{generations / seconds:>9.0f} {seconds / args.runs:>8.2f}s {baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
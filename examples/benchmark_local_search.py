@@ -0,0 +1,101 @@
+# examples/benchmark_local_search.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import random
+import time
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.environments.maze_environment import MazeEnvironment
+from modules.search_algorithms import bfs, hill_climbing, simulated_annealing
+from modules.search_algorithms.batched_local_search import (
+    batched_hill_climbing, batched_simulated_annealing, COOLING_SCHEDULES
+)
+
+
+def generate_problems(environment, size, count, seed):
+    """Returns (grid, start, goal, shortest_length) problems with a reachable goal."""
+    rng = random.Random(seed)
+    problems = []
+    while len(problems) < count:
+        if environment == 'maze':
+            maze = MazeEnvironment(size, size, seed=rng.randrange(2 ** 32))
+            grid = maze.get_grid()
+            start, goal = maze.entrance_position, maze.exit_position
+        else:
+            env = GridEnvironment(size, num_tasks=1, seed=rng.randrange(2 ** 32))
+            grid = env.get_grid()
+            start, goal = env.get_start_position(), env.get_tasks()[0]
+        shortest = bfs(start, goal, grid, set(), size)
+        if shortest:
+            problems.append((grid, start, goal, len(shortest)))
+    return problems
+
+
+def configurations(args, size):
+    """Yields (label, search) pairs: the single trajectories, then every batched setup at every step budget."""
+    yield 'hill_climbing', hill_climbing
+    yield 'simulated_annealing', simulated_annealing
+    for budget in args.budgets:
+        max_steps = budget * size
+        for chains in args.chains:
+            yield (f'batched_hc x{chains} {max_steps} steps',
+                   lambda *problem, chains=chains, max_steps=max_steps: batched_hill_climbing(
+                       *problem, chains=chains, max_steps=max_steps))
+        for schedule in args.schedules:
+            for chains in args.chains:
+                yield (f'batched_sa {schedule} x{chains} {max_steps} steps',
+                       lambda *problem, chains=chains, schedule=schedule, max_steps=max_steps:
+                       batched_simulated_annealing(*problem, chains=chains, max_steps=max_steps, schedule=schedule,
+                                                   initial_temperature=args.temperature))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Success rate vs wall time of single and batched local search on generated grids')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[30, 100], help='Grid sizes (default: 30 100)')
+    parser.add_argument('--environments', type=str, nargs='+', default=['grid', 'maze'], choices=['grid', 'maze'],
+                        help='Environments to generate (default: grid maze)')
+    parser.add_argument('--chains', type=int, nargs='+', default=[16, 128],
+                        help='Chains per batched search (default: 16 128)')
+    parser.add_argument('--budgets', type=int, nargs='+', default=[10, 50, 200],
+                        help='Step budgets of the batched searches, in multiples of the grid size (default: 10 50 200)')
+    parser.add_argument('--schedules', type=str, nargs='+', default=list(COOLING_SCHEDULES),
+                        choices=list(COOLING_SCHEDULES), help='Cooling schedules (default: all)')
+    parser.add_argument('--temperature', type=float, default=1000,
+                        help='Initial temperature of the batched annealing (default: 1000)')
+    parser.add_argument('--count', type=int, default=10, help='Problems per environment and size (default: 10)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'env':>5} {'size':>5} {'search':>44} {'success':>8} {'time':>10} {'path/shortest':>14}")
+    for environment in args.environments:
+        for size in args.sizes:
+            if environment == 'maze':
+                size |= 1
+            problems = generate_problems(environment, size, args.count, args.seed)
+            for label, search in configurations(args, size):
+                random.seed(args.seed)  # The single-trajectory annealing draws from the global generator
+                successes = 0
+                seconds = 0.0
+                ratio = 0.0
+                for grid, start, goal, shortest in problems:
+                    started = time.perf_counter()
+                    path = search(start, goal, grid, set(), size)
+                    seconds += time.perf_counter() - started
+                    if path and path[-1] == goal:
+                        successes += 1
+                        ratio += len(path) / shortest
+                print(f"{environment:>5} {size:>5} {label:>44} {successes / len(problems):>8.0%} "
+                      f"{seconds / len(problems) * 1000:>8.1f}ms {ratio / successes if successes else 0:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
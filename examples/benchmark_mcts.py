@@ -0,0 +1,140 @@
+# examples/benchmark_mcts.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import math
+import time
+import tracemalloc
+
+import numpy as np
+
+from modules.adversarial_search import ConnectFour, AlphaBeta
+from modules.adversarial_search.mcts import MCTS, random_playout, DRAW
+
+
+# Reference UCT with one Python object per node and one playout per iteration,
+# kept here only so the array-backed, batched MCTS can be compared against it.
+
+class Node:
+    def __init__(self, parent, move, mover):
+        self.parent = parent
+        self.move = move
+        self.mover = mover
+        self.children = []
+        self.untried = None
+        self.visits = 0
+        self.wins = 0.0
+
+
+def object_mcts(game, time_limit, rng):
+    """Returns (best move, playouts, nodes)."""
+    game = game.copy()
+    root = Node(None, None, None)
+    root.untried = game.legal_moves()
+    nodes = 1
+    playouts = 0
+    deadline = time.perf_counter() + time_limit
+    while time.perf_counter() < deadline:
+        node = root
+        played = []
+        while not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            node = max(node.children, key=lambda child: child.wins / child.visits
+                       + 1.4 * math.sqrt(log_visits / child.visits))
+            game.play(node.move)
+            played.append(node.move)
+        if node.untried:
+            move = node.untried.pop(int(rng.integers(len(node.untried))))
+            child = Node(node, move, game.player)
+            game.play(move)
+            played.append(move)
+            child.untried = game.legal_moves()
+            node.children.append(child)
+            node = child
+            nodes += 1
+        winner = game.winner()
+        if winner is None:
+            winner = random_playout(game.copy(), rng)
+        playouts += 1
+        while node is not None:
+            node.visits += 1
+            if node.mover is not None:
+                node.wins += 1.0 if winner == node.mover else 0.5 if winner == DRAW else 0.0
+            node = node.parent
+        for move in reversed(played):
+            game.undo(move)
+    best = max(root.children, key=lambda child: child.visits)
+    return best.move, playouts, nodes
+
+
+def traced(function):
+    """Runs function and returns (its result, peak bytes allocated while it ran)."""
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+def play_match(games, move_time, seed):
+    """MCTS against AlphaBeta with the same time per move, alternating who starts; returns (mcts, alphabeta, draws)."""
+    score = [0, 0, 0]
+    for number in range(games):
+        game = ConnectFour()
+        engines = [MCTS(seed=seed + number), AlphaBeta()]
+        mcts_player = number % 2
+        if mcts_player == 1:
+            engines.reverse()
+        while not game.is_over():
+            game.play(engines[game.player].best_move(game, move_time))
+        winner = game.winner()
+        if winner is None:
+            score[2] += 1
+        else:
+            score[0 if winner == mcts_player else 1] += 1
+    return score
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Array-backed MCTS with batched playouts vs an object-per-node MCTS')
+    parser.add_argument('--time', type=float, default=2.0, help='Search time per measurement, in seconds (default: 2)')
+    parser.add_argument('--batch_sizes', type=int, nargs='+', default=[1, 16, 64, 256],
+                        help='Playouts per leaf for the batched MCTS (default: 1 16 64 256)')
+    parser.add_argument('--games', type=int, default=2, help='Games of MCTS against AlphaBeta (default: 2, 0 to skip)')
+    parser.add_argument('--move_time', type=float, default=0.5, help='Seconds per move in those games (default: 0.5)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    game = ConnectFour()
+    for column in (3, 3, 2, 4):
+        game.play(column)
+
+    print(f"{'engine':>22} {'playouts':>9} {'playouts/s':>11} {'nodes':>8} {'bytes/node':>11} {'move':>5}")
+    rng = np.random.default_rng(args.seed)
+    (move, playouts, nodes), peak = traced(lambda: object_mcts(game, args.time, rng))
+    # tracemalloc slows the object tree down, so its speed is measured in a second, untraced run
+    _, untraced_playouts, _ = object_mcts(game, args.time, rng)
+    print(f"{'objects x1':>22} {playouts:>9} {untraced_playouts / args.time:>11.0f} {nodes:>8} "
+          f"{peak / nodes:>11.0f} {move:>5}")
+    # The array tree counts every child created by an expansion, the object tree only the children tried
+    for batch_size in args.batch_sizes:
+        engine = MCTS(batch_size=batch_size, seed=args.seed)
+        result = engine.search(game, args.time)
+        print(f"{f'arrays x{batch_size}':>22} {result.playouts:>9} {result.playouts_per_second:>11.0f} "
+              f"{result.nodes:>8} {result.bytes_per_node:>11} {result.move:>5}")
+
+    if args.games:
+        mcts_wins, alphabeta_wins, draws = play_match(args.games, args.move_time, args.seed)
+        print(f"\nMCTS vs AlphaBeta at {args.move_time:g}s per move: {mcts_wins} won, {alphabeta_wins} lost, "
+              f"{draws} drawn")
+
+
+if __name__ == "__main__":
+    main()
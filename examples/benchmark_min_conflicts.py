@@ -0,0 +1,45 @@
+# examples/benchmark_min_conflicts.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import time
+
+from modules.search_algorithms import min_conflicts, QueensBoard, SearchStats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Min-conflicts N-Queens solver on large boards')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000],
+                        help='Numbers of queens (default: 1000 10000 100000 1000000)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per size (default: 3)')
+    parser.add_argument('--max_steps', type=int, default=None, help='Repair step limit per run (default: none)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'n':>9} {'solved':>7} {'steps':>8} {'steps/s':>10} {'repair':>9} {'total':>9}")
+    for n in args.sizes:
+        stats = SearchStats()
+        solved = 0
+        seconds = 0.0
+        for run in range(args.runs):
+            started = time.perf_counter()
+            solution = min_conflicts(n, args.max_steps, seed=args.seed + run, stats=stats)
+            seconds += time.perf_counter() - started
+            if solution is not None:
+                if QueensBoard(solution).is_solution():
+                    solved += 1
+                else:
+                    print(f"warning: run {run} returned a board with attacking queens")
+        print(f"{n:>9} {solved:>4}/{args.runs:<2} {stats.expansions / args.runs:>8.0f} "
+              f"{stats.expansions_per_second:>10.0f} {stats.elapsed / args.runs:>8.3f}s {seconds / args.runs:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# examples/benchmark_minimax.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+
+from modules.adversarial_search import TicTacToe, ConnectFour, minimax, AlphaBeta
+
+# Engine setups from plain minimax up to the full alpha-beta engine
+ENGINES = [
+    ('minimax', None),
+    ('alphabeta', dict(transposition_table=False, killer_moves=False, history_heuristic=False)),
+    ('alphabeta+tt', dict(killer_moves=False, history_heuristic=False)),
+    ('alphabeta+tt+killers+history', dict()),
+]
+
+
+def print_result(game_name, depth, engine, result):
+    print(f"{game_name:>12} {depth:>6} {engine:>30} {result.nodes:>10} {result.elapsed:>8.2f}s "
+          f"{result.nodes_per_second:>10.0f} {result.effective_branching_factor:>6.2f} "
+          f"{result.score:>8} {str(result.move):>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plain minimax vs alpha-beta with a transposition table and move ordering')
+    parser.add_argument('--depths', type=int, nargs='+', default=[4, 6, 8],
+                        help='Connect Four search depths (default: 4 6 8)')
+    parser.add_argument('--minimax_depth', type=int, default=6,
+                        help='Deepest Connect Four search for plain minimax (default: 6)')
+    parser.add_argument('--opening', type=int, nargs='*', default=[3, 3, 2, 4],
+                        help='Connect Four columns played before searching (default: 3 3 2 4)')
+    parser.add_argument('--time', type=float, default=5.0,
+                        help='Time budget of the iterative deepening run, in seconds (default: 5)')
+    args = parser.parse_args()
+
+    print(f"{'game':>12} {'depth':>6} {'engine':>30} {'nodes':>10} {'time':>9} {'nodes/s':>10} {'EBF':>6} "
+          f"{'score':>8} {'move':>5}")
+    # Tic-tac-toe is searched to the end of the game
+    for engine, options in ENGINES:
+        if options is None:
+            result = minimax(TicTacToe())
+        else:
+            result = AlphaBeta(**options).search(TicTacToe(), time_limit=None)
+        print_result('tictactoe', 'end', engine, result)
+
+    game = ConnectFour()
+    for column in args.opening:
+        game.play(column)
+    for depth in args.depths:
+        for engine, options in ENGINES:
+            if options is None:
+                if depth > args.minimax_depth:
+                    continue
+                result = minimax(game, depth)
+            else:
+                # Iterative deepening up to depth; the effective branching factor is that of the last iteration
+                result = AlphaBeta(**options).search(game, time_limit=None, max_depth=depth)
+            print_result('connect4', depth, engine, result)
+
+    result = AlphaBeta().search(game, time_limit=args.time)
+    print(f"\nConnect Four after {args.opening}, {args.time:g}s budget: depth {result.depth}, move {result.move}, "
+          f"score {result.score}, {result.nodes} nodes ({result.nodes_per_second:.0f}/s), "
+          f"{result.table_hits} table hits, {result.cutoffs} cutoffs")
+    print(game)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# examples/benchmark_parallel_minimax.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+
+from modules.adversarial_search import ConnectFour, AlphaBeta, ParallelAlphaBeta
+
+# Connect Four openings (columns played) the positions are taken from
+OPENINGS = [[], [3, 3, 2, 4], [3, 2, 4, 4, 2, 3], [2, 4, 3, 3, 4, 2, 5]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Speedup of the root-split parallel alpha-beta on Connect Four')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker counts to measure (default: 1 2 4 8)')
+    parser.add_argument('--depth', type=int, default=10, help='Search depth in plies (default: 10)')
+    args = parser.parse_args()
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'position':>22} {'workers':>8} {'time':>9} {'speedup':>8} {'nodes':>9} {'move':>5} {'same':>5}")
+    totals = {}
+    for opening in OPENINGS:
+        game = ConnectFour()
+        for column in opening:
+            game.play(column)
+        label = ' '.join(map(str, opening)) or 'start'
+        sequential = AlphaBeta().search(game, time_limit=None, max_depth=args.depth)
+        totals.setdefault('sequential', 0.0)
+        totals['sequential'] += sequential.elapsed
+        print(f"{label:>22} {'seq':>8} {sequential.elapsed:>8.2f}s {1:>7.2f}x {sequential.nodes:>9} "
+              f"{sequential.move:>5} {'':>5}")
+        for workers in args.workers:
+            # The pool is started and warmed up outside the timed search, as a game-playing program would keep it
+            with ParallelAlphaBeta(workers=workers) as engine:
+                engine.search(game, time_limit=None, max_depth=2)
+                result = engine.search(game, time_limit=None, max_depth=args.depth)
+            totals[workers] = totals.get(workers, 0.0) + result.elapsed
+            print(f"{label:>22} {workers:>8} {result.elapsed:>8.2f}s {sequential.elapsed / result.elapsed:>7.2f}x "
+                  f"{result.nodes:>9} {result.move:>5} {str(result.move == sequential.move):>5}")
+
+    print("\nTotal over all positions:")
+    for workers in args.workers:
+        print(f"{workers:>3} workers: {totals[workers]:.2f}s, speedup {totals['sequential'] / totals[workers]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
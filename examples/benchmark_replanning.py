@@ -0,0 +1,132 @@
+# examples/benchmark_replanning.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import random
+import time
+
+from modules.environments.maze_environment import MazeEnvironment
+from modules.search_algorithms.incremental_search import DStarLite
+from modules.search_algorithms.informed_search import astar
+from modules.search_algorithms.search_stats import SearchStats
+from modules.utils.grid import Grid
+
+
+def random_grid(size, density, rng):
+    return Grid.from_rows([[1 if rng.random() < density else 0 for _ in range(size)] for _ in range(size)])
+
+
+def braid(grid, fraction, rng):
+    """Knocks out a fraction of the walls that separate two corridors, so blocked corridors have detours."""
+    width = grid.width
+    cells = grid.cells
+    candidates = []
+    for y in range(1, grid.height - 1):
+        for x in range(1, width - 1):
+            index = y * width + x
+            if cells[index] and ((not cells[index - 1] and not cells[index + 1])
+                                 or (not cells[index - width] and not cells[index + width])):
+                candidates.append(index)
+    for index in rng.sample(candidates, int(len(candidates) * fraction)):
+        cells[index] = 0
+    return grid
+
+
+def run_scenario(grid, start, goal, rng, changes_per_event, step_interval):
+    """Walks from start to goal, blocking cells on the remaining path every few steps.
+
+    After every change the D* Lite plan is repaired and, for comparison, A* is run
+    from scratch with the same blocked positions. Returns the per-replan totals.
+    """
+    size = max(grid.width, grid.height)
+    blocked = set()
+    planner_stats = SearchStats()
+    planner = DStarLite(start, goal, grid, blocked, size, stats=planner_stats)
+    path = planner.replan()
+    planner_stats.reset()  # Only the repairs are compared, not the initial plan
+    astar_stats = SearchStats()
+    totals = {'replans': 0, 'dstar_time': 0.0, 'astar_time': 0.0, 'mismatches': 0}
+    position = start
+    steps = 0
+    while path and position != goal:
+        position = path[1]
+        path = path[1:]
+        steps += 1
+        if steps % step_interval or len(path) < 3:
+            continue
+        # Block cells on the path ahead (never the goal) and sometimes free an old obstacle
+        for cell in rng.sample(path[1:-1], min(changes_per_event, len(path) - 2)):
+            blocked.add(cell)
+        if blocked and rng.random() < 0.3:
+            blocked.discard(rng.choice(sorted(blocked)))
+
+        started = time.perf_counter()
+        path = planner.replan(position, blocked)
+        totals['dstar_time'] += time.perf_counter() - started
+        started = time.perf_counter()
+        reference = astar(position, goal, grid, blocked, size, stats=astar_stats)
+        totals['astar_time'] += time.perf_counter() - started
+        totals['replans'] += 1
+        if (path is None) != (reference is None) or (path and len(path) != len(reference)):
+            totals['mismatches'] += 1
+    totals['dstar_expanded'] = planner_stats.expansions
+    totals['astar_expanded'] = astar_stats.expansions
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='D* Lite path repair vs A* replanning from scratch')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200],
+                        help='Random grid sizes (default: 50 100 200)')
+    parser.add_argument('--maze_sizes', type=int, nargs='+', default=[101, 201],
+                        help='Maze sizes (odd numbers, default: 101 201)')
+    parser.add_argument('--braid', type=float, default=0.1,
+                        help='Fraction of maze walls between corridors to remove (default: 0.1)')
+    parser.add_argument('--density', type=float, default=0.2, help='Wall density of random grids (default: 0.2)')
+    parser.add_argument('--scenarios', type=int, default=5, help='Walks per size (default: 5)')
+    parser.add_argument('--changes', type=int, default=2, help='Cells blocked per change event (default: 2)')
+    parser.add_argument('--interval', type=int, default=3, help='Steps between change events (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    environments = [('grid', size) for size in args.sizes] + [('maze', size | 1) for size in args.maze_sizes]
+    print(f"{'env':>5} {'size':>6} {'replans':>8} {'D* expanded':>12} {'A* expanded':>12} "
+          f"{'D* time':>10} {'A* time':>10} {'speedup':>8}")
+    for environment, size in environments:
+        totals = {'replans': 0, 'dstar_time': 0.0, 'astar_time': 0.0, 'mismatches': 0,
+                  'dstar_expanded': 0, 'astar_expanded': 0}
+        scenarios = 0
+        while scenarios < args.scenarios:
+            if environment == 'maze':
+                maze = MazeEnvironment(size, size, seed=rng.randrange(2 ** 32))
+                grid = braid(Grid.from_rows(maze.get_grid()), args.braid, rng)
+                start, goal = maze.entrance_position, maze.exit_position
+            else:
+                grid = random_grid(size, args.density, rng)
+                start, goal = (0, 0), (size - 1, size - 1)
+                grid.cells[grid.index_of(start)] = 0
+                grid.cells[grid.index_of(goal)] = 0
+                if astar(start, goal, grid, set(), size) is None:
+                    continue
+            for key, value in run_scenario(grid, start, goal, rng, args.changes, args.interval).items():
+                totals[key] += value
+            scenarios += 1
+        replans = max(1, totals['replans'])
+        speedup = totals['astar_time'] / totals['dstar_time'] if totals['dstar_time'] else 0.0
+        print(f"{environment:>5} {size:>6} {totals['replans']:>8} {totals['dstar_expanded'] / replans:>12.0f} "
+              f"{totals['astar_expanded'] / replans:>12.0f} {totals['dstar_time'] / replans * 1000:>8.2f}ms "
+              f"{totals['astar_time'] / replans * 1000:>8.2f}ms {speedup:>7.1f}x")
+        if totals['mismatches']:
+            print(f"warning: {totals['mismatches']} repaired paths differ in length from A*")
+
+
+if __name__ == "__main__":
+    main()
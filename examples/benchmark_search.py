@@ -0,0 +1,138 @@
+# examples/benchmark_search.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import heapq
+import time
+import tracemalloc
+from collections import deque
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.search_algorithms.uninformed_search import dfs, bfs, ucs
+from modules.search_algorithms.search_core import get_neighbors
+from modules.search_algorithms.informed_search import astar, heuristic
+
+
+# Reference implementations that carry a copy of the path in every frontier entry.
+# They are kept here only so the parent-pointer versions can be compared against them.
+
+def legacy_dfs(start, goal, grid, blocked_positions, grid_size):
+    stack = [(start, [start])]
+    visited = set()
+    while stack:
+        (vertex, path) = stack.pop()
+        if vertex not in visited:
+            if vertex in blocked_positions:
+                continue
+            visited.add(vertex)
+            if vertex == goal:
+                return path
+            for neighbor in get_neighbors(vertex, grid, blocked_positions, grid_size):
+                stack.append((neighbor, path + [neighbor]))
+    return None
+
+
+def legacy_bfs(start, goal, grid, blocked_positions, grid_size):
+    queue = deque([(start, [start])])
+    visited = set([start])
+    while queue:
+        (vertex, path) = queue.popleft()
+        if vertex == goal:
+            return path
+        for neighbor in get_neighbors(vertex, grid, blocked_positions, grid_size):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, path + [neighbor]))
+    return None
+
+
+def legacy_ucs(start, goal, grid, blocked_positions, grid_size):
+    queue = [(0, start, [start])]
+    visited = set()
+    while queue:
+        (cost, vertex, path) = heapq.heappop(queue)
+        if vertex not in visited:
+            if vertex in blocked_positions:
+                continue
+            visited.add(vertex)
+            if vertex == goal:
+                return path
+            for neighbor in get_neighbors(vertex, grid, blocked_positions, grid_size):
+                heapq.heappush(queue, (cost + 1, neighbor, path + [neighbor]))
+    return None
+
+
+def legacy_astar(start, goal, grid, blocked_positions, grid_size):
+    open_set = [(0, start, [start])]
+    g_scores = {start: 0}
+    while open_set:
+        (_, current, path) = heapq.heappop(open_set)
+        if current == goal:
+            return path
+        for neighbor in get_neighbors(current, grid, blocked_positions, grid_size):
+            tentative_g_score = g_scores[current] + 1
+            if neighbor not in g_scores or tentative_g_score < g_scores[neighbor]:
+                g_scores[neighbor] = tentative_g_score
+                heapq.heappush(open_set, (tentative_g_score + heuristic(neighbor, goal), neighbor,
+                                          path + [neighbor]))
+    return None
+
+
+ALGORITHMS = [
+    ('dfs', legacy_dfs, dfs),
+    ('bfs', legacy_bfs, bfs),
+    ('ucs', legacy_ucs, ucs),
+    ('astar', legacy_astar, astar),
+]
+
+
+def measure(function, start, goal, grid, grid_size):
+    """Returns (seconds, peak_bytes, path_length) for a single search call."""
+    started = time.perf_counter()
+    path = function(start, goal, grid, set(), grid_size)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    function(start, goal, grid, set(), grid_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(path) if path else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Path-copy vs parent-pointer search benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 200, 400],
+                        help='Grid sizes to benchmark (default: 100 200 400)')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=[name for name, _, _ in ALGORITHMS],
+                        choices=[name for name, _, _ in ALGORITHMS], help='Algorithms to benchmark')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'algorithm':>10} {'old time':>10} {'new time':>10} {'old peak':>11} "
+          f"{'new peak':>11} {'path':>7}")
+    for size in args.sizes:
+        env = GridEnvironment(size, num_tasks=1, seed=args.seed)
+        grid = env.get_grid()
+        start = env.get_start_position()
+        goal = (size - 1, size - 1)
+        grid[goal[1]][goal[0]] = 0
+        for name, legacy, current in ALGORITHMS:
+            if name not in args.algorithms:
+                continue
+            old_time, old_peak, old_length = measure(legacy, start, goal, grid, size)
+            new_time, new_peak, new_length = measure(current, start, goal, grid, size)
+            if old_length != new_length:
+                print(f"warning: {name} path length differs ({old_length} vs {new_length})")
+            print(f"{size:>6} {name:>10} {old_time:>9.3f}s {new_time:>9.3f}s {old_peak / 2 ** 20:>9.1f}MB "
+                  f"{new_peak / 2 ** 20:>9.1f}MB {new_length:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# examples/benchmark_terrain_search.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import argparse
+import heapq
+import random
+import time
+from array import array
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.search_algorithms import ucs, astar
+from modules.search_algorithms.search_core import new_parents, reconstruct_path, path_cost, UNREACHED
+
+
+# Reference implementations with a binary heap of (cost, cell) tuples, as ucs and astar
+# worked before the bucket queues. They take a Grid and honor its terrain costs.
+
+def heap_ucs(start, goal, grid):
+    costs = grid.costs
+    start_index, goal_index = grid.index_of(start), grid.index_of(goal)
+    parents = new_parents(len(grid.cells))
+    queue = [(0, start_index, start_index)]
+    while queue:
+        (cost, vertex, parent) = heapq.heappop(queue)
+        if parents[vertex] == -1:
+            parents[vertex] = parent
+            if vertex == goal_index:
+                return reconstruct_path(parents, goal_index, grid.width)
+            for neighbor in grid.neighbors(vertex):
+                if parents[neighbor] == -1:
+                    heapq.heappush(queue, (cost + (costs[neighbor] if costs is not None else 1), neighbor, vertex))
+    return None
+
+
+def heap_astar(start, goal, grid):
+    costs = grid.costs
+    width = grid.width
+    goal_x, goal_y = goal
+    start_index, goal_index = grid.index_of(start), grid.index_of(goal)
+    parents = new_parents(len(grid.cells))
+    parents[start_index] = start_index
+    g_scores = array('i', [UNREACHED]) * len(grid.cells)
+    g_scores[start_index] = 0
+    open_set = [(abs(start[0] - goal_x) + abs(start[1] - goal_y), start_index)]
+    while open_set:
+        (f_score, current) = heapq.heappop(open_set)
+        if current == goal_index:
+            return reconstruct_path(parents, goal_index, width)
+        if f_score > g_scores[current] + abs(current % width - goal_x) + abs(current // width - goal_y):
+            continue
+        for neighbor in grid.neighbors(current):
+            tentative_g_score = g_scores[current] + (costs[neighbor] if costs is not None else 1)
+            if tentative_g_score < g_scores[neighbor]:
+                g_scores[neighbor] = tentative_g_score
+                parents[neighbor] = current
+                f_score = tentative_g_score + abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)
+                heapq.heappush(open_set, (f_score, neighbor))
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bucket-queue ucs/astar vs binary-heap versions, with and without terrain')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 300],
+                        help='Grid sizes to benchmark (default: 100 300)')
+    parser.add_argument('--queries', type=int, default=10, help='Searches per grid (default: 10)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'size':>6} {'terrain':>8} {'algorithm':>10} {'heapq':>10} {'buckets':>10} {'speedup':>8} {'cost':>8}")
+    for size in args.sizes:
+        for terrain in (False, True):
+            grid = GridEnvironment(size, num_tasks=1, seed=args.seed, terrain=terrain).get_grid()
+            free_cells = [grid.position_of(index) for index in grid.reachable_from(0)]
+            queries = [(rng.choice(free_cells), rng.choice(free_cells)) for _ in range(args.queries)]
+            for name, reference, search in [('ucs', heap_ucs, ucs), ('astar', heap_astar, astar)]:
+                heap_time = bucket_time = 0.0
+                total_cost = 0
+                for start, goal in queries:
+                    started = time.perf_counter()
+                    expected = reference(start, goal, grid)
+                    heap_time += time.perf_counter() - started
+                    started = time.perf_counter()
+                    path = search(start, goal, grid, set(), size)
+                    bucket_time += time.perf_counter() - started
+                    if path_cost(grid, path) != path_cost(grid, expected):
+                        print(f"warning: {name} path cost {path_cost(grid, path)}, "
+                              f"expected {path_cost(grid, expected)}")
+                    total_cost += path_cost(grid, path)
+                print(f"{size:>6} {str(terrain):>8} {name:>10} {heap_time / len(queries) * 1000:>8.1f}ms "
+                      f"{bucket_time / len(queries) * 1000:>8.1f}ms {heap_time / bucket_time:>7.2f}x "
+                      f"{total_cost / len(queries):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
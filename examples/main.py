@@ -16,10 +16,13 @@ from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
 def main():
     parser = argparse.ArgumentParser(description='Robot Task Simulation (Task Order Based)')
     parser.add_argument('--algorithm', type=str, default='astar',
-                        choices=['dfs', 'bfs', 'ucs', 'astar'],
+                        choices=['dfs', 'bfs', 'ucs', 'astar', 'jps', 'bidirectional_astar', 'dstar_lite'],
                         help='Search algorithm to use (default: astar)')
     parser.add_argument('--grid_size', type=int, default=16, help='Size of the grid (default: 16)')
     parser.add_argument('--num_tasks', type=int, default=5, help='Number of tasks (default: 5)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the first environment (default: random)')
+    parser.add_argument('--terrain', action='store_true',
+                        help='Cover the floor with grass, sand and mud that cost more to cross')
     args = parser.parse_args()
 
     algorithm = args.algorithm
@@ -30,7 +33,8 @@ def main():
     screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
     pygame.display.set_caption("Robot Task Simulation (Task Order Based)")
 
-    sim = SearchSimulation(screen, algorithm=algorithm, grid_size=grid_size, num_tasks=num_tasks)
+    sim = SearchSimulation(screen, algorithm=algorithm, grid_size=grid_size, num_tasks=num_tasks, seed=args.seed,
+                           terrain=args.terrain)
     sim.run()
 
 if __name__ == "__main__":
@@ -52,7 +52,7 @@ def draw_info_panel(screen, font, generation, individual, max_generations):
     screen.blit(generation_surface, (WINDOW_SIZE + 10, 10))
 
     # Draw fitness score
-    fitness_score = local_search.fitness(individual)
+    fitness_score = local_search.fitness_cache(individual)
     fitness_text = f"Fitness: {fitness_score}/28"
     fitness_surface = font.render(fitness_text, True, WHITE)
     screen.blit(fitness_surface, (WINDOW_SIZE + 10, 40))
@@ -63,13 +63,77 @@ def draw_info_panel(screen, font, generation, individual, max_generations):
         queen_surface = font.render(queen_text, True, WHITE)
         screen.blit(queen_surface, (WINDOW_SIZE + 10, 70 + i * 30))
 
+def next_generation(population):
+    """Breeds a new population from the selected one."""
+    children = []
+    while len(children) < local_search.POPULATION_SIZE:
+        parent1 = random.choice(population)
+        parent2 = random.choice(population)
+        child = local_search.crossover(parent1, parent2)
+        local_search.mutate(child)
+        children.append(child)
+    return children
+
+def run_headless(args):
+    """Runs the GA at full speed without a window and prints summary statistics."""
+    solved = 0
+    total_generations = 0
+    total_time = 0.0
+    solve_times = []
+    for run in range(args.runs):
+        if args.seed is not None:
+            random.seed(args.seed + run)
+        local_search.fitness_cache.clear()
+        started = time.perf_counter()
+        population = [local_search.generate_individual() for _ in range(local_search.POPULATION_SIZE)]
+        solution = None
+        generation = 0
+        while generation < args.max_generations:
+            population = local_search.select_population(population)
+            if local_search.fitness_cache(population[0]) == 28:
+                solution = population[0]
+                break
+            population = next_generation(population)
+            generation += 1
+        elapsed = time.perf_counter() - started
+        total_generations += generation
+        total_time += elapsed
+        if solution is not None:
+            solved += 1
+            solve_times.append(elapsed)
+        cache = local_search.fitness_cache
+        print(f"Run {run + 1}: {'solved' if solution else 'not solved'} after {generation} generations "
+              f"in {elapsed:.3f}s ({generation / elapsed if elapsed else 0:.0f} generations/s, "
+              f"{cache.hit_rate:.1%} fitness cache hits){f' {solution}' if solution else ''}")
+
+    print(f"Solved {solved}/{args.runs} runs, {total_generations / total_time if total_time else 0:.0f} generations/s")
+    if solve_times:
+        print(f"Time to solution: mean {sum(solve_times) / len(solve_times):.3f}s, "
+              f"min {min(solve_times):.3f}s, max {max(solve_times):.3f}s")
+
 def main():
     # Add argument parsing
     parser = argparse.ArgumentParser(description='8-Queens Genetic Algorithm Simulation')
     parser.add_argument('--max_generations', type=int, default=1000, help='Maximum number of generations')
     parser.add_argument('--delay', type=float, default=0.1, help='Delay between generations in seconds')
+    parser.add_argument('--fast', action='store_true',
+                        help='Run the GA at full speed and only redraw at --fps (ignores --delay)')
+    parser.add_argument('--fps', type=float, default=30, help='Redraws per second in --fast mode (default: 30)')
+    parser.add_argument('--render_every', type=int, default=1, help='Redraw at most every K generations (default: 1)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Run without a window and print generations/s and time to solution')
+    parser.add_argument('--runs', type=int, default=1, help='Number of runs in --headless mode (default: 1)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (default: unseeded)')
     args = parser.parse_args()
+    if args.render_every < 1:
+        parser.error("--render_every must be at least 1")
+
+    if args.headless:
+        run_headless(args)
+        return
 
+    if args.seed is not None:
+        random.seed(args.seed)
     MAX_GENERATIONS = args.max_generations
     DELAY = args.delay
 
@@ -85,6 +149,8 @@ def main():
     generation = 0
     running = True
     solution_found = False
+    frame_interval = 1 / args.fps if args.fps > 0 else 0
+    last_frame = 0.0
 
     while running and generation < MAX_GENERATIONS:
         # Handle events to exit the simulation
@@ -97,34 +163,37 @@ def main():
 
         # Check for a solution
         best_individual = population[0]
-        if local_search.fitness(best_individual) == 28:
+        if local_search.fitness_cache(best_individual) == 28:
             print(f"Solution found in generation {generation}: {best_individual}")
             solution_found = True
             running = False  # Exit the loop when solution is found
 
         # Generate next generation
-        next_generation = []
-        while len(next_generation) < local_search.POPULATION_SIZE:
-            parent1 = random.choice(population)
-            parent2 = random.choice(population)
-            child = local_search.crossover(parent1, parent2)
-            local_search.mutate(child)
-            next_generation.append(child)
-
-        population = next_generation
+        population = next_generation(population)
         generation += 1
 
+        # Redraw only every render_every generations, and in fast mode at most fps times a second
+        if generation % args.render_every and running:
+            continue
+        if args.fast and running and time.perf_counter() - last_frame < frame_interval:
+            continue
+        last_frame = time.perf_counter()
+
         # Draw the best individual (visualize the board and info panel)
         screen.fill(WHITE)
         draw_board(screen, font, best_individual)
         draw_info_panel(screen, font, generation, best_individual, MAX_GENERATIONS)
         pygame.display.flip()
 
-        # Control animation speed
-        clock.tick(10)  # Set to 10 FPS
-        time.sleep(DELAY)  # Add a short delay (in seconds)
+        if not args.fast:
+            # Control animation speed
+            clock.tick(10)  # Set to 10 FPS
+            time.sleep(DELAY)  # Add a short delay (in seconds)
 
     # After the loop ends
+    cache = local_search.fitness_cache
+    print(f"Fitness lookups: {cache.lookups}, evaluations: {cache.misses} "
+          f"({cache.hit_rate:.1%} answered from the cache)")
     if solution_found:
         # Display the solution
         running = True
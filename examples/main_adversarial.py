@@ -0,0 +1,39 @@
+# examples/main_adversarial.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import pygame
+import argparse
+from modules.simulations.adversarial_simulation import AdversarialSimulation
+from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
+
+PLAYERS = ['human', 'mcts', 'alphabeta']
+
+def main():
+    parser = argparse.ArgumentParser(description='Connect Four or tic-tac-toe against MCTS and alpha-beta')
+    parser.add_argument('--game', type=str, default='connect4', choices=['connect4', 'tictactoe'],
+                        help='Game to play (default: connect4)')
+    parser.add_argument('--first', type=str, default='human', choices=PLAYERS,
+                        help='Player who moves first (default: human)')
+    parser.add_argument('--second', type=str, default='mcts', choices=PLAYERS,
+                        help='Player who moves second (default: mcts)')
+    parser.add_argument('--move_time', type=float, default=1.0, help='Seconds per engine move (default: 1)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the MCTS playouts (default: random)')
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
+    pygame.display.set_caption("Adversarial Search")
+
+    sim = AdversarialSimulation(screen, game=args.game, players=(args.first, args.second),
+                                move_time=args.move_time, seed=args.seed)
+    sim.run()
+
+if __name__ == "__main__":
+    main()
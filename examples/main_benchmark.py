@@ -0,0 +1,14 @@
+# examples/main_benchmark.py
+
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from modules.benchmarks.search_benchmark import main
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,7 @@ from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
 def main():
     parser = argparse.ArgumentParser(description='Maze Solver Simulation')
     parser.add_argument('--algorithm', type=str, default='dfs',
-                        choices=['dfs', 'bfs', 'ucs', 'astar'],
+                        choices=['dfs', 'bfs', 'ucs', 'astar', 'jps', 'bidirectional_astar', 'dstar_lite'],
                         help='Search algorithm to use (default: dfs)')
     parser.add_argument('--maze_width', type=int, default=21, help='Width of the maze (odd number, default: 21)')
     parser.add_argument('--maze_height', type=int, default=21, help='Height of the maze (odd number, default: 21)')
@@ -24,6 +24,10 @@ def main():
                         help='Maze complexity (0.0 to 1.0, default: 0.75)')
     parser.add_argument('--density', type=float, default=0.75,
                         help='Maze density (0.0 to 1.0, default: 0.75)')
+    parser.add_argument('--maze_algorithm', type=str, default='backtracker',
+                        choices=['backtracker', 'kruskal', 'eller'],
+                        help='Maze generation algorithm (default: backtracker)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the first maze (default: random)')
     args = parser.parse_args()
 
     algorithm = args.algorithm
@@ -41,7 +45,8 @@ def main():
     pygame.display.set_caption("Maze Solver Simulation")
 
     sim = MazeSimulation(screen, algorithm=algorithm, maze_width=maze_width, maze_height=maze_height,
-                         complexity=args.complexity, density=args.density)
+                         complexity=args.complexity, density=args.density,
+                         maze_algorithm=args.maze_algorithm, seed=args.seed)
     sim.run()
 
 if __name__ == "__main__":
@@ -16,10 +16,17 @@ from modules.utils.constants import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT
 def main():
     parser = argparse.ArgumentParser(description='Robot Task Simulation (Nearest Task First)')
     parser.add_argument('--algorithm', type=str, default='astar',
-                        choices=['dfs', 'bfs', 'ucs', 'astar'],
+                        choices=['dfs', 'bfs', 'ucs', 'astar', 'jps', 'bidirectional_astar', 'dstar_lite'],
                         help='Search algorithm to use (default: astar)')
     parser.add_argument('--grid_size', type=int, default=16, help='Size of the grid (default: 16)')
     parser.add_argument('--num_tasks', type=int, default=5, help='Number of tasks (default: 5)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the first environment (default: random)')
+    parser.add_argument('--terrain', action='store_true',
+                        help='Cover the floor with grass, sand and mud that cost more to cross')
+    parser.add_argument('--tour', action='store_true',
+                        help='Visit tasks along a planned shortest tour instead of nearest first')
+    parser.add_argument('--tour_time_budget', type=float, default=1.0,
+                        help='Seconds allowed for improving large tours (default: 1.0)')
     args = parser.parse_args()
 
     algorithm = args.algorithm
@@ -28,9 +35,14 @@ def main():
 
     pygame.init()
     screen = pygame.display.set_mode((DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT), pygame.RESIZABLE)
-    pygame.display.set_caption("Robot Task Simulation (Nearest Task First)")
-
-    sim = SearchSimulation(screen, algorithm=algorithm, grid_size=grid_size, num_tasks=num_tasks, nearest_task=True)
+    if args.tour:
+        pygame.display.set_caption("Robot Task Simulation (Planned Tour)")
+    else:
+        pygame.display.set_caption("Robot Task Simulation (Nearest Task First)")
+
+    sim = SearchSimulation(screen, algorithm=algorithm, grid_size=grid_size, num_tasks=num_tasks,
+                           nearest_task=not args.tour, tour=args.tour, tour_time_budget=args.tour_time_budget,
+                           seed=args.seed, terrain=args.terrain)
     sim.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+# modules/adversarial_search/__init__.py
+
+from .games import Game, TicTacToe, ConnectFour, zobrist_keys
+from .minimax import minimax, AlphaBeta, SearchResult, effective_branching_factor
+from .parallel_search import ParallelAlphaBeta
+
+__all__ = ['Game', 'TicTacToe', 'ConnectFour', 'zobrist_keys',
+           'minimax', 'AlphaBeta', 'SearchResult', 'effective_branching_factor', 'ParallelAlphaBeta']
@@ -0,0 +1,245 @@
+# modules/adversarial_search/games.py
+
+import random
+
+# Two-player, zero-sum games with perfect information, in the form the engines in
+# minimax.py search them. A game object holds one position and is changed in
+# place: play(move) and undo(move) step forward and back, so a search walks the
+# tree without copying boards. Players are 0 and 1 and moves are small integers
+# (a cell or a column) below move_count. Both boards are bitboards: one int per
+# player with a bit per cell.
+
+# Connect Four board size; each column takes ROWS + 1 bits of a bitboard
+COLUMNS = 7
+ROWS = 6
+# Bonus per empty cell that would complete a line for a player, in ConnectFour.evaluate()
+THREAT_WEIGHT = 16
+
+
+def zobrist_keys(count, seed=0):
+    """Returns count random 64-bit integers; a position's key is the XOR of the keys of its (cell, player) pieces."""
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(count)]
+
+
+class Game:
+    """Interface of the games searched by minimax.py.
+
+    key is a Zobrist hash of the position, kept up to date by play() and undo().
+    evaluate() scores a position from the point of view of the player to move
+    and is only called on positions that are not over.
+    """
+
+    move_count = 0  # Moves are integers in range(move_count)
+
+    def __init__(self):
+        self.player = 0  # Player to move
+        self.key = 0
+
+    def legal_moves(self):
+        raise NotImplementedError
+
+    def play(self, move):
+        raise NotImplementedError
+
+    def undo(self, move):
+        raise NotImplementedError
+
+    def winner(self):
+        """Returns the player who has won, or None."""
+        raise NotImplementedError
+
+    def is_over(self):
+        return self.winner() is not None or not self.legal_moves()
+
+    def evaluate(self):
+        return 0
+
+    def copy(self):
+        raise NotImplementedError
+
+
+class TicTacToe(Game):
+    """Tic-tac-toe on cells 0-8, numbered row by row."""
+
+    move_count = 9
+    LINES = [sum(1 << cell for cell in line) for line in
+             [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]]
+    KEYS = zobrist_keys(9 * 2, seed=9)
+
+    def __init__(self):
+        super().__init__()
+        self.masks = [0, 0]  # Cells taken by each player
+
+    def legal_moves(self):
+        if self.winner() is not None:
+            return []
+        taken = self.masks[0] | self.masks[1]
+        return [cell for cell in range(9) if not taken >> cell & 1]
+
+    def play(self, move):
+        self.masks[self.player] |= 1 << move
+        self.key ^= self.KEYS[move * 2 + self.player]
+        self.player ^= 1
+
+    def undo(self, move):
+        self.player ^= 1
+        self.masks[self.player] &= ~(1 << move)
+        self.key ^= self.KEYS[move * 2 + self.player]
+
+    def winner(self):
+        # Only the player who just moved can have completed a line
+        last = self.player ^ 1
+        mask = self.masks[last]
+        for line in self.LINES:
+            if mask & line == line:
+                return last
+        return None
+
+    def evaluate(self):
+        """Lines still open to the player to move minus lines still open to the opponent."""
+        own, other = self.masks[self.player], self.masks[self.player ^ 1]
+        return sum((not line & other) - (not line & own) for line in self.LINES)
+
+    def copy(self):
+        game = TicTacToe()
+        game.masks = self.masks[:]
+        game.player = self.player
+        game.key = self.key
+        return game
+
+    def __str__(self):
+        symbols = []
+        for cell in range(9):
+            symbols.append('X' if self.masks[0] >> cell & 1 else 'O' if self.masks[1] >> cell & 1 else '.')
+        return '\n'.join(' '.join(symbols[row * 3:row * 3 + 3]) for row in range(3))
+
+
+class ConnectFour(Game):
+    """Connect Four on a 7 x 6 board; a move is the column (0-6) a piece is dropped into.
+
+    Cell (column, row) is bit column * 7 + row, counting rows from the bottom; the
+    seventh bit of every column stays empty so that lines cannot wrap between columns.
+    """
+
+    WIDTH = COLUMNS
+    HEIGHT = ROWS
+    move_count = COLUMNS
+    KEYS = zobrist_keys(COLUMNS * (ROWS + 1) * 2, seed=7)
+    BOTTOM = sum(1 << column * (ROWS + 1) for column in range(COLUMNS))
+    BOARD = BOTTOM * ((1 << ROWS) - 1)  # Every playable cell
+    COLUMN_ORDER = (3, 2, 4, 1, 5, 0, 6)  # Center columns first, as they take part in the most lines
+
+    def __init__(self):
+        super().__init__()
+        self.masks = [0, 0]
+        self.heights = [column * (self.HEIGHT + 1) for column in range(self.WIDTH)]  # Bit of the next free cell
+
+    def legal_moves(self):
+        if self.winner() is not None:
+            return []
+        top = self.HEIGHT
+        heights = self.heights
+        return [column for column in self.COLUMN_ORDER if heights[column] - column * (top + 1) < top]
+
+    def play(self, move):
+        bit = self.heights[move]
+        self.masks[self.player] |= 1 << bit
+        self.key ^= self.KEYS[bit * 2 + self.player]
+        self.heights[move] = bit + 1
+        self.player ^= 1
+
+    def undo(self, move):
+        self.player ^= 1
+        bit = self.heights[move] - 1
+        self.heights[move] = bit
+        self.masks[self.player] &= ~(1 << bit)
+        self.key ^= self.KEYS[bit * 2 + self.player]
+
+    def winner(self):
+        last = self.player ^ 1
+        return last if has_four(self.masks[last], self.HEIGHT + 1) else None
+
+    def evaluate(self):
+        """Central pieces and cells that would complete a line, the player to move's minus the opponent's.
+
+        Each piece scores the number of lines of four through its cell, summed
+        with one popcount per distinct count (POSITION_LAYERS).
+        """
+        own, other = self.masks[self.player], self.masks[self.player ^ 1]
+        empty = self.BOARD & ~(own | other)
+        score = 0
+        for mask, weight in POSITION_LAYERS:
+            score += weight * ((own & mask).bit_count() - (other & mask).bit_count())
+        threats = (winning_cells(own, self.HEIGHT + 1) & empty).bit_count()
+        threats -= (winning_cells(other, self.HEIGHT + 1) & empty).bit_count()
+        return score + THREAT_WEIGHT * threats
+
+    def copy(self):
+        game = ConnectFour()
+        game.masks = self.masks[:]
+        game.heights = self.heights[:]
+        game.player = self.player
+        game.key = self.key
+        return game
+
+    def __str__(self):
+        rows = []
+        for row in range(self.HEIGHT - 1, -1, -1):
+            symbols = []
+            for column in range(self.WIDTH):
+                bit = 1 << column * (self.HEIGHT + 1) + row
+                symbols.append('X' if self.masks[0] & bit else 'O' if self.masks[1] & bit else '.')
+            rows.append(' '.join(symbols))
+        return '\n'.join(rows)
+
+
+def has_four(mask, stride):
+    """True if a bitboard with columns of stride bits has four in a row in any direction."""
+    # Vertical (1), horizontal (stride), and the two diagonals (stride - 1, stride + 1)
+    for shift in (1, stride, stride - 1, stride + 1):
+        pairs = mask & mask >> shift
+        if pairs & pairs >> 2 * shift:
+            return True
+    return False
+
+
+def winning_cells(mask, stride):
+    """Returns the bitboard of cells that would complete four in a row for a player's pieces."""
+    # Vertical: three stacked pieces win on the cell above
+    cells = (mask << 1) & (mask << 2) & (mask << 3)
+    for shift in (stride, stride - 1, stride + 1):
+        pairs = (mask << shift) & (mask << 2 * shift)
+        cells |= pairs & (mask << 3 * shift)  # Three to one side
+        cells |= pairs & (mask >> shift)  # Two to one side, one to the other
+        pairs = (mask >> shift) & (mask >> 2 * shift)
+        cells |= pairs & (mask >> 3 * shift)
+        cells |= pairs & (mask << shift)
+    return cells
+
+
+def _position_layers():
+    """Splits ConnectFour's lines-through-each-cell table into (mask, weight) layers for evaluate()."""
+    width, height = ConnectFour.WIDTH, ConnectFour.HEIGHT
+    counts = {}
+    for column in range(width):
+        for row in range(height):
+            count = 0
+            for dx, dy in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                # Lines of four through the cell along (dx, dy), by how far back they start
+                for back in range(4):
+                    x0, y0 = column - back * dx, row - back * dy
+                    x3, y3 = x0 + 3 * dx, y0 + 3 * dy
+                    if 0 <= x0 < width and 0 <= x3 < width and 0 <= min(y0, y3) and max(y0, y3) < height:
+                        count += 1
+            counts[column * (height + 1) + row] = count
+    layers = []
+    previous = 0
+    for threshold in sorted(set(counts.values())):
+        mask = sum(1 << bit for bit, count in counts.items() if count >= threshold)
+        layers.append((mask, threshold - previous))
+        previous = threshold
+    return layers
+
+
+POSITION_LAYERS = _position_layers()
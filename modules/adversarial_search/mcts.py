@@ -0,0 +1,252 @@
+# modules/adversarial_search/mcts.py
+
+import math
+import time
+from array import array
+
+import numpy as np
+
+from .games import ConnectFour
+
+# Monte Carlo Tree Search (UCT) over the Game interface of games.py. The tree
+# lives in preallocated parallel arrays indexed by node number instead of one
+# Python object per node, and the children of a node take a contiguous block of
+# numbers. Every leaf is scored with a batch of random playouts at once; on
+# Connect Four the whole batch is played with numpy array operations.
+
+TREE_CAPACITY = 1 << 18  # Nodes preallocated per search
+EXPLORATION = 1.4  # UCT exploration constant, about sqrt(2)
+PLAYOUT_BATCH = 64  # Random playouts per leaf
+NUMPY_BATCH_MIN = 8  # Smaller batches are played one by one, as numpy's per-call overhead outweighs the gain
+DRAW = -1  # Playout result when nobody wins
+
+
+class MCTSResult:
+    """The move an MCTS search chose, with the work it took."""
+
+    def __init__(self, move, visits, win_rate, playouts, nodes, elapsed, bytes_per_node):
+        self.move = move  # None if the game is already over
+        self.visits = visits  # Playouts through the chosen move
+        self.win_rate = win_rate  # Share of those playouts won by the player to move (draws count half)
+        self.playouts = playouts
+        self.nodes = nodes  # Tree nodes in use
+        self.elapsed = elapsed  # Seconds
+        self.bytes_per_node = bytes_per_node  # Memory of one node across the tree arrays
+
+    @property
+    def playouts_per_second(self):
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self):
+        return (f"MCTSResult(move={self.move}, win_rate={self.win_rate:.3f}, playouts={self.playouts}, "
+                f"nodes={self.nodes}, playouts_per_second={self.playouts_per_second:.0f})")
+
+
+class MCTS:
+    """UCT search with an array-backed tree and batched random playouts.
+
+    Each iteration walks down the tree by UCB1 (unvisited children first),
+    expands the leaf it reaches, plays batch_size random games from one of the
+    new children and adds all of their results on the way back up. Once the
+    tree has used up its capacity, leaves are no longer expanded.
+    """
+
+    def __init__(self, exploration=EXPLORATION, batch_size=PLAYOUT_BATCH, capacity=TREE_CAPACITY, seed=None):
+        self.exploration = exploration
+        self.batch_size = batch_size
+        self.capacity = capacity
+        self.rng = np.random.default_rng(seed)
+        self.parents = array('i', [-1]) * capacity
+        self.moves = array('i', [-1]) * capacity  # Move that leads from the parent to the node
+        self.first_child = array('i', [-1]) * capacity  # -1 until the node is expanded
+        self.child_count = array('i', [0]) * capacity
+        self.visits = array('i', [0]) * capacity
+        self.wins = array('d', [0.0]) * capacity  # For the player who made the node's move; draws count half
+        self.size = 0
+
+    @property
+    def bytes_per_node(self):
+        return sum(values.itemsize for values in
+                   (self.parents, self.moves, self.first_child, self.child_count, self.visits, self.wins))
+
+    def best_move(self, game, time_limit=1.0):
+        return self.search(game, time_limit).move
+
+    def search(self, game, time_limit=1.0, iterations=None):
+        """Searches from game's position for time_limit seconds (or a number of iterations) and returns an MCTSResult.
+
+        The chosen move is the root child with the most visits. At least one
+        iteration runs, so the root is always expanded, however short the time
+        limit. game is not changed.
+        """
+        started = time.perf_counter()
+        deadline = started + time_limit if time_limit is not None else None
+        self._reset()
+        moves = game.legal_moves()
+        if not moves:
+            return MCTSResult(None, 0, 0.0, 0, 1, time.perf_counter() - started, self.bytes_per_node)
+        if self.capacity < 1 + len(moves):
+            raise ValueError(f"A tree capacity of {self.capacity} cannot hold the root and its {len(moves)} moves")
+        game = game.copy()
+        playouts = self._iterate(game)
+        iteration = 1
+        while (iterations is None or iteration < iterations) and (deadline is None or time.perf_counter() < deadline):
+            playouts += self._iterate(game)
+            iteration += 1
+
+        first, count = self.first_child[0], self.child_count[0]
+        if not count:
+            return MCTSResult(moves[0], 0, 0.0, playouts, self.size, time.perf_counter() - started,
+                              self.bytes_per_node)
+        best = max(range(first, first + count), key=self.visits.__getitem__)
+        visits = self.visits[best]
+        win_rate = self.wins[best] / visits if visits else 0.0
+        return MCTSResult(self.moves[best], visits, win_rate, playouts, self.size, time.perf_counter() - started,
+                          self.bytes_per_node)
+
+    def _reset(self):
+        # Only the root needs clearing; the other slots are overwritten as they are handed out
+        self.parents[0] = -1
+        self.first_child[0] = -1
+        self.child_count[0] = 0
+        self.visits[0] = 0
+        self.wins[0] = 0.0
+        self.size = 1
+
+    def _iterate(self, game):
+        """One selection, expansion, playout batch and backup; returns the number of playouts."""
+        first_child, child_count, visits, wins = self.first_child, self.child_count, self.visits, self.wins
+        node = 0
+        path = [0]
+        movers = [-1]  # movers[i] made the move into path[i]
+        played = []
+        while first_child[node] != -1:
+            node = self._select(node)
+            movers.append(game.player)
+            game.play(self.moves[node])
+            played.append(self.moves[node])
+            path.append(node)
+
+        moves = game.legal_moves()
+        if moves and self.size + len(moves) <= self.capacity:
+            first = self.size
+            for offset, move in enumerate(moves):
+                child = first + offset
+                self.parents[child] = node
+                self.moves[child] = move
+                first_child[child] = -1
+                child_count[child] = 0
+                visits[child] = 0
+                wins[child] = 0.0
+            first_child[node] = first
+            child_count[node] = len(moves)
+            self.size += len(moves)
+            node = first + int(self.rng.integers(len(moves)))
+            movers.append(game.player)
+            game.play(self.moves[node])
+            played.append(self.moves[node])
+            path.append(node)
+
+        results = playouts(game, self.batch_size, self.rng)
+        count = len(results)
+        won = [int(np.count_nonzero(results == 0)), int(np.count_nonzero(results == 1))]
+        half_draws = 0.5 * (count - won[0] - won[1])
+        for node, mover in zip(path, movers):
+            visits[node] += count
+            if mover != -1:
+                wins[node] += won[mover] + half_draws
+        for move in reversed(played):
+            game.undo(move)
+        return count
+
+    def _select(self, node):
+        """Returns the child of node with the highest UCB1 score, taking an unvisited child first."""
+        first = self.first_child[node]
+        visits, wins = self.visits, self.wins
+        log_visits = math.log(visits[node])
+        exploration = self.exploration
+        best, best_score = first, -1.0
+        for child in range(first, first + self.child_count[node]):
+            child_visits = visits[child]
+            if child_visits == 0:
+                return child
+            score = wins[child] / child_visits + exploration * math.sqrt(log_visits / child_visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+
+def playouts(game, count, rng):
+    """Plays count random games from game's position and returns an array of winners (0, 1 or DRAW).
+
+    Connect Four is played in one batch with numpy (from NUMPY_BATCH_MIN
+    playouts); other games one by one. A game that is already over gives count
+    copies of its result.
+    """
+    winner = game.winner()
+    if winner is not None:
+        return np.full(count, winner, dtype=np.int8)
+    if isinstance(game, ConnectFour) and count >= NUMPY_BATCH_MIN:
+        return connect_four_playouts(game, count, rng)
+    results = np.empty(count, dtype=np.int8)
+    for number in range(count):
+        results[number] = random_playout(game.copy(), rng)
+    return results
+
+
+def random_playout(game, rng):
+    """Plays random moves until the game ends and returns the winner or DRAW."""
+    while True:
+        moves = game.legal_moves()
+        if not moves:
+            winner = game.winner()
+            return winner if winner is not None else DRAW
+        game.play(moves[int(rng.integers(len(moves)))])
+
+
+def connect_four_playouts(game, count, rng):
+    """Random Connect Four playouts, count boards at a time, as uint64 bitboards in numpy arrays.
+
+    All boards have the same player to move, so each round drops one piece into
+    a random open column of every unfinished board and checks those boards for four
+    in a row.
+    """
+    stride = ConnectFour.HEIGHT + 1
+    masks = np.empty((2, count), dtype=np.uint64)
+    masks[0] = game.masks[0]
+    masks[1] = game.masks[1]
+    heights = np.tile(np.array(game.heights, dtype=np.int64), (count, 1))
+    tops = np.arange(ConnectFour.WIDTH, dtype=np.int64) * stride + ConnectFour.HEIGHT
+    results = np.full(count, DRAW, dtype=np.int8)
+    active = np.arange(count)
+    player = game.player
+    one = np.uint64(1)
+    while len(active):
+        open_columns = heights[active] < tops
+        open_counts = open_columns.sum(axis=1)
+        active = active[open_counts > 0]  # Full boards are draws
+        if not len(active):
+            break
+        open_columns = open_columns[open_counts > 0]
+        open_counts = open_counts[open_counts > 0]
+        # The k-th open column, k drawn below the number of open columns
+        choice = (rng.random(len(active)) * open_counts).astype(np.int64)
+        columns = np.argmax(open_columns.cumsum(axis=1) > choice[:, None], axis=1)
+        bits = heights[active, columns]
+        heights[active, columns] = bits + 1
+        boards = masks[player, active] | (one << bits.astype(np.uint64))
+        masks[player, active] = boards
+        won = _has_four(boards, stride)
+        results[active[won]] = player
+        active = active[~won]
+        player ^= 1
+    return results
+
+
+def _has_four(boards, stride):
+    """has_four() over an array of bitboards."""
+    won = np.zeros(len(boards), dtype=bool)
+    for shift in (1, stride, stride - 1, stride + 1):
+        pairs = boards & (boards >> np.uint64(shift))
+        won |= (pairs & (pairs >> np.uint64(2 * shift))) != 0
+    return won
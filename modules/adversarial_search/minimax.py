@@ -0,0 +1,321 @@
+# modules/adversarial_search/minimax.py
+
+import time
+
+# Game-tree search over the Game interface of games.py. Scores are negamax
+# scores, always from the point of view of the player to move: a position is
+# worth minus the best of its children. A won game scores WIN_SCORE minus the
+# number of plies to the win, so quicker wins (and slower losses) are preferred.
+
+WIN_SCORE = 1000000
+MATE_THRESHOLD = WIN_SCORE - 1000  # Scores beyond this are forced wins or losses
+TABLE_SIZE = 1 << 20  # Transposition table slots
+TIME_CHECK_INTERVAL = 1024  # Nodes searched between two looks at the clock
+
+# Transposition table bounds: the stored score is exact, or only a lower or upper bound
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+
+class SearchResult:
+    """The move a search chose, with the work it took."""
+
+    def __init__(self, move, score, depth, nodes, elapsed, iteration_nodes=None, table_hits=0, cutoffs=0):
+        self.move = move  # None if the game is already over
+        self.score = score  # Negamax score for the player to move
+        self.depth = depth  # Deepest completed iteration, in plies
+        self.nodes = nodes  # Positions visited over all iterations
+        self.elapsed = elapsed  # Seconds
+        self.iteration_nodes = iteration_nodes or [nodes]  # Positions visited by each completed iteration
+        self.table_hits = table_hits  # Transposition table entries that ended the search of a position
+        self.cutoffs = cutoffs  # Beta cutoffs
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def effective_branching_factor(self):
+        """The branching factor of a uniform tree as deep as the last iteration with as many nodes."""
+        return effective_branching_factor(self.iteration_nodes[-1], self.depth)
+
+    def __repr__(self):
+        return (f"SearchResult(move={self.move}, score={self.score}, depth={self.depth}, nodes={self.nodes}, "
+                f"nodes_per_second={self.nodes_per_second:.0f}, "
+                f"effective_branching_factor={self.effective_branching_factor:.2f})")
+
+
+def effective_branching_factor(nodes, depth):
+    """Solves nodes = 1 + b + b^2 + ... + b^depth for b by bisection."""
+    if depth <= 0 or nodes <= 1:
+        return 0.0
+    low, high = 0.0, float(nodes)
+    for _ in range(100):
+        middle = (low + high) / 2
+        total, power = 1.0, 1.0
+        for _ in range(depth):
+            power *= middle
+            total += power
+        if total < nodes:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def minimax(game, depth=None):
+    """Plain negamax without pruning or caching, the baseline for AlphaBeta.
+
+    Searches depth plies (default: to the end of the game) and returns a
+    SearchResult for the player to move; its depth is the deepest ply reached.
+    """
+    started = time.perf_counter()
+    counter = [1, 0]  # Positions visited, deepest ply
+    best_move = None
+    best_score = -WIN_SCORE - 1
+    for move in game.legal_moves():
+        game.play(move)
+        score = -_minimax(game, depth - 1 if depth is not None else None, 1, counter)
+        game.undo(move)
+        if score > best_score:
+            best_move, best_score = move, score
+    if best_move is None:
+        best_score = _terminal_score(game, 0)
+    return SearchResult(best_move, best_score, counter[1], counter[0], time.perf_counter() - started)
+
+
+def _minimax(game, depth, ply, counter):
+    counter[0] += 1
+    if ply > counter[1]:
+        counter[1] = ply
+    moves = game.legal_moves()
+    if not moves:
+        return _terminal_score(game, ply)
+    if depth is not None and depth <= 0:
+        return game.evaluate()
+    best = -WIN_SCORE - 1
+    for move in moves:
+        game.play(move)
+        score = -_minimax(game, depth - 1 if depth is not None else None, ply + 1, counter)
+        game.undo(move)
+        if score > best:
+            best = score
+    return best
+
+
+def _terminal_score(game, ply):
+    """Score of a finished game for the player to move: a loss if the opponent has won, otherwise a draw."""
+    return -(WIN_SCORE - ply) if game.winner() is not None else 0
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+class AlphaBeta:
+    """Negamax with alpha-beta pruning, iterative deepening and a per-move time budget.
+
+    Moves are tried in the order: the best move stored in the transposition
+    table, then the two killer moves of the ply (quiet moves that caused a cutoff
+    at the same depth elsewhere in the tree), then by history score (how much
+    cutoff work each move has done so far). The transposition table is a fixed
+    array of table_size slots indexed by the Zobrist key, always replaced by the
+    newest entry. Each of the enhancements can be switched off to measure what
+    it saves. The table and history persist across searches; call clear() to
+    forget them.
+    """
+
+    def __init__(self, transposition_table=True, killer_moves=True, history_heuristic=True, table_size=TABLE_SIZE):
+        self.use_table = transposition_table
+        self.use_killers = killer_moves
+        self.use_history = history_heuristic
+        self.table_size = table_size
+        self.clear()
+
+    def clear(self):
+        self.table = [None] * self.table_size if self.use_table else None
+        self.history = None  # [player][move] cutoff scores, sized for the first game searched
+        self.killers = []  # [ply] = [first killer, second killer]
+
+    def best_move(self, game, time_limit=1.0):
+        return self.search(game, time_limit).move
+
+    def search(self, game, time_limit=1.0, max_depth=None):
+        """Iterative deepening: searches depth 1, 2, ... until time_limit seconds have passed.
+
+        The iteration running when time is up is abandoned and the best move of
+        the last completed one is returned. Stops early at max_depth plies, when
+        a forced win or loss has been found, or when a search reached the end of
+        every line. With time_limit=None only max_depth limits the search.
+        """
+        started = time.perf_counter()
+        self._start(game, time_limit)
+        moves = game.legal_moves()
+        if not moves:
+            return SearchResult(None, _terminal_score(game, 0), 0, 1, time.perf_counter() - started)
+
+        best_move, best_score, completed = moves[0], 0, 0
+        iteration_nodes = []
+        depth = 0
+        while max_depth is None or depth < max_depth:
+            depth += 1
+            self.horizon_reached = False
+            nodes_before = self.nodes
+            try:
+                score, move = self._search_root(game, moves, depth)
+            except _SearchTimeout:
+                break
+            best_move, best_score, completed = move, score, depth
+            iteration_nodes.append(self.nodes - nodes_before)
+            # Search the best move first in the next iteration
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) > MATE_THRESHOLD or not self.horizon_reached:
+                break
+        return SearchResult(best_move, best_score, completed, self.nodes, time.perf_counter() - started,
+                            iteration_nodes, self.table_hits, self.cutoffs)
+
+    def value(self, game, depth, alpha=-WIN_SCORE - 1, beta=WIN_SCORE + 1, ply=0, time_limit=None):
+        """Searches one position depth plies deep, without iterative deepening, and returns its score.
+
+        A score at or below alpha, or at or above beta, is only a bound. ply is
+        the position's distance from the root, which win scores count from.
+        Returns None if time_limit seconds pass first. The work done is left in
+        nodes, table_hits, cutoffs and horizon_reached.
+        """
+        self._start(game, time_limit)
+        self.horizon_reached = False
+        try:
+            return self._negamax(game, depth, alpha, beta, ply)
+        except _SearchTimeout:
+            return None
+
+    def _start(self, game, time_limit):
+        self.deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        if self.history is None:
+            self.history = [[0] * game.move_count for _ in range(2)]
+        self.nodes = 0
+        self.table_hits = 0
+        self.cutoffs = 0
+
+    def _search_root(self, game, moves, depth):
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_move = moves[0]
+        self.nodes += 1
+        for move in moves:
+            game.play(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, 1)
+            finally:
+                game.undo(move)
+            if score > alpha:
+                alpha, best_move = score, move
+        if self.use_table:
+            self.table[game.key % self.table_size] = (game.key, depth, alpha, EXACT, best_move, self.horizon_reached)
+        return alpha, best_move
+
+    def _negamax(self, game, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % TIME_CHECK_INTERVAL == 0 and time.perf_counter() > self.deadline:
+            raise _SearchTimeout()
+        moves = game.legal_moves()
+        if not moves:
+            return _terminal_score(game, ply)
+        if depth <= 0:
+            self.horizon_reached = True
+            return game.evaluate()
+
+        original_alpha = alpha
+        table_move = None
+        if self.use_table:
+            key = game.key
+            slot = key % self.table_size
+            entry = self.table[slot]
+            if entry is not None and entry[0] == key:
+                _, entry_depth, score, bound, table_move, horizon_reached = entry
+                if entry_depth >= depth:
+                    score = _score_from_table(score, ply)
+                    if bound == EXACT or (bound == LOWER_BOUND and score >= beta) or (
+                            bound == UPPER_BOUND and score <= alpha):
+                        self.table_hits += 1
+                        self.horizon_reached = self.horizon_reached or horizon_reached
+                        return score
+        # Whether this subtree stops anywhere at the depth limit rather than at the end of the game
+        outer_horizon_reached = self.horizon_reached
+        self.horizon_reached = False
+
+        if len(moves) > 1:
+            self._order_moves(moves, game.player, ply, table_move)
+
+        best_score = -WIN_SCORE - 1
+        best_move = moves[0]
+        for move in moves:
+            game.play(move)
+            try:
+                score = -self._negamax(game, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                game.undo(move)
+            if score > best_score:
+                best_score, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.cutoffs += 1
+                        self._record_cutoff(move, game.player, depth, ply)
+                        break
+
+        if self.use_table:
+            if best_score <= original_alpha:
+                bound = UPPER_BOUND
+            elif best_score >= beta:
+                bound = LOWER_BOUND
+            else:
+                bound = EXACT
+            self.table[slot] = (key, depth, _score_to_table(best_score, ply), bound, best_move, self.horizon_reached)
+        self.horizon_reached = self.horizon_reached or outer_horizon_reached
+        return best_score
+
+    def _order_moves(self, moves, player, ply, table_move):
+        killers = self.killers[ply] if self.use_killers and ply < len(self.killers) else ()
+        history = self.history[player] if self.use_history else None
+        if not killers and history is None:
+            if table_move is not None and table_move in moves:
+                moves.remove(table_move)
+                moves.insert(0, table_move)
+            return
+        top = WIN_SCORE * WIN_SCORE
+
+        def priority(move):
+            if move == table_move:
+                return top + 2
+            if move in killers:
+                return top + (1 if move == killers[0] else 0)
+            return history[move] if history is not None else 0
+        moves.sort(key=priority, reverse=True)
+
+    def _record_cutoff(self, move, player, depth, ply):
+        if self.use_killers:
+            while len(self.killers) <= ply:
+                self.killers.append([None, None])
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        if self.use_history:
+            self.history[player][move] += depth * depth
+
+
+def _score_to_table(score, ply):
+    # Win and loss scores count plies from the root; the table stores them counted from the position itself
+    if score > MATE_THRESHOLD:
+        return score + ply
+    if score < -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    if score > MATE_THRESHOLD:
+        return score - ply
+    if score < -MATE_THRESHOLD:
+        return score + ply
+    return score
@@ -0,0 +1,157 @@
+# modules/adversarial_search/parallel_search.py
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .minimax import AlphaBeta, SearchResult, WIN_SCORE, MATE_THRESHOLD
+
+
+class ParallelAlphaBeta:
+    """AlphaBeta with the root moves of every iteration split across a process pool.
+
+    Each iteration first searches the leading root move (the previous
+    iteration's best) on its own. Its score then becomes alpha for all the
+    other root moves, which are searched at the same time with that window
+    (the "young brothers wait" rule). A move that beats alpha comes back with
+    its exact score, and ties go to the move listed first. So the move chosen
+    at a given depth is the one the sequential AlphaBeta would choose.
+
+    Every worker process keeps its own AlphaBeta for as long as the pool
+    lives. Its transposition table and history are cleared when a new search
+    starts, so results never depend on earlier searches and match those of
+    a fresh AlphaBeta. Use the engine as a context manager or call close() to
+    shut the pool down. workers=1 searches in the calling process.
+    """
+
+    def __init__(self, workers=None, **engine_options):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.engine_options = engine_options
+        self.local_engine = AlphaBeta(**engine_options) if workers <= 1 else None
+        self.search_number = 0  # Tells the workers when a new search starts
+        self.executor = None
+        if workers > 1:
+            self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                initargs=(engine_options,))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def best_move(self, game, time_limit=1.0):
+        return self.search(game, time_limit).move
+
+    def search(self, game, time_limit=1.0, max_depth=None):
+        """Iterative deepening like AlphaBeta.search, with each iteration's root moves searched in parallel.
+
+        nodes, table_hits and cutoffs of the result are summed over all workers.
+        """
+        started = time.perf_counter()
+        # Tasks carry the deadline on the wall clock, which every process shares, so a task that
+        # waits in the pool's queue only gets the time left when it starts
+        deadline = time.time() + time_limit if time_limit is not None else None
+        moves = game.legal_moves()
+        if not moves:
+            return AlphaBeta(**self.engine_options).search(game, time_limit, max_depth)
+
+        self.search_number += 1
+        if self.local_engine is not None:
+            self.local_engine.clear()
+        self.nodes = self.table_hits = self.cutoffs = 0
+        best_move, best_score, completed = moves[0], 0, 0
+        iteration_nodes = []
+        depth = 0
+        while max_depth is None or depth < max_depth:
+            depth += 1
+            nodes_before = self.nodes
+            outcome = self._search_root(game, moves, depth, deadline)
+            if outcome is None:
+                break  # Out of time; the unfinished iteration is dropped
+            score, move, horizon_reached = outcome
+            best_move, best_score, completed = move, score, depth
+            iteration_nodes.append(self.nodes - nodes_before)
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) > MATE_THRESHOLD or not horizon_reached:
+                break
+        return SearchResult(best_move, best_score, completed, self.nodes, time.perf_counter() - started,
+                            iteration_nodes, self.table_hits, self.cutoffs)
+
+    def _search_root(self, game, moves, depth, deadline):
+        """Scores the root moves at one depth; returns (score, move, horizon_reached), or None if time ran out."""
+        self.nodes += 1
+        number = self.search_number
+        first = self._run([(number, game, moves[0], depth, -WIN_SCORE - 1, deadline)])[0]
+        if first is None:
+            return None
+        alpha, best_move, horizon_reached = first[0], moves[0], first[1]
+        tasks = [(number, game, move, depth, alpha, deadline) for move in moves[1:]]
+        best_score = alpha
+        for move, answer in zip(moves[1:], self._run(tasks)):
+            if answer is None:
+                return None
+            score, move_horizon_reached = answer
+            horizon_reached = horizon_reached or move_horizon_reached
+            if score > best_score:
+                best_score, best_move = score, move
+        return best_score, best_move, horizon_reached
+
+    def _run(self, tasks):
+        """Scores root moves, in the pool or locally; answers are (score, horizon_reached) or None after a timeout."""
+        if self.executor is None:
+            results = [_score_move(self.local_engine, task) for task in tasks]
+        else:
+            results = list(self.executor.map(_solve_task, tasks))
+        answers = []
+        for result in results:
+            score, horizon_reached, nodes, table_hits, cutoffs = result
+            self.nodes += nodes
+            self.table_hits += table_hits
+            self.cutoffs += cutoffs
+            answers.append(None if score is None else (score, horizon_reached))
+        return answers
+
+
+def _remaining(deadline):
+    """Seconds left until a time.time() deadline (None for no deadline), measured when a task starts."""
+    return max(0.0, deadline - time.time()) if deadline is not None else None
+
+
+# Per-process state: the engine set up by _init_worker and the search its tables belong to
+_worker_engine = None
+_worker_search_number = None
+
+
+def _init_worker(engine_options):
+    global _worker_engine
+    _worker_engine = AlphaBeta(**engine_options)
+
+
+def _solve_task(task):
+    global _worker_search_number
+    if task[0] != _worker_search_number:
+        _worker_engine.clear()
+        _worker_search_number = task[0]
+    return _score_move(_worker_engine, task)
+
+
+def _score_move(engine, task):
+    """Plays one root move and searches the reply with the window (alpha, infinity) seen from the root."""
+    _, game, move, depth, alpha, deadline = task
+    time_limit = _remaining(deadline)
+    game.play(move)
+    try:
+        value = engine.value(game, depth - 1, -WIN_SCORE - 1, -alpha, ply=1, time_limit=time_limit)
+    finally:
+        game.undo(move)
+    score = -value if value is not None else None
+    return score, engine.horizon_reached, engine.nodes, engine.table_hits, engine.cutoffs
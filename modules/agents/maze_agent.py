@@ -1,7 +1,9 @@
 # modules/agents/maze_agent.py
 
 from modules.search_algorithms.uninformed_search import dfs, bfs, ucs
-from modules.search_algorithms.informed_search import astar
+from modules.search_algorithms.informed_search import astar, jps, bidirectional_astar
+from modules.search_algorithms.incremental_search import DStarLite
+from modules.search_algorithms.search_stats import SearchStats
 
 class MazeAgent:
     def __init__(self, start_position, goal_position, algorithm='dfs'):
@@ -10,21 +12,49 @@ class MazeAgent:
         self.algorithm = algorithm
         self.path = []
         self.path_traveled = []
+        self.stats = SearchStats()  # Work done by the last find_path or replan call
+        self.blocked_positions = set()  # Dynamic obstacles on top of the grid's walls
+        self.planner = None  # D* Lite state kept between replans
 
     def find_path(self, grid):
-        blocked_positions = set()
+        blocked_positions = self.blocked_positions
         grid_size = len(grid)
-        if self.algorithm == 'dfs':
-            self.path = dfs(self.position, self.goal_position, grid, blocked_positions, grid_size)
+        self.stats = SearchStats()
+        if self.algorithm == 'dstar_lite':
+            self.planner = DStarLite(self.position, self.goal_position, grid, blocked_positions, grid_size,
+                                     stats=self.stats)
+            self.path = self.planner.replan()
+        elif self.algorithm == 'dfs':
+            self.path = dfs(self.position, self.goal_position, grid, blocked_positions, grid_size, stats=self.stats)
         elif self.algorithm == 'bfs':
-            self.path = bfs(self.position, self.goal_position, grid, blocked_positions, grid_size)
+            self.path = bfs(self.position, self.goal_position, grid, blocked_positions, grid_size, stats=self.stats)
         elif self.algorithm == 'ucs':
-            self.path = ucs(self.position, self.goal_position, grid, blocked_positions, grid_size)
+            self.path = ucs(self.position, self.goal_position, grid, blocked_positions, grid_size, stats=self.stats)
         elif self.algorithm == 'astar':
-            self.path = astar(self.position, self.goal_position, grid, blocked_positions, grid_size)
+            self.path = astar(self.position, self.goal_position, grid, blocked_positions, grid_size, stats=self.stats)
+        elif self.algorithm == 'jps':
+            self.path = jps(self.position, self.goal_position, grid, blocked_positions, grid_size, stats=self.stats)
+        elif self.algorithm == 'bidirectional_astar':
+            self.path = bidirectional_astar(self.position, self.goal_position, grid, blocked_positions, grid_size, stats=self.stats)
         else:
             raise ValueError(f"Unknown algorithm: {self.algorithm}")
 
+    def replan(self, grid, blocked_positions):
+        """Updates the dynamic obstacles and finds a new path from the current position.
+
+        With D* Lite the existing plan is repaired; every other algorithm searches again from scratch.
+        """
+        self.blocked_positions = set(blocked_positions)
+        if self.planner is not None:
+            self.stats = SearchStats()
+            self.planner.stats = self.stats
+            path = self.planner.replan(self.position, self.blocked_positions)
+        else:
+            self.find_path(grid)
+            path = self.path
+        # The new path starts at the current position, which the agent already occupies
+        self.path = path[1:] if path else []
+
     def move(self):
         if self.path:
             next_position = self.path.pop(0)
@@ -1,68 +1,125 @@
 # modules/agents/robot_agent.py
 
 from modules.search_algorithms.uninformed_search import bfs
-from modules.search_algorithms.informed_search import astar
+from modules.search_algorithms.informed_search import astar, jps, bidirectional_astar
+from modules.search_algorithms.distance_matrix import DistanceMatrix
+from modules.search_algorithms.tour_planner import plan_tour
+from modules.search_algorithms.incremental_search import DStarLite
+from modules.search_algorithms.search_stats import SearchStats
+
+# Algorithms whose paths are shortest paths, so cached BFS paths can stand in for them
+SHORTEST_PATH_ALGORITHMS = ('bfs', 'ucs', 'astar', 'jps', 'bidirectional_astar', 'dstar_lite')
 
 class RobotAgent:
-    def __init__(self, start_position, tasks, algorithm='astar', nearest_task=False):
+    def __init__(self, start_position, tasks, algorithm='astar', nearest_task=False, tour=False,
+                 tour_time_budget=1.0):
         self.position = start_position
         self.tasks = tasks.copy()  # Original list of tasks
         self.algorithm = algorithm
         self.nearest_task = nearest_task  # Determines behavior
+        self.tour = tour  # Visit the tasks along a planned shortest tour
+        self.tour_time_budget = tour_time_budget  # Seconds allowed for improving large tours
         self.path = []
         self.path_traveled = []
         self.completed_tasks = []
         self.current_task_index = 0  # For task order-based behavior
         self.grid = None  # Will be set when find_initial_path is called
         self.current_task = None
+        self.distance_matrix = None  # True distances between the start and the tasks
+        self.tour_length = None  # Planned number of moves in tour mode
+        self.planning_time = None  # Seconds spent planning the tour
+        self.stats = SearchStats()  # Search work summed over all legs, including the distance matrix BFS
+        self.blocked_positions = set()  # Dynamic obstacles on top of the grid's walls
+        self.planner = None  # D* Lite state for the current task, kept between replans
 
     def find_initial_path(self, grid):
         self.grid = grid
         if self.nearest_task:
+            # One BFS per task up front; every later choice and leg is a lookup
+            self.distance_matrix = DistanceMatrix(grid, [self.position] + self.tasks, stats=self.stats)
             # Start by finding a path to the nearest task
             self.find_path_to_nearest_task()
         else:
+            if self.tour:
+                # Reorder the tasks along a planned tour, then visit them in order
+                self.plan_task_tour()
             # Start by finding a path to the first task in order
             if self.current_task_index < len(self.tasks):
                 self.current_task = self.tasks[self.current_task_index]
                 self.find_path_to_current_task()
 
+    def plan_task_tour(self):
+        self.distance_matrix = DistanceMatrix(self.grid, [self.position] + self.tasks, stats=self.stats)
+        tour = plan_tour(self.distance_matrix.distances, time_budget=self.tour_time_budget)
+        positions = self.distance_matrix.positions
+        ordered_tasks = [positions[node] for node in tour.order[1:]]
+        # Unreachable tasks are left at the end in their original order
+        self.tasks = ordered_tasks + [task for task in self.tasks if task not in ordered_tasks]
+        self.tour_length = tour.length
+        self.planning_time = tour.planning_time
+
     def find_path_to_current_task(self):
-        blocked_positions = set()
+        # Cached paths only know the static walls and count moves, so they are skipped once dynamic
+        # obstacles appear and on grids with terrain costs
+        if (self.distance_matrix is not None and self.algorithm in SHORTEST_PATH_ALGORITHMS
+                and not self.blocked_positions and getattr(self.grid, 'costs', None) is None):
+            self.path = self.distance_matrix.path(self.position, self.current_task)
+            return
+        blocked_positions = self.blocked_positions
         grid_size = len(self.grid)
-        if self.algorithm == 'dfs':
+        if self.algorithm == 'dstar_lite':
+            if self.planner is None or self.planner.goal != self.current_task:
+                self.planner = DStarLite(self.position, self.current_task, self.grid, blocked_positions, grid_size,
+                                         stats=self.stats)
+            self.path = self.planner.replan(self.position, blocked_positions)
+        elif self.algorithm == 'dfs':
             from modules.search_algorithms.uninformed_search import dfs
-            self.path = dfs(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            self.path = dfs(self.position, self.current_task, self.grid, blocked_positions, grid_size, stats=self.stats)
         elif self.algorithm == 'bfs':
-            self.path = bfs(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            self.path = bfs(self.position, self.current_task, self.grid, blocked_positions, grid_size, stats=self.stats)
         elif self.algorithm == 'ucs':
             from modules.search_algorithms.uninformed_search import ucs
-            self.path = ucs(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            self.path = ucs(self.position, self.current_task, self.grid, blocked_positions, grid_size, stats=self.stats)
         elif self.algorithm == 'astar':
-            self.path = astar(self.position, self.current_task, self.grid, blocked_positions, grid_size)
+            self.path = astar(self.position, self.current_task, self.grid, blocked_positions, grid_size, stats=self.stats)
+        elif self.algorithm == 'jps':
+            self.path = jps(self.position, self.current_task, self.grid, blocked_positions, grid_size, stats=self.stats)
+        elif self.algorithm == 'bidirectional_astar':
+            self.path = bidirectional_astar(self.position, self.current_task, self.grid, blocked_positions, grid_size, stats=self.stats)
         else:
             raise ValueError(f"Unknown algorithm: {self.algorithm}")
 
+    def replan(self, blocked_positions):
+        """Updates the dynamic obstacles and finds a new path to the current task from the current position.
+
+        With D* Lite the plan for the current task is repaired; every other algorithm searches again.
+        """
+        self.blocked_positions = set(blocked_positions)
+        if self.current_task is None or self.current_task in self.completed_tasks:
+            return
+        self.find_path_to_current_task()
+        # The new path starts at the current position, which the agent already occupies
+        self.path = self.path[1:] if self.path else []
+
     def find_path_to_nearest_task(self):
         if not self.tasks:
             return False  # No tasks left
 
-        # Calculate distances to uncompleted tasks
-        task_distances = []
-        for task in self.tasks:
-            if task not in self.completed_tasks:
-                distance = self.manhattan_distance(self.position, task)
-                task_distances.append((distance, task))
-
-        if not task_distances:
+        remaining_tasks = [task for task in self.tasks if task not in self.completed_tasks]
+        if not remaining_tasks:
             return False  # All tasks completed
 
-        # Find the nearest task
-        task_distances.sort()
-        self.current_task = task_distances[0][1]
+        # Find the nearest reachable task by true grid distance
+        if self.distance_matrix is None:
+            self.distance_matrix = DistanceMatrix(self.grid, [self.position] + self.tasks, stats=self.stats)
+        self.current_task = self.distance_matrix.nearest(self.position, remaining_tasks)
+        if self.current_task is None:
+            self.path = []
+            return False  # Remaining tasks are unreachable
 
         # Plan path to the nearest task
         self.find_path_to_current_task()
+        return True
 
     def move(self):
         if self.path:
@@ -0,0 +1,5 @@
+# modules/benchmarks/__init__.py
+
+from .search_benchmark import ALGORITHMS, generate_cases, run_case, run_benchmark, write_csv, write_json
+
+__all__ = ['ALGORITHMS', 'generate_cases', 'run_case', 'run_benchmark', 'write_csv', 'write_json']
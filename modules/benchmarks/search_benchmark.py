@@ -0,0 +1,168 @@
+# modules/benchmarks/search_benchmark.py
+
+import argparse
+import csv
+import json
+import random
+import time
+import tracemalloc
+
+from modules.environments.grid_environment import GridEnvironment
+from modules.environments.maze_environment import MazeEnvironment
+from modules.search_algorithms import (
+    dfs, bfs, ucs, astar, jps, bidirectional_astar, hill_climbing, simulated_annealing, SearchStats
+)
+
+# Every grid search algorithm in modules.search_algorithms, by CLI name
+ALGORITHMS = {
+    'dfs': dfs,
+    'bfs': bfs,
+    'ucs': ucs,
+    'astar': astar,
+    'jps': jps,
+    'bidirectional_astar': bidirectional_astar,
+    'hill_climbing': hill_climbing,
+    'simulated_annealing': simulated_annealing,
+}
+
+FIELDS = ['environment', 'size', 'seed', 'algorithm', 'found', 'path_length', 'nodes_expanded',
+          'pushes', 'max_frontier', 'reopenings', 'wall_time', 'peak_memory']
+
+
+class BenchmarkCase:
+    """One generated environment with the start and goal every algorithm is asked to connect."""
+
+    def __init__(self, environment, size, seed, grid, start, goal):
+        self.environment = environment  # 'grid' or 'maze'
+        self.size = size
+        self.seed = seed
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+
+
+def generate_cases(environments, sizes, count, seed=0):
+    """Yields count seeded cases per environment kind and size."""
+    for environment in environments:
+        for size in sizes:
+            for number in range(count):
+                case_seed = seed + number
+                if environment == 'grid':
+                    env = GridEnvironment(size, num_tasks=1, seed=case_seed)
+                    yield BenchmarkCase(environment, size, case_seed, env.get_grid(),
+                                        env.get_start_position(), env.get_tasks()[0])
+                elif environment == 'maze':
+                    maze_size = size if size % 2 == 1 else size + 1
+                    env = MazeEnvironment(maze_size, maze_size, seed=case_seed)
+                    yield BenchmarkCase(environment, maze_size, case_seed, env.get_grid(),
+                                        (1, 0), (maze_size - 2, maze_size - 1))
+                else:
+                    raise ValueError(f"Unknown environment: {environment}")
+
+
+def run_case(algorithm, case, measure_memory=True):
+    """Runs one algorithm on one case and returns a record with one value per FIELDS entry."""
+    search = ALGORITHMS[algorithm]
+    grid_size = max(len(case.grid), len(case.grid[0]))
+    stats = SearchStats()
+    # Seed per run so the stochastic local searches are reproducible as well
+    random.seed(case.seed)
+    started = time.perf_counter()
+    path = search(case.start, case.goal, case.grid, set(), grid_size, stats=stats)
+    wall_time = time.perf_counter() - started
+
+    peak_memory = None
+    if measure_memory:
+        # A second, traced run so tracing overhead does not leak into the wall time
+        random.seed(case.seed)
+        tracemalloc.start()
+        search(case.start, case.goal, case.grid, set(), grid_size)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    found = bool(path) and path[-1] == case.goal
+    return {
+        'environment': case.environment,
+        'size': case.size,
+        'seed': case.seed,
+        'algorithm': algorithm,
+        'found': found,
+        'path_length': len(path) if found else None,
+        'nodes_expanded': stats.expansions,
+        'pushes': stats.pushes,
+        'max_frontier': stats.max_frontier,
+        'reopenings': stats.reopenings,
+        'wall_time': wall_time,
+        'peak_memory': peak_memory,
+    }
+
+
+def run_benchmark(algorithms, environments, sizes, count, seed=0, measure_memory=True):
+    """Runs every algorithm on every generated case and returns the list of records."""
+    records = []
+    for case in generate_cases(environments, sizes, count, seed):
+        for algorithm in algorithms:
+            records.append(run_case(algorithm, case, measure_memory))
+    return records
+
+
+def write_csv(records, path):
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def write_json(records, path):
+    with open(path, 'w') as file:
+        json.dump(records, file, indent=2)
+
+
+def print_summary(records):
+    """Prints one line per (environment, size, algorithm) with averages over the seeds."""
+    groups = {}
+    for record in records:
+        key = (record['environment'], record['size'], record['algorithm'])
+        groups.setdefault(key, []).append(record)
+
+    print(f"{'env':>5} {'size':>6} {'algorithm':>20} {'found':>6} {'path':>7} {'expanded':>10} "
+          f"{'frontier':>9} {'time':>10} {'peak':>9}")
+    for (environment, size, algorithm), group in groups.items():
+        found = [record for record in group if record['found']]
+        path_length = sum(record['path_length'] for record in found) / len(found) if found else 0
+        expanded = sum(record['nodes_expanded'] for record in group) / len(group)
+        frontier = max(record['max_frontier'] for record in group)
+        wall_time = sum(record['wall_time'] for record in group) / len(group)
+        peaks = [record['peak_memory'] for record in group if record['peak_memory'] is not None]
+        peak_text = f"{sum(peaks) / len(peaks) / 1024:.0f}KB" if peaks else '-'
+        print(f"{environment:>5} {size:>6} {algorithm:>20} {len(found):>3}/{len(group):<2} {path_length:>7.1f} "
+              f"{expanded:>10.0f} {frontier:>9} {wall_time * 1000:>8.2f}ms {peak_text:>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless batch benchmark for the search algorithms')
+    parser.add_argument('--algorithms', type=str, nargs='+', default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS), help='Algorithms to run (default: all)')
+    parser.add_argument('--environments', type=str, nargs='+', default=['grid', 'maze'],
+                        choices=['grid', 'maze'], help='Environment kinds (default: grid maze)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 32, 64],
+                        help='Environment sizes (default: 16 32 64)')
+    parser.add_argument('--count', type=int, default=5, help='Environments per kind and size (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the first environment (default: 0)')
+    parser.add_argument('--no_memory', action='store_true', help='Skip the traced run for peak memory')
+    parser.add_argument('--csv', type=str, default=None, help='Write the records to this CSV file')
+    parser.add_argument('--json', type=str, default=None, help='Write the records to this JSON file')
+    args = parser.parse_args(argv)
+
+    records = run_benchmark(args.algorithms, args.environments, args.sizes, args.count, args.seed,
+                            measure_memory=not args.no_memory)
+    print_summary(records)
+    if args.csv:
+        write_csv(records, args.csv)
+    if args.json:
+        write_json(records, args.json)
+    return records
+
+
+if __name__ == "__main__":
+    main()
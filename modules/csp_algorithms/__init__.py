@@ -0,0 +1,10 @@
+# modules/csp_algorithms/__init__.py
+
+from .csp_solver import (CSP, CSPStats, Constraint, AllDifferent, ac3, solve, count_solutions, iter_solutions,
+                         n_queens, map_coloring, random_map, AUSTRALIA, sudoku, format_sudoku, HARD_SUDOKUS)
+from .exact_cover import (ExactCover, ParallelExactCover, queens_cover, queens_solution, sudoku_cover,
+                          sudoku_solution)
+
+__all__ = ['CSP', 'CSPStats', 'Constraint', 'AllDifferent', 'ac3', 'solve', 'count_solutions', 'iter_solutions',
+           'n_queens', 'map_coloring', 'random_map', 'AUSTRALIA', 'sudoku', 'format_sudoku', 'HARD_SUDOKUS',
+           'ExactCover', 'ParallelExactCover', 'queens_cover', 'queens_solution', 'sudoku_cover', 'sudoku_solution']
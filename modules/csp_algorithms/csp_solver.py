@@ -0,0 +1,628 @@
+# modules/csp_algorithms/csp_solver.py
+
+import math
+import random
+import time
+
+# Constraint satisfaction by backtracking search. A CSP has variables 0..n-1,
+# each with a domain of small non-negative integer values stored as a bitmask
+# (bit v set means value v is still possible). Binary constraints are compiled
+# into support tables of bitmasks, so revising an arc is a handful of integer
+# ANDs, and global constraints (AllDifferent) run their own propagators.
+
+INFERENCES = ('none', 'fc', 'mac')  # Plain backtracking, forward checking, maintaining arc consistency
+VARIABLE_ORDERS = ('static', 'mrv', 'mrv_degree')
+VALUE_ORDERS = ('static', 'lcv')
+
+
+def bit_values(mask):
+    """The values whose bits are set in mask, smallest first."""
+    values = []
+    while mask:
+        low = mask & -mask
+        values.append(low.bit_length() - 1)
+        mask ^= low
+    return values
+
+
+class CSPStats:
+    """Work counters a solver fills in when it is passed as stats=...
+
+    Counters accumulate over every solve the object is passed to; call reset()
+    to start over.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.assignments = 0  # Values tried for a variable
+        self.backtracks = 0  # Values taken back because they led to no (further) solution
+        self.revisions = 0  # Arc revisions plus global constraint propagator runs
+        self.prunings = 0  # Values removed from domains by propagation
+        self.solutions = 0
+        self.elapsed = 0.0  # Seconds spent in the solver
+        self.started = None
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def finish(self):
+        if self.started is not None:
+            self.elapsed += time.perf_counter() - self.started
+            self.started = None
+
+    def as_dict(self):
+        return {
+            'assignments': self.assignments,
+            'backtracks': self.backtracks,
+            'revisions': self.revisions,
+            'prunings': self.prunings,
+            'solutions': self.solutions,
+            'elapsed': self.elapsed,
+        }
+
+    def __repr__(self):
+        return (f"CSPStats(assignments={self.assignments}, backtracks={self.backtracks}, "
+                f"revisions={self.revisions}, prunings={self.prunings}, solutions={self.solutions}, "
+                f"elapsed={self.elapsed:.4f}s)")
+
+
+class Constraint:
+    """A global constraint over several variables (its scope).
+
+    Subclasses prune domains (a list of bitmasks, changed in place) and return
+    the variables whose domains they narrowed, or None when the constraint can
+    no longer be satisfied.
+    """
+
+    def __init__(self, scope):
+        self.scope = list(scope)
+
+    def propagate(self, domains):
+        """Prunes as much as the constraint can on its own (used by AC-3 and MAC)."""
+        raise NotImplementedError
+
+    def forward(self, domains, var):
+        """Prunes the consequences of var having just been assigned (used by forward checking)."""
+        return self.propagate(domains)
+
+    def consistent(self, domains, assigned, var):
+        """Whether var's value agrees with the other assigned variables (used without inference)."""
+        raise NotImplementedError
+
+    def conflicts(self, domains, assigned, var, value):
+        """Values of unassigned variables that var = value would rule out (for least-constraining-value)."""
+        return 0
+
+    def satisfied(self, values):
+        raise NotImplementedError
+
+
+class AllDifferent(Constraint):
+    """No two variables of the scope take the same value."""
+
+    def propagate(self, domains):
+        scope = self.scope
+        changed = []
+        while True:
+            # Values fixed by singleton domains are removed from every other domain
+            fixed = 0
+            for var in scope:
+                domain = domains[var]
+                if not domain & (domain - 1):
+                    if domain & fixed:
+                        return None
+                    fixed |= domain
+            progress = False
+            union = 0
+            for var in scope:
+                domain = domains[var]
+                if domain & (domain - 1) and domain & fixed:
+                    domain &= ~fixed
+                    if not domain:
+                        return None
+                    domains[var] = domain
+                    changed.append(var)
+                    progress = True
+                union |= domain
+            if progress:
+                continue
+            count = union.bit_count()
+            if count < len(scope):
+                return None  # More variables than values left
+            if count == len(scope):
+                # Every value is needed, so a value that fits a single variable goes there
+                for value in bit_values(union & ~fixed):
+                    value_bit = 1 << value
+                    holders = [var for var in scope if domains[var] & value_bit]
+                    if len(holders) == 1:
+                        domains[holders[0]] = value_bit
+                        changed.append(holders[0])
+                        progress = True
+            if not progress:
+                return changed
+
+    def forward(self, domains, var):
+        value_bit = domains[var]
+        changed = []
+        for other in self.scope:
+            domain = domains[other]
+            if other != var and domain & value_bit:
+                domain &= ~value_bit
+                if not domain:
+                    return None
+                domains[other] = domain
+                changed.append(other)
+        return changed
+
+    def consistent(self, domains, assigned, var):
+        value_bit = domains[var]
+        return not any(other != var and assigned[other] and domains[other] == value_bit for other in self.scope)
+
+    def conflicts(self, domains, assigned, var, value):
+        value_bit = 1 << value
+        return sum(1 for other in self.scope if other != var and not assigned[other] and domains[other] & value_bit)
+
+    def satisfied(self, values):
+        chosen = [values[var] for var in self.scope]
+        return len(set(chosen)) == len(chosen)
+
+
+class CSP:
+    """Variables with bitmask domains, binary relations and global constraints.
+
+    A binary relation between x and y is stored as a support table: entry a is
+    the bitmask of y's values compatible with x = a. Relations added for the
+    same pair are intersected. Not-equal relations are kept without a table
+    (None) and revised with a single-bit test.
+    """
+
+    def __init__(self, domains, names=None):
+        self.domains = [self._mask(domain) for domain in domains]
+        self.names = list(names) if names is not None else list(range(len(self.domains)))
+        self.relations = {}  # (x, y) -> support table, or None for x != y
+        self.constraints = []  # Global constraints
+        self._arcs = None
+
+    @staticmethod
+    def _mask(domain):
+        if isinstance(domain, int):
+            return domain
+        mask = 0
+        for value in domain:
+            mask |= 1 << value
+        return mask
+
+    def __len__(self):
+        return len(self.domains)
+
+    def add_relation(self, x, y, supports, reverse=None):
+        """Adds the binary relation given by its support table for x (entry a: y's values allowed when x = a).
+
+        reverse is the same table seen from y; it is derived from supports when left out.
+        """
+        if reverse is None:
+            reverse = [0] * self.domains[y].bit_length()
+            for a, allowed in enumerate(supports):
+                for b in bit_values(allowed):
+                    if b < len(reverse):
+                        reverse[b] |= 1 << a
+        self._add_table(x, y, list(supports))
+        self._add_table(y, x, list(reverse))
+
+    def add_constraint(self, x, y, predicate):
+        """Adds the binary relation predicate(value of x, value of y)."""
+        supports = [0] * self.domains[x].bit_length()
+        for a in bit_values(self.domains[x]):
+            for b in bit_values(self.domains[y]):
+                if predicate(a, b):
+                    supports[a] |= 1 << b
+        self.add_relation(x, y, supports)
+
+    def add_not_equal(self, x, y):
+        if (x, y) in self.relations:
+            width = max(self.domains[x].bit_length(), self.domains[y].bit_length())
+            self.add_relation(x, y, [~(1 << a) & ((1 << width) - 1) for a in range(self.domains[x].bit_length())])
+        else:
+            self.relations[(x, y)] = self.relations[(y, x)] = None
+            self._arcs = None
+
+    def add_global(self, constraint):
+        self.constraints.append(constraint)
+        self._arcs = None
+
+    def add_all_different(self, variables):
+        self.add_global(AllDifferent(variables))
+
+    def _add_table(self, x, y, supports):
+        if (x, y) in self.relations:
+            existing = self.relations[(x, y)]
+            if existing is None:
+                existing = [~(1 << a) for a in range(len(supports))]
+            supports = [allowed & existing[a] if a < len(existing) else 0 for a, allowed in enumerate(supports)]
+        self.relations[(x, y)] = supports
+        self._arcs = None
+
+    def arcs(self):
+        """Returns (arcs_from, arcs_into, globals_of, neighbors), built once per set of constraints.
+
+        arcs_from[x] lists (y, table of (x, y)); arcs_into[y] lists
+        (x, table of (x, y), limit), the arcs to revise when y's domain shrinks.
+        limit is the most values of y that one value of x rules out: while y has
+        more values left than that, every value of x still has a support.
+        """
+        if self._arcs is None:
+            count = len(self.domains)
+            arcs_from = [[] for _ in range(count)]
+            arcs_into = [[] for _ in range(count)]
+            globals_of = [[] for _ in range(count)]
+            neighbors = [set() for _ in range(count)]
+            for (x, y), supports in self.relations.items():
+                if supports is None:
+                    limit = 1
+                else:
+                    # An empty domain of x has no values to support, so nothing forces a revision
+                    limit = max(((self.domains[y] & ~supports[a]).bit_count() for a in bit_values(self.domains[x])),
+                                default=0)
+                arcs_from[x].append((y, supports))
+                arcs_into[y].append((x, supports, limit))
+                neighbors[x].add(y)
+            for constraint in self.constraints:
+                for var in constraint.scope:
+                    globals_of[var].append(constraint)
+                    neighbors[var].update(other for other in constraint.scope if other != var)
+            self._arcs = (arcs_from, arcs_into, globals_of, [list(others) for others in neighbors])
+        return self._arcs
+
+    def is_solution(self, values):
+        """Whether a complete assignment (one value per variable) satisfies every constraint."""
+        for var, value in enumerate(values):
+            if not self.domains[var] >> value & 1:
+                return False
+        for (x, y), supports in self.relations.items():
+            if supports is None:
+                if values[x] == values[y]:
+                    return False
+            elif not supports[values[x]] >> values[y] & 1:
+                return False
+        return all(constraint.satisfied(values) for constraint in self.constraints)
+
+    def named(self, values):
+        """A solution as a dict from variable names to values."""
+        return dict(zip(self.names, values))
+
+
+def propagate(csp, domains, queue, stats):
+    """Revises arcs until no domain changes (AC-3), starting from the variables in queue.
+
+    Changes domains in place; returns False if a domain was wiped out.
+    """
+    _, arcs_into, globals_of, _ = csp.arcs()
+    queued = [False] * len(domains)
+    for var in queue:
+        queued[var] = True
+    queue = list(queue)
+    revisions = prunings = 0
+    try:
+        while queue:
+            y = queue.pop()
+            queued[y] = False
+            other_domain = domains[y]
+            size = other_domain.bit_count()
+            for x, supports, limit in arcs_into[y]:
+                if size > limit:
+                    continue
+                revisions += 1
+                domain = domains[x]
+                if supports is None:
+                    # x != y only prunes once y is down to one value
+                    if not domain & other_domain:
+                        continue
+                    narrowed = domain & ~other_domain
+                else:
+                    narrowed = domain
+                    values = domain
+                    while values:
+                        low = values & -values
+                        if not supports[low.bit_length() - 1] & other_domain:
+                            narrowed ^= low
+                        values ^= low
+                    if narrowed == domain:
+                        continue
+                if not narrowed:
+                    return False
+                prunings += (domain ^ narrowed).bit_count()
+                domains[x] = narrowed
+                if not queued[x]:
+                    queued[x] = True
+                    queue.append(x)
+            for constraint in globals_of[y]:
+                revisions += 1
+                before = sum(domains[var].bit_count() for var in constraint.scope)
+                changed = constraint.propagate(domains)
+                if changed is None:
+                    return False
+                prunings += before - sum(domains[var].bit_count() for var in constraint.scope)
+                for x in changed:
+                    if not queued[x]:
+                        queued[x] = True
+                        queue.append(x)
+        return True
+    finally:
+        stats.revisions += revisions
+        stats.prunings += prunings
+
+
+def ac3(csp, domains=None, stats=None):
+    """Makes every arc of csp consistent; returns the reduced domains, or None if the CSP has no solution."""
+    if stats is None:
+        stats = CSPStats()
+    domains = list(csp.domains if domains is None else domains)
+    if any(not domain for domain in domains) or not propagate(csp, domains, range(len(domains)), stats):
+        return None
+    return domains
+
+
+def solve(csp, inference='mac', variable_order='mrv_degree', value_order='lcv', stats=None):
+    """Returns the first solution found (a list with one value per variable), or None."""
+    return next(iter_solutions(csp, inference, variable_order, value_order, stats), None)
+
+
+def count_solutions(csp, inference='mac', variable_order='mrv_degree', value_order='static', stats=None):
+    return sum(1 for _ in iter_solutions(csp, inference, variable_order, value_order, stats))
+
+
+def iter_solutions(csp, inference='mac', variable_order='mrv_degree', value_order='lcv', stats=None):
+    """Backtracking search that yields every solution of csp in turn.
+
+    inference is 'none' (only check the new value against assigned
+    variables), 'fc' (forward checking: prune the neighbours of the variable
+    just assigned) or 'mac' (AC-3 before the search and after every
+    assignment). variable_order picks the next variable: 'static' takes them
+    in order, 'mrv' takes the one with the fewest values left and
+    'mrv_degree' breaks ties by the number of unassigned neighbours.
+    value_order 'lcv' tries first the values that rule out the fewest values
+    of unassigned neighbours.
+    """
+    if inference not in INFERENCES:
+        raise ValueError(f"Unknown inference: {inference}")
+    if variable_order not in VARIABLE_ORDERS:
+        raise ValueError(f"Unknown variable order: {variable_order}")
+    if value_order not in VALUE_ORDERS:
+        raise ValueError(f"Unknown value order: {value_order}")
+    if stats is None:
+        stats = CSPStats()
+    stats.start()
+    try:
+        domains = list(csp.domains)
+        if any(not domain for domain in domains):
+            return
+        search = _Backtracking(csp, inference, variable_order, value_order, stats)
+        if inference == 'mac' and not propagate(csp, domains, range(len(domains)), stats):
+            return
+        for solution in search.run(domains, [False] * len(domains), 0):
+            stats.finish()
+            yield solution
+            stats.start()
+    finally:
+        stats.finish()
+
+
+class _Backtracking:
+    def __init__(self, csp, inference, variable_order, value_order, stats):
+        self.csp = csp
+        self.inference = inference
+        self.variable_order = variable_order
+        self.value_order = value_order
+        self.stats = stats
+        self.arcs_from, self.arcs_into, self.globals_of, self.neighbors = csp.arcs()
+
+    def run(self, domains, assigned, depth):
+        if depth == len(domains):
+            self.stats.solutions += 1
+            yield [domain.bit_length() - 1 for domain in domains]
+            return
+        var = self.select_variable(domains, assigned)
+        stats = self.stats
+        assigned[var] = True
+        for value in self.order_values(domains, assigned, var):
+            stats.assignments += 1
+            solutions = stats.solutions
+            child = domains[:]
+            child[var] = 1 << value
+            if self.infer(child, assigned, var, value):
+                yield from self.run(child, assigned, depth + 1)
+            if stats.solutions == solutions:
+                stats.backtracks += 1
+        assigned[var] = False
+
+    def select_variable(self, domains, assigned):
+        if self.variable_order == 'static':
+            return assigned.index(False)
+        best_size = math.inf
+        ties = []
+        for var, domain in enumerate(domains):
+            if assigned[var]:
+                continue
+            size = domain.bit_count()
+            if size < best_size:
+                best_size = size
+                ties = [var]
+            elif size == best_size:
+                ties.append(var)
+        if self.variable_order == 'mrv' or len(ties) == 1:
+            return ties[0]
+        neighbors = self.neighbors
+        return max(ties, key=lambda var: sum(1 for other in neighbors[var] if not assigned[other]))
+
+    def order_values(self, domains, assigned, var):
+        values = bit_values(domains[var])
+        if self.value_order == 'static' or len(values) == 1:
+            return values
+        arcs = [(y, supports) for y, supports in self.arcs_from[var] if not assigned[y]]
+        constraints = self.globals_of[var]
+
+        def ruled_out(value):
+            count = 0
+            for y, supports in arcs:
+                if supports is None:
+                    count += domains[y] >> value & 1
+                else:
+                    count += (domains[y] & ~supports[value]).bit_count()
+            for constraint in constraints:
+                count += constraint.conflicts(domains, assigned, var, value)
+            return count
+
+        return sorted(values, key=ruled_out)
+
+    def infer(self, domains, assigned, var, value):
+        """Applies var = value to domains (changed in place); returns False if that cannot lead to a solution."""
+        stats = self.stats
+        if self.inference == 'mac':
+            return propagate(self.csp, domains, [var], stats)
+        if self.inference == 'none':
+            for y, supports in self.arcs_from[var]:
+                if assigned[y]:
+                    stats.revisions += 1
+                    other = domains[y]
+                    if supports is None:
+                        if other >> value & 1:
+                            return False
+                    elif not supports[value] & other:
+                        return False
+            return all(constraint.consistent(domains, assigned, var) for constraint in self.globals_of[var])
+        # Forward checking: prune the domains of unassigned neighbours only
+        value_bit = 1 << value
+        for y, supports in self.arcs_from[var]:
+            if assigned[y]:
+                continue
+            stats.revisions += 1
+            domain = domains[y]
+            narrowed = domain & ~value_bit if supports is None else domain & supports[value]
+            if narrowed != domain:
+                if not narrowed:
+                    return False
+                stats.prunings += (domain ^ narrowed).bit_count()
+                domains[y] = narrowed
+        for constraint in self.globals_of[var]:
+            stats.revisions += 1
+            before = sum(domains[other].bit_count() for other in constraint.scope)
+            if constraint.forward(domains, var) is None:
+                return False
+            stats.prunings += before - sum(domains[other].bit_count() for other in constraint.scope)
+        return True
+
+
+# Built-in models
+
+def n_queens(n):
+    """One variable per column whose value is the row of its queen."""
+    full = (1 << n) - 1
+    csp = CSP([full] * n, names=[f"Q{column}" for column in range(n)])
+    for x in range(n):
+        for y in range(x + 1, n):
+            distance = y - x
+            # Rows attacked from row a: the same row and the two diagonals, distance columns away
+            supports = [full & ~(1 << a | 1 << a + distance | (1 << a - distance if a >= distance else 0))
+                        for a in range(n)]
+            # Attacks are symmetric, so the table also serves from y's side
+            csp.add_relation(x, y, supports, supports)
+    return csp
+
+
+# Mainland states and territories of Australia and their borders (Tasmania has none)
+AUSTRALIA = {
+    'WA': ['NT', 'SA'],
+    'NT': ['WA', 'SA', 'Q'],
+    'SA': ['WA', 'NT', 'Q', 'NSW', 'V'],
+    'Q': ['NT', 'SA', 'NSW'],
+    'NSW': ['Q', 'SA', 'V'],
+    'V': ['SA', 'NSW'],
+    'T': [],
+}
+
+
+def map_coloring(borders=AUSTRALIA, colors=3):
+    """One variable per region whose value is its color; neighbouring regions differ.
+
+    borders maps every region to the regions it borders.
+    """
+    regions = list(borders)
+    index = {region: var for var, region in enumerate(regions)}
+    csp = CSP([(1 << colors) - 1] * len(regions), names=regions)
+    for region, neighbors in borders.items():
+        for neighbor in neighbors:
+            if index[region] < index[neighbor]:
+                csp.add_not_equal(index[region], index[neighbor])
+    return csp
+
+
+def random_map(regions, seed=None):
+    """Borders of a random planar map: points in the unit square joined by non-crossing segments.
+
+    Repeatedly picks a random point and joins it to the nearest point it is
+    not joined to yet, as long as the new border crosses none of the others.
+    """
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(regions)]
+    borders = {region: [] for region in range(regions)}
+    segments = []
+    stuck = set()
+    while len(stuck) < regions:
+        region = rng.choice([region for region in range(regions) if region not in stuck])
+        candidates = sorted((other for other in range(regions) if other != region and other not in borders[region]),
+                            key=lambda other: math.dist(points[region], points[other]))
+        for other in candidates:
+            if not any(_crosses(points[region], points[other], points[a], points[b])
+                       for a, b in segments if region not in (a, b) and other not in (a, b)):
+                borders[region].append(other)
+                borders[other].append(region)
+                segments.append((region, other))
+                break
+        else:
+            stuck.add(region)
+    return borders
+
+
+def _crosses(p, q, r, s):
+    """Whether segments pq and rs properly intersect."""
+    def side(a, b, c):
+        return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+    return side(p, q, r) * side(p, q, s) < 0 and side(r, s, p) * side(r, s, q) < 0
+
+
+def sudoku(puzzle):
+    """One variable per cell (row by row) whose value is its digit; puzzle is 81 characters, '.' or '0' if empty.
+
+    Rows, columns and boxes are AllDifferent constraints.
+    """
+    digits = [char for char in puzzle if char in '0123456789.']
+    if len(digits) != 81:
+        raise ValueError(f"A Sudoku has 81 cells, got {len(digits)}")
+    every_digit = sum(1 << digit for digit in range(1, 10))
+    domains = [every_digit if char in '0.' else 1 << int(char) for char in digits]
+    csp = CSP(domains, names=[f"R{cell // 9 + 1}C{cell % 9 + 1}" for cell in range(81)])
+    for unit in range(9):
+        csp.add_all_different([unit * 9 + column for column in range(9)])
+        csp.add_all_different([row * 9 + unit for row in range(9)])
+        top, left = unit // 3 * 3, unit % 3 * 3
+        csp.add_all_different([(top + row) * 9 + left + column for row in range(3) for column in range(3)])
+    return csp
+
+
+# Hard Sudokus from the puzzle collections of Peter Norvig and Arto Inkala, for benchmarks
+HARD_SUDOKUS = [
+    "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+    "52...6.........7.13...........4..8..6......5...........418.........3..2...87.....",
+    "6.....8.3.4.7.................5.4.7.3..2.....1.6.......2.....5.....8.6......1....",
+    "48.3............71.2.......7.5....6....2..8.............1.76...3.....4......5....",
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+    "..53.....8......2..7..1.5..4....53...1..7...6..32...8..6.5....9..4....3......97..",
+]
+
+
+def format_sudoku(values):
+    """A solved (or partial, with None for blanks) Sudoku as 9 lines of digits."""
+    return '\n'.join(' '.join('.' if value is None else str(value) for value in values[row * 9:row * 9 + 9])
+                     for row in range(9))
@@ -0,0 +1,343 @@
+# modules/csp_algorithms/exact_cover.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Knuth's Algorithm X with Dancing Links. The node links live in flat lists of
+# integers indexed by node number instead of one Python object per node: node 0
+# is the root, nodes 1..columns are the column headers and the options (rows)
+# follow. Covering a column unlinks it and every row that uses it; uncovering
+# restores the links in reverse order. Lists are used rather than array('i'),
+# which has to box every integer it reads and made the search about 3x slower.
+
+SPLIT_DEPTH = 2  # Levels of the search tree enumerated up front by the parallel solver
+
+
+class ExactCover:
+    """An exact cover problem: choose rows so that every primary column is covered exactly once.
+
+    rows lists the columns of each row. Columns below primary are primary;
+    the others are secondary and may be covered at most once (N-Queens uses
+    them for the diagonals).
+    """
+
+    def __init__(self, columns, rows, primary=None):
+        self.columns = columns
+        self.primary = columns if primary is None else primary
+        self.rows = [sorted(set(row)) for row in rows]
+        nodes = 1 + columns + sum(len(row) for row in self.rows)
+        self.left = list(range(nodes))
+        self.right = list(range(nodes))
+        self.up = list(range(nodes))
+        self.down = list(range(nodes))
+        self.column_of = list(range(nodes))  # Header of each node's column
+        self.row_of = [-1] * nodes  # Row index of each row node
+        self.sizes = [0] * (columns + 1)  # Rows still using each column, by header
+        self.selected = bytearray(columns + 1)  # Headers covered by the rows of a prefix, by header
+        self.row_start = [0] * len(self.rows)  # First node of each row
+        self.nodes = 0  # Search tree nodes visited by the last search
+        self._build()
+
+    def _build(self):
+        left, right, up, down = self.left, self.right, self.up, self.down
+        # Only primary headers are linked into the root's list, so secondary columns are never chosen
+        headers = [0] + list(range(1, self.primary + 1))
+        for position, header in enumerate(headers):
+            right[header] = headers[(position + 1) % len(headers)]
+            left[header] = headers[position - 1]
+        node = self.columns + 1
+        for row_index, row in enumerate(self.rows):
+            first = node
+            self.row_start[row_index] = first
+            for column in row:
+                if not 0 <= column < self.columns:
+                    raise ValueError(f"Row {row_index} uses column {column}, outside 0..{self.columns - 1}")
+                header = column + 1
+                self.column_of[node] = header
+                self.row_of[node] = row_index
+                # Append at the bottom of the column
+                up[node] = up[header]
+                down[node] = header
+                down[up[header]] = node
+                up[header] = node
+                self.sizes[header] += 1
+                left[node] = node - 1 if node > first else first + len(row) - 1
+                right[node] = node + 1 if node < first + len(row) - 1 else first
+                node += 1
+
+    def _cover(self, header):
+        left, right, up, down, column_of, sizes = (self.left, self.right, self.up, self.down,
+                                                   self.column_of, self.sizes)
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        row = down[header]
+        while row != header:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                sizes[column_of[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def _uncover(self, header):
+        left, right, up, down, column_of, sizes = (self.left, self.right, self.up, self.down,
+                                                   self.column_of, self.sizes)
+        row = up[header]
+        while row != header:
+            node = left[row]
+            while node != row:
+                sizes[column_of[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def _choose(self):
+        """The primary column with the fewest rows left (the first one on ties), or 0 if none are left."""
+        right, sizes = self.right, self.sizes
+        best, best_size = 0, None
+        header = right[0]
+        while header:
+            size = sizes[header]
+            if best_size is None or size < best_size:
+                best, best_size = header, size
+                if size <= 1:
+                    break
+            header = right[header]
+        return best
+
+    def _select_row(self, row_index):
+        """Covers every column of a row, as if it had been chosen; returns False if the row is no longer available.
+
+        A row is unavailable once an earlier selection covered any of its
+        columns, which includes selecting the same row twice.
+        """
+        if not 0 <= row_index < len(self.rows):
+            raise ValueError(f"Row {row_index} is outside 0..{len(self.rows) - 1}")
+        if not self.rows[row_index]:
+            return True  # A row without columns covers nothing
+        right, column_of, selected = self.right, self.column_of, self.selected
+        start = self.row_start[row_index]
+        node = start
+        while True:
+            if selected[column_of[node]]:
+                return False
+            node = right[node]
+            if node == start:
+                break
+        while True:
+            header = column_of[node]
+            selected[header] = 1
+            self._cover(header)
+            node = right[node]
+            if node == start:
+                return True
+
+    def _unselect_row(self, row_index):
+        if not self.rows[row_index]:
+            return
+        start = self.row_start[row_index]
+        node = self.left[start]
+        while True:
+            header = self.column_of[node]
+            self._uncover(header)
+            self.selected[header] = 0
+            if node == start:
+                return
+            node = self.left[node]
+
+    def solutions(self, prefix=(), max_depth=None):
+        """Yields every exact cover as a list of row indices, starting with the rows of prefix.
+
+        With max_depth, partial solutions of that many rows beyond the prefix
+        are yielded instead of complete ones (complete covers found on the way
+        are yielded too). The structure is restored when the generator finishes
+        or is closed.
+        """
+        selected = []
+        try:
+            for row_index in prefix:
+                # A prefix listing a row twice would use its columns twice
+                if row_index in selected or not self._select_row(row_index):
+                    return
+                selected.append(row_index)
+            yield from self._search(list(prefix), max_depth)
+        finally:
+            for row_index in reversed(selected):
+                self._unselect_row(row_index)
+
+    def _search(self, chosen, max_depth):
+        # Iterative Algorithm X: stack[level] is the row node tried at that level
+        left, right, down, column_of, row_of = self.left, self.right, self.down, self.column_of, self.row_of
+        cover, uncover = self._cover, self._uncover
+        stack = []
+        self.nodes = 0
+        try:
+            header = self._choose()
+            while True:
+                self.nodes += 1
+                if header == 0 or (max_depth is not None and len(stack) == max_depth):
+                    yield chosen + [row_of[node] for node in stack]
+                    row = None  # Backtrack
+                elif not self.sizes[header]:
+                    row = None
+                else:
+                    cover(header)
+                    row = down[header]
+                # Take the next row at this level, backtracking through exhausted levels
+                while True:
+                    if row is None:
+                        if not stack:
+                            return
+                        row = stack.pop()
+                        node = left[row]
+                        while node != row:
+                            uncover(column_of[node])
+                            node = left[node]
+                        header = column_of[row]
+                        row = down[row]
+                    if row == header:
+                        uncover(header)
+                        row = None
+                        continue
+                    stack.append(row)
+                    node = right[row]
+                    while node != row:
+                        cover(column_of[node])
+                        node = right[node]
+                    break
+                header = self._choose()
+        finally:
+            # A generator closed early leaves its levels covered; undo them
+            while stack:
+                row = stack.pop()
+                node = left[row]
+                while node != row:
+                    uncover(column_of[node])
+                    node = left[node]
+                uncover(column_of[row])
+
+    def solve(self):
+        """Returns the first exact cover (a list of row indices), or None."""
+        return next(self.solutions(), None)
+
+    def count(self):
+        return sum(1 for _ in self.solutions())
+
+
+class ParallelExactCover:
+    """Splits the top levels of an ExactCover search across a process pool.
+
+    The calling process enumerates the partial solutions split_depth rows
+    deep; each becomes a task that a worker finishes from its own copy of the
+    problem, built once per process. Use as a context manager or call close().
+    """
+
+    def __init__(self, columns, rows, primary=None, workers=None, split_depth=SPLIT_DEPTH):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.problem = ExactCover(columns, rows, primary)
+        self.workers = workers
+        self.split_depth = split_depth
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            initargs=(columns, rows, primary))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def prefixes(self):
+        """Partial solutions split_depth rows deep, plus any complete ones found before that depth."""
+        return list(self.problem.solutions(max_depth=self.split_depth))
+
+    def solutions(self):
+        """Yields every exact cover, task by task as the workers finish them (not in sequential order)."""
+        futures = [self.executor.submit(_solve_prefix, prefix, False) for prefix in self.prefixes()]
+        for future in as_completed(futures):
+            yield from future.result()
+
+    def count(self):
+        futures = [self.executor.submit(_solve_prefix, prefix, True) for prefix in self.prefixes()]
+        return sum(future.result() for future in futures)
+
+
+# Per-process state set up by _init_worker
+_worker_problem = None
+
+
+def _init_worker(columns, rows, primary):
+    global _worker_problem
+    _worker_problem = ExactCover(columns, rows, primary)
+
+
+def _solve_prefix(prefix, count_only):
+    solutions = _worker_problem.solutions(prefix)
+    if count_only:
+        return sum(1 for _ in solutions)
+    return list(solutions)
+
+
+# Built-in problems
+
+def queens_cover(n):
+    """N-Queens as exact cover: row r holds the queen on square (r // n, r % n).
+
+    Ranks and files are primary columns; the 2n - 1 diagonals each way are
+    secondary. The ranks and files are listed from the middle outwards
+    (Knuth's "organ pipe" order), so ties in column size favour the most
+    constrained squares.
+    """
+    order = sorted(range(n), key=lambda line: abs(2 * line - n + 1))
+    position = {line: index for index, line in enumerate(order)}
+    rows = []
+    for rank in range(n):
+        for file in range(n):
+            rows.append([2 * position[rank], 2 * position[file] + 1,
+                         2 * n + rank + file, 4 * n - 1 + rank - file + n - 1])
+    return 6 * n - 2, rows, 2 * n
+
+
+def queens_solution(n, solution):
+    """The file of the queen on each rank, from a queens_cover solution."""
+    files = [None] * n
+    for row in solution:
+        files[row // n] = row % n
+    return files
+
+
+def sudoku_cover(puzzle):
+    """Sudoku as exact cover: each row puts one digit in one cell.
+
+    Columns say that each cell is filled and that each row, column and box
+    holds each digit. Given cells only get the row of their digit.
+    """
+    digits = [char for char in puzzle if char in '0123456789.']
+    if len(digits) != 81:
+        raise ValueError(f"A Sudoku has 81 cells, got {len(digits)}")
+    rows = []
+    for cell in range(81):
+        row, column = divmod(cell, 9)
+        box = row // 3 * 3 + column // 3
+        for digit in range(9):
+            if digits[cell] in '0.' or int(digits[cell]) == digit + 1:
+                rows.append([cell, 81 + row * 9 + digit, 162 + column * 9 + digit, 243 + box * 9 + digit])
+    return 324, rows, 324
+
+
+def sudoku_solution(rows, solution):
+    """The 81 digits of a sudoku_cover solution, cell by cell."""
+    values = [None] * 81
+    for row in solution:
+        cell, row_digit = rows[row][0], rows[row][1] - 81
+        values[cell] = row_digit % 9 + 1
+    return values
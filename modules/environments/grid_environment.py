@@ -1,33 +1,103 @@
 # modules/environments/grid_environment.py
 
 import random
+from itertools import compress
+
+from modules.utils.grid import Grid, WALL
+
+# Obstacle layouts are redrawn at most this many times when the start is walled into a region too small for the tasks
+MAX_LAYOUT_ATTEMPTS = 100
+# Tasks are drawn by rejection while at least 1/REJECTION_SAMPLING_SHARE of the cells can take one
+REJECTION_SAMPLING_SHARE = 4
+
+# Cost of stepping onto each kind of terrain; cells outside every patch are floor
+TERRAIN_COSTS = {'floor': 1, 'grass': 2, 'sand': 4, 'mud': 8}
+TERRAIN_PATCH_AREA = 40  # On average one terrain patch per this many cells
+MAX_PATCH_RADIUS = 3
+
 
 class GridEnvironment:
-    def __init__(self, size, num_tasks=5):
+    def __init__(self, size, num_tasks=5, seed=None, obstacle_density=0.2, terrain=False):
         self.size = size
         self.num_tasks = num_tasks
-        self.grid = [[0 for _ in range(size)] for _ in range(size)]
-        self.obstacles = []
+        self.seed = seed
+        self.obstacle_density = obstacle_density  # Fraction of the cells that become obstacles
+        self.terrain = terrain  # Cover the floor with patches of costlier terrain
+        # A seeded generator makes the environment reproducible without touching the global random state
+        self.random = random.Random(seed) if seed is not None else random
+        self.grid = Grid(size, size)
         self.tasks = []
         self.start_position = (0, 0)
         self.generate_environment()
 
     def generate_environment(self):
-        # Place obstacles randomly
-        num_obstacles = int(self.size * self.size * 0.2)  # 20% of the grid cells
-        while len(self.obstacles) < num_obstacles:
-            x = random.randint(0, self.size - 1)
-            y = random.randint(0, self.size - 1)
-            if self.grid[y][x] == 0 and (x, y) != self.start_position:
-                self.grid[y][x] = 1
-                self.obstacles.append((x, y))
-
-        # Place tasks randomly
-        while len(self.tasks) < self.num_tasks:
-            x = random.randint(0, self.size - 1)
-            y = random.randint(0, self.size - 1)
-            if self.grid[y][x] == 0 and (x, y) != self.start_position and (x, y) not in self.tasks:
-                self.tasks.append((x, y))
+        """Places the obstacles, then puts the tasks on free cells reachable from the start.
+
+        Raises ValueError if MAX_LAYOUT_ATTEMPTS layouts in a row leave fewer
+        free cells reachable from the start than there are tasks.
+        """
+        start_index = self.grid.index_of(self.start_position)
+        for attempt in range(MAX_LAYOUT_ATTEMPTS):
+            self.place_obstacles(start_index)
+            # One flood fill from the start labels every cell a task may go on
+            reachable = self.grid.reachable_mask(start_index)
+            reachable[start_index] = 0
+            if reachable.count(1) >= self.num_tasks:
+                break
+        else:
+            raise ValueError(f"No layout with obstacle density {self.obstacle_density} in {MAX_LAYOUT_ATTEMPTS} "
+                             f"attempts left {self.num_tasks} free cells reachable from the start")
+
+        chosen = self.sample_cells(reachable, self.num_tasks)
+        self.tasks = [self.grid.position_of(index) for index in chosen]
+        # Terrain is drawn last, so a seed gives the same walls and tasks with or without it
+        if self.terrain:
+            self.place_terrain()
+
+    def sample_cells(self, mask, count):
+        """Draws count distinct cells, uniformly and without replacement, among those set in mask."""
+        available = mask.count(1)
+        if available * REJECTION_SAMPLING_SHARE < len(mask):
+            return self.random.sample(list(compress(range(len(mask)), mask)), count)
+        # Most cells qualify, so drawing random cells until enough hit the mask beats listing them all
+        chosen = []
+        picked = set()
+        while len(chosen) < count:
+            index = self.random.randrange(len(mask))
+            if mask[index] and index not in picked:
+                picked.add(index)
+                chosen.append(index)
+        return chosen
+
+    def place_obstacles(self, start_index):
+        # Draw all obstacle cells at once, without replacement, from every cell except the start: the
+        # sample covers the other cell_count - 1 cells, and a free start cell is inserted afterwards
+        cell_count = self.size * self.size
+        num_obstacles = min(int(cell_count * self.obstacle_density), cell_count - 1)
+        others = bytearray(cell_count - 1)
+        for index in self.random.sample(range(cell_count - 1), num_obstacles):
+            others[index] = WALL
+        self.grid.cells[:] = others[:start_index] + bytes([0]) + others[start_index:]
+
+    @property
+    def obstacles(self):
+        """Positions of the obstacle cells, row by row."""
+        grid = self.grid
+        return [grid.position_of(index) for index in compress(range(len(grid.cells)), grid.cells)]
+
+    def place_terrain(self):
+        """Paints square patches of grass, sand and mud (random centers and radii) over the floor."""
+        size = self.size
+        costs = bytearray([TERRAIN_COSTS['floor']]) * (size * size)
+        patch_costs = [cost for name, cost in TERRAIN_COSTS.items() if name != 'floor']
+        for _ in range(max(1, size * size // TERRAIN_PATCH_AREA)):
+            cx, cy = self.random.randrange(size), self.random.randrange(size)
+            radius = self.random.randint(1, MAX_PATCH_RADIUS)
+            patch = bytes([self.random.choice(patch_costs)]) * (min(size, cx + radius + 1) - max(0, cx - radius))
+            for y in range(max(0, cy - radius), min(size, cy + radius + 1)):
+                start = y * size + max(0, cx - radius)
+                costs[start:start + len(patch)] = patch
+        self.grid.set_costs(costs)
 
     def get_grid(self):
         return self.grid
@@ -1,47 +1,66 @@
 # modules/environments/maze_environment.py
 
 import random
+from array import array
+
+from modules.utils.grid import Grid, FREE, WALL
+
+# Maze cells sit at odd (x, y) coordinates; the even rows and columns between them hold the walls.
+MAZE_ALGORITHMS = ('backtracker', 'kruskal', 'eller')
+
 
 class MazeEnvironment:
-    def __init__(self, width, height, complexity=0.75, density=0.75):
+    def __init__(self, width, height, complexity=0.75, density=0.75, seed=None, algorithm='backtracker'):
+        if algorithm not in MAZE_ALGORITHMS:
+            raise ValueError(f"Unknown maze algorithm: {algorithm}")
         self.width = width  # Number of cells horizontally
         self.height = height  # Number of cells vertically
-        self.grid = [[1 for _ in range(width)] for _ in range(height)]  # Initialize grid with walls
-        self.visited = [[False for _ in range(width)] for _ in range(height)]
         self.complexity = complexity
         self.density = density
+        self.seed = seed
+        self.algorithm = algorithm
+        self.entrance_position = (1, 0)  # Opening in the top border above the first maze cell
+        # Opening in the bottom border below the last maze cell column, or that cell itself when the maze
+        # has an even height and its last row holds cells
+        self.exit_position = (width - 2 if width % 2 else width - 1, height - 1)
+        # A seeded generator makes the maze reproducible without touching the global random state
+        self.random = random.Random(seed) if seed is not None else random
         self.generate_maze()
         self.add_additional_paths()
-        
-    def generate_maze(self):
-        def carve_passages_from(cx, cy):
-            directions = [('N', (0, -1)), ('S', (0, 1)), ('E', (1, 0)), ('W', (-1, 0))]
-            random.shuffle(directions)
-            self.visited[cy][cx] = True
-            self.grid[cy][cx] = 0  # Mark as passage
-
-            for direction, (dx, dy) in directions:
-                nx, ny = cx + dx * 2, cy + dy * 2
-                if 0 <= nx < self.width and 0 <= ny < self.height and not self.visited[ny][nx]:
-                    self.grid[cy + dy][cx + dx] = 0  # Remove wall between cells
-                    carve_passages_from(nx, ny)
 
-        # Start maze generation from the top-left corner (1,1)
-        carve_passages_from(1, 1)
+    def generate_maze(self):
+        self.grid = Grid(self.width, self.height, fill=WALL)  # Initialize grid with walls
+        if self.algorithm == 'eller':
+            cells = self.grid.cells
+            for y, row in enumerate(eller_rows(self.width, self.height, self.random)):
+                cells[y * self.width:(y + 1) * self.width] = row
+        elif self.algorithm == 'kruskal':
+            carve_kruskal(self.grid, self.random)
+        else:
+            carve_backtracker(self.grid, self.random)
 
-        # Ensure entrance and exit
-        self.grid[0][1] = 0  # Entrance
-        self.grid[self.height - 1][self.width - 2] = 0  # Exit
+        # Ensure entrance and exit. Both lie on a maze cell column, so they open a border wall or an
+        # already carved cell and never a wall between two cells, which would close a loop.
+        self.grid.cells[self.grid.index_of(self.entrance_position)] = FREE
+        self.grid.cells[self.grid.index_of(self.exit_position)] = FREE
 
     def add_additional_paths(self):
+        cells = self.grid.cells
+        width = self.width
+        # The walk below only carves into maze cells that are still walls. Every generator carves all
+        # of them, so unless a subclass leaves some uncarved the loop could not change anything.
+        if not any(WALL in cells[y * width + 1:(y + 1) * width:2] for y in range(1, self.height, 2)):
+            return
+
         # Adjust complexity and density relative to maze size
         complexity = int(self.complexity * (5 * (self.width + self.height)))
         density = int(self.density * ((self.width // 2) * (self.height // 2)))
+        rng = self.random
 
         for i in range(density):
-            x = random.randrange(1, self.width - 1, 2)
-            y = random.randrange(1, self.height - 1, 2)
-            self.grid[y][x] = 0
+            x = rng.randrange(1, self.width - 1, 2)
+            y = rng.randrange(1, self.height - 1, 2)
+            cells[y * width + x] = FREE
             for j in range(complexity):
                 neighbors = []
                 if x > 1:
@@ -53,11 +72,145 @@ class MazeEnvironment:
                 if y < self.height - 2:
                     neighbors.append((x, y + 2))
                 if neighbors:
-                    nx, ny = random.choice(neighbors)
-                    if self.grid[ny][nx] == 1:
-                        self.grid[ny][nx] = 0
-                        self.grid[ny + (y - ny) // 2][nx + (x - nx) // 2] = 0
+                    nx, ny = rng.choice(neighbors)
+                    if cells[ny * width + nx] == WALL:
+                        cells[ny * width + nx] = FREE
+                        cells[(ny + (y - ny) // 2) * width + nx + (x - nx) // 2] = FREE
                         x, y = nx, ny
 
     def get_grid(self):
         return self.grid
+
+
+def carve_backtracker(grid, rng=random):
+    """Carves a perfect maze into an all-wall grid with a randomized depth-first search.
+
+    The search keeps an explicit stack of flat indices instead of recursing, so the
+    maze size is not bounded by the recursion limit, and a maze cell counts as
+    visited once it has been carved (no separate visited array).
+    """
+    cells = grid.cells
+    width = grid.width
+    height = grid.height
+    if width < 2 or height < 2:
+        return
+    random_fraction = rng.random
+    double_width = 2 * width
+    last_row = len(cells) - double_width
+    start = width + 1  # Start maze generation from the top-left corner (1, 1)
+    cells[start] = FREE
+    stack = [start]
+    while stack:
+        current = stack[-1]
+        x = current % width
+        # Steps to the unvisited maze cells two moves away; the wall in between is half a step
+        steps = []
+        if x >= 2 and cells[current - 2]:
+            steps.append(-1)
+        if x + 2 < width and cells[current + 2]:
+            steps.append(1)
+        if current >= double_width and cells[current - double_width]:
+            steps.append(-width)
+        if current < last_row and cells[current + double_width]:
+            steps.append(width)
+        if not steps:
+            stack.pop()
+            continue
+        step = steps[int(random_fraction() * len(steps))] if len(steps) > 1 else steps[0]
+        cells[current + step] = FREE  # Remove wall between cells
+        current += 2 * step
+        cells[current] = FREE  # Mark as passage
+        stack.append(current)
+
+
+def carve_kruskal(grid, rng=random):
+    """Carves a perfect maze into an all-wall grid with randomized Kruskal's algorithm.
+
+    Every maze cell is opened at once, then the walls between neighboring cells are
+    visited in random order and removed whenever they separate two cells that are
+    not connected yet (tracked with a union-find over the maze cells).
+    """
+    cells = grid.cells
+    width = grid.width
+    height = grid.height
+    columns = width // 2
+    rows = height // 2
+    for y in range(1, height, 2):
+        cells[y * width + 1:y * width + 2 * columns:2] = bytes(columns)
+
+    # Each wall is stored as 2 * cell + direction, where cell numbers the maze cell to its left (direction 0)
+    # or above it (direction 1) as (y // 2) * columns + x // 2
+    walls = array('i')
+    for row in range(rows):
+        first = row * columns
+        walls.extend(range(2 * first, 2 * (first + columns - 1), 2))
+        if row < rows - 1:
+            walls.extend(range(2 * first + 1, 2 * (first + columns), 2))
+    rng.shuffle(walls)
+
+    parents = array('i', range(columns * rows))  # Union-find over the maze cells
+    for wall in walls:
+        a = cell = wall >> 1
+        b = a + columns if wall & 1 else a + 1
+        while parents[a] != a:
+            parents[a] = parents[parents[a]]  # Path halving
+            a = parents[a]
+        while parents[b] != b:
+            parents[b] = parents[parents[b]]
+            b = parents[b]
+        if a != b:
+            parents[b] = a
+            row, column = divmod(cell, columns)
+            index = (2 * row + 1) * width + 2 * column + 1
+            cells[index + width if wall & 1 else index + 1] = FREE
+
+
+def eller_rows(width, height, rng=random):
+    """Yields the rows of a perfect maze from top to bottom using Eller's algorithm.
+
+    Only the set membership of the current row is kept, so memory stays O(width)
+    and the maze can be streamed row by row without building the whole grid.
+    Each yielded row is a bytearray of width cells (FREE or WALL).
+    """
+    columns = width // 2
+    rows = height // 2
+    yield bytearray([WALL]) * width  # Top border
+    sets = list(range(columns))  # Set number of each maze cell in the current row
+    members = {column: [column] for column in range(columns)}
+    next_set = columns
+    for row_number in range(rows):
+        last = row_number == rows - 1
+        row = bytearray([WALL]) * width
+        row[1:2 * columns:2] = bytes(columns)
+        # Join neighbors from different sets at random; the last row joins all of them
+        for column in range(columns - 1):
+            a, b = sets[column], sets[column + 1]
+            if a != b and (last or rng.random() < 0.5):
+                row[2 * column + 2] = FREE
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for member in members[b]:
+                    sets[member] = a
+                members[a].extend(members.pop(b))
+        yield row
+
+        if 2 * row_number + 2 >= height:
+            break  # Even heights end on a row of cells
+        below = bytearray([WALL]) * width
+        if not last:
+            # Every set continues downwards at least once; the other cells below start new sets
+            next_sets = [-1] * columns
+            next_members = {}
+            for number, set_columns in members.items():
+                down = [column for column in set_columns if rng.random() < 0.5] or [rng.choice(set_columns)]
+                for column in down:
+                    below[2 * column + 1] = FREE
+                    next_sets[column] = number
+                next_members[number] = down
+            for column in range(columns):
+                if next_sets[column] < 0:
+                    next_sets[column] = next_set
+                    next_members[next_set] = [column]
+                    next_set += 1
+            sets, members = next_sets, next_members
+        yield below
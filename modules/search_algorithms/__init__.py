@@ -1,8 +1,18 @@
 # modules/search_algorithms/__init__.py
 
 from .uninformed_search import dfs, bfs, ucs
-from .informed_search import astar
-from .local_search import hill_climbing, simulated_annealing, generate_individual, fitness, crossover, mutate, select_population
+from .informed_search import astar, jps, bidirectional_astar
+from .incremental_search import DStarLite
+from .search_stats import SearchStats
+from .distance_matrix import DistanceMatrix
+from .tour_planner import plan_tour, Tour
+from .batch_search import solve_batch, solve_batches, QueryResult
+from .graph_search import graph_dfs, graph_bfs, graph_ucs, graph_astar, search_grid
+from .local_search import (hill_climbing, simulated_annealing, min_conflicts, QueensBoard,
+                           generate_individual, fitness, FitnessCache, crossover, mutate, select_population)
 
-__all__ = ['dfs', 'bfs', 'ucs', 'astar', 'hill_climbing', 'simulated_annealing',
-           'generate_individual', 'fitness', 'crossover', 'mutate', 'select_population']
+__all__ = ['dfs', 'bfs', 'ucs', 'astar', 'jps', 'bidirectional_astar', 'DStarLite', 'SearchStats',
+           'DistanceMatrix', 'plan_tour', 'Tour', 'solve_batch', 'solve_batches', 'QueryResult',
+           'graph_dfs', 'graph_bfs', 'graph_ucs', 'graph_astar', 'search_grid',
+           'hill_climbing', 'simulated_annealing', 'min_conflicts', 'QueensBoard',
+           'generate_individual', 'fitness', 'FitnessCache', 'crossover', 'mutate', 'select_population']
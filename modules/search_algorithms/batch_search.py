@@ -0,0 +1,123 @@
+# modules/search_algorithms/batch_search.py
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from modules.utils.grid import Grid
+from .search_core import as_grid
+from .uninformed_search import dfs, bfs, ucs
+from .informed_search import astar, jps, bidirectional_astar
+from .search_stats import SearchStats
+
+SEARCH_FUNCTIONS = {
+    'dfs': dfs,
+    'bfs': bfs,
+    'ucs': ucs,
+    'astar': astar,
+    'jps': jps,
+    'bidirectional_astar': bidirectional_astar,
+}
+
+
+class QueryResult:
+    """The outcome of one (start, goal) query from a batch."""
+
+    def __init__(self, grid_number, start, goal, path, wall_time, stats):
+        self.grid_number = grid_number  # Which grid of the batch the query ran on
+        self.start = start
+        self.goal = goal
+        self.path = path  # None if the goal is unreachable
+        self.wall_time = wall_time  # Seconds spent in the search function
+        self.stats = stats  # SearchStats of this query
+
+    def __repr__(self):
+        length = len(self.path) if self.path else None
+        return f"QueryResult(grid={self.grid_number}, start={self.start}, goal={self.goal}, path_length={length})"
+
+
+def solve_batch(queries, grid, algorithm='astar', workers=None, chunksize=None):
+    """Solves many (start, goal) queries on one grid. Results come back in query order."""
+    return solve_batches([(grid, queries)], algorithm, workers, chunksize)[0]
+
+
+def solve_batches(problems, algorithm='astar', workers=None, chunksize=None):
+    """Solves a list of (grid, queries) problems across a process pool.
+
+    Every grid is copied once into shared memory; each worker attaches to all of
+    them when it starts, so a query only pickles its grid number, start and goal
+    (and sends back its path and SearchStats).
+    Returns one list of QueryResult per problem, in the order the queries were given.
+    workers=1 runs everything in the calling process.
+    """
+    if algorithm not in SEARCH_FUNCTIONS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    grids = [as_grid(grid, (), max(len(grid), len(grid[0]))) for grid, _ in problems]
+    tasks = [(grid_number, start, goal)
+             for grid_number, (_, queries) in enumerate(problems) for (start, goal) in queries]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        search = SEARCH_FUNCTIONS[algorithm]
+        answers = [_run_query(search, grids, task) for task in tasks]
+    else:
+        if chunksize is None:
+            chunksize = max(1, len(tasks) // (workers * 4))
+        blocks = []
+        try:
+            descriptors = []
+            for grid in grids:
+                # Terrain costs, if any, follow the cells in the same block
+                weighted = grid.costs is not None
+                size = len(grid.cells)
+                block = shared_memory.SharedMemory(create=True, size=max(1, 2 * size if weighted else size))
+                block.buf[:size] = grid.cells
+                if weighted:
+                    block.buf[size:2 * size] = grid.costs
+                blocks.append(block)
+                descriptors.append((block.name, grid.width, grid.height, weighted))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(algorithm, descriptors)) as executor:
+                answers = list(executor.map(_solve_query, tasks, chunksize=chunksize))
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    results = [[] for _ in problems]
+    for (grid_number, start, goal), (path, wall_time, stats) in zip(tasks, answers):
+        results[grid_number].append(QueryResult(grid_number, start, goal, path, wall_time, stats))
+    return results
+
+
+# Per-process state set up once by _init_worker
+_worker_search = None
+_worker_grids = []
+_worker_blocks = []
+
+
+def _init_worker(algorithm, descriptors):
+    global _worker_search, _worker_grids, _worker_blocks
+    _worker_search = SEARCH_FUNCTIONS[algorithm]
+    # Workers share the parent's resource tracker, so attaching does not take ownership of the blocks
+    _worker_blocks = [shared_memory.SharedMemory(name=name) for name, _, _, _ in descriptors]
+    _worker_grids = []
+    for block, (_, width, height, weighted) in zip(_worker_blocks, descriptors):
+        size = width * height
+        costs = block.buf[size:2 * size] if weighted else None
+        _worker_grids.append(Grid.from_buffer(width, height, block.buf[:size], costs))
+
+
+def _solve_query(task):
+    return _run_query(_worker_search, _worker_grids, task)
+
+
+def _run_query(search, grids, task):
+    grid_number, start, goal = task
+    grid = grids[grid_number]
+    stats = SearchStats()
+    started = time.perf_counter()
+    path = search(start, goal, grid, (), max(grid.width, grid.height), stats=stats)
+    return path, time.perf_counter() - started, stats
@@ -0,0 +1,174 @@
+# modules/search_algorithms/batched_local_search.py
+
+import math
+
+import numpy as np
+
+from .search_core import as_grid
+
+# Batched versions of local_search.hill_climbing and simulated_annealing. Instead of
+# one trajectory, many independent chains walk the grid at once: every step moves
+# all of them with a handful of array operations, and the shortest route any chain
+# found is returned.
+
+# Temperature after step k of n for a start temperature t and a cooling rate r
+COOLING_SCHEDULES = {
+    'exponential': lambda t, r, k, n: t * r ** k,
+    'linear': lambda t, r, k, n: t * (1 - k / n),
+    'logarithmic': lambda t, r, k, n: t / math.log(k + 2),
+}
+
+
+def batched_hill_climbing(start, goal, grid, blocked_positions, grid_size, stats=None, chains=64, max_steps=None,
+                          seed=None):
+    """Stochastic hill climbing with random restarts, many chains at a time.
+
+    Each chain steps to a random neighbor that is closer to the goal (Manhattan
+    distance). A chain that reaches a local optimum starts over from the start,
+    until max_steps steps (default: 4 * grid_size) have been taken. Returns the
+    shortest path found, or None.
+    """
+    if max_steps is None:
+        max_steps = 4 * grid_size
+    return _run_chains(start, goal, grid, blocked_positions, grid_size, stats, chains, max_steps, seed,
+                       temperatures=None)
+
+
+def batched_simulated_annealing(start, goal, grid, blocked_positions, grid_size, stats=None, chains=64,
+                                max_steps=None, schedule='exponential', initial_temperature=1000,
+                                cooling_rate=0.99, seed=None):
+    """Simulated annealing with many independent chains that share one cooling schedule.
+
+    Each step every chain proposes a random neighbor and accepts it if it is
+    closer to the goal, or otherwise with probability exp(delta / temperature).
+    schedule names one of COOLING_SCHEDULES; cooling_rate is only used by the
+    exponential schedule. Chains run for max_steps steps (default: 50 * grid_size)
+    or until they reach the goal. Returns the shortest path found after removing
+    the loops from each chain's walk, or None.
+    """
+    if schedule not in COOLING_SCHEDULES:
+        raise ValueError(f"Unknown cooling schedule: {schedule}")
+    if max_steps is None:
+        max_steps = 50 * grid_size
+    cooling = COOLING_SCHEDULES[schedule]
+    temperatures = [cooling(initial_temperature, cooling_rate, step, max_steps) for step in range(max_steps)]
+    return _run_chains(start, goal, grid, blocked_positions, grid_size, stats, chains, max_steps, seed,
+                       temperatures=temperatures)
+
+
+def neighbor_table(grid):
+    """Returns a (cells, 4) array of the free neighbors of every cell (left, right, up, down), -1 where there is none."""
+    width, height = grid.width, grid.height
+    free = np.frombuffer(bytes(grid.cells), dtype=np.uint8).reshape(height, width) == 0
+    indices = np.arange(width * height, dtype=np.int32).reshape(height, width)
+    table = np.full((height, width, 4), -1, dtype=np.int32)
+    table[:, 1:, 0] = np.where(free[:, :-1], indices[:, :-1], -1)
+    table[:, :-1, 1] = np.where(free[:, 1:], indices[:, 1:], -1)
+    table[1:, :, 2] = np.where(free[:-1, :], indices[:-1, :], -1)
+    table[:-1, :, 3] = np.where(free[1:, :], indices[1:, :], -1)
+    return table.reshape(width * height, 4)
+
+
+def _run_chains(start, goal, grid, blocked_positions, grid_size, stats, chains, max_steps, seed, temperatures):
+    """Walks the chains for hill climbing (temperatures=None) or simulated annealing."""
+    if stats is not None:
+        stats.start()
+    grid = as_grid(grid, blocked_positions, grid_size)
+    if (not grid.in_bounds(start) or not grid.in_bounds(goal)
+            or not grid.is_passable(grid.index_of(start)) or not grid.is_passable(grid.index_of(goal))):
+        if stats is not None:
+            stats.finish()
+        return None
+    rng = np.random.default_rng(seed)
+    width = grid.width
+    start_index = grid.index_of(start)
+    goal_index = grid.index_of(goal)
+    neighbors = neighbor_table(grid)
+    y, x = np.divmod(np.arange(len(grid.cells), dtype=np.int32), width)
+    distance = np.abs(x - goal[0]) + np.abs(y - goal[1])  # Manhattan distance of every cell to the goal
+
+    everyone = np.arange(chains)
+    current = np.full(chains, start_index, dtype=np.int32)
+    history = np.empty((max_steps + 1, chains), dtype=np.int32)  # history[:lengths[c], c] is chain c's walk
+    history[0] = start_index
+    lengths = np.ones(chains, dtype=np.int64)
+    active = np.full(chains, start_index != goal_index)
+    expansions = 0
+
+    for step in range(max_steps):
+        moving = np.flatnonzero(active)
+        if not len(moving):
+            break
+        expansions += len(moving)
+        positions = current[moving]
+        candidates = neighbors[positions]
+        if temperatures is None:
+            # Only neighbors strictly closer to the goal are candidates
+            valid = (candidates >= 0) & (distance[candidates] < distance[positions][:, None])
+        else:
+            valid = candidates >= 0
+        counts = valid.sum(axis=1)
+
+        # Pick one valid candidate per chain uniformly: the k-th valid entry, k drawn below count
+        choice = (rng.random(len(moving)) * counts).astype(np.int64)
+        picked = np.argmax(valid.cumsum(axis=1) > choice[:, None], axis=1)
+        proposal = candidates[np.arange(len(moving)), picked]
+        stuck = counts == 0
+
+        if temperatures is None:
+            accept = ~stuck
+        else:
+            delta = distance[positions] - distance[proposal]
+            temperature = temperatures[step]
+            if temperature > 0:
+                chance = np.exp(np.minimum(delta, 0) / temperature)
+            else:
+                chance = (delta > 0).astype(float)
+            accept = ~stuck & ((delta > 0) | (rng.random(len(moving)) < chance))
+
+        movers = moving[accept]
+        current[movers] = proposal[accept]
+        history[lengths[movers], movers] = proposal[accept]
+        lengths[movers] += 1
+        active[movers[proposal[accept] == goal_index]] = False
+
+        if temperatures is None:
+            if not active.all() and start_index != goal_index:
+                break  # Every climb only moves closer to the goal, so the first one to arrive is a shortest path
+            # Random restart: chains stuck in a local optimum go back to the start
+            restarted = moving[stuck]
+            current[restarted] = start_index
+            lengths[restarted] = 1
+        else:
+            active[moving[stuck]] = False  # Walled in; only possible if the start has no free neighbor
+
+    if stats is not None:
+        stats.expansions += expansions
+        stats.max_frontier = max(stats.max_frontier, chains)
+
+    best = None
+    for chain in everyone[current == goal_index]:
+        path = _erase_loops(history[:lengths[chain], chain].tolist())
+        if best is None or len(path) < len(best):
+            best = path
+    if stats is not None:
+        stats.finish()
+    if best is None:
+        return None
+    return [(index % width, index // width) for index in best]
+
+
+def _erase_loops(walk):
+    """Removes every cycle from a walk of flat indices, leaving a simple path with the same ends."""
+    path = []
+    seen = {}
+    for index in walk:
+        position = seen.get(index)
+        if position is not None:
+            for removed in path[position + 1:]:
+                del seen[removed]
+            del path[position + 1:]
+        else:
+            seen[index] = len(path)
+            path.append(index)
+    return path
@@ -0,0 +1,126 @@
+# modules/search_algorithms/distance_matrix.py
+
+from .search_core import as_grid
+
+# Direction codes stored in each BFS tree: the move that leads one step closer to the root
+UNREACHED = 0
+ROOT = 5
+
+
+class DistanceMatrix:
+    """True grid distances and shortest paths between a fixed set of positions.
+
+    One breadth-first search is run from every position on the shared grid and
+    stops as soon as all other positions have been reached. Each search leaves
+    behind a one-byte-per-cell tree pointing towards its root, so after the
+    precomputation distances between positions are O(1) lookups and a shortest
+    path between two positions is a walk down a tree. Paths are cached the first
+    time they are requested. With stats given, each BFS reports into it as one
+    search, since the paths handed out later take no search of their own.
+    """
+
+    def __init__(self, grid, positions, blocked_positions=frozenset(), grid_size=None, stats=None):
+        if grid_size is None:
+            grid_size = max(len(grid), len(grid[0]))
+        self.grid = as_grid(grid, blocked_positions, grid_size)
+        self.positions = list(dict.fromkeys(positions))
+        self.position_numbers = {position: i for i, position in enumerate(self.positions)}
+        count = len(self.positions)
+        # distances[i][j] is the number of moves from positions[i] to positions[j], None if unreachable
+        self.distances = [[None] * count for _ in range(count)]
+        self.trees = []
+        self.path_cache = {}
+        self.stats = stats
+        for number in range(count):
+            self.trees.append(self.build_tree(number))
+
+    def build_tree(self, root_number):
+        """Runs one BFS from positions[root_number] and fills its column of the matrix."""
+        grid = self.grid
+        cells = grid.cells
+        width = grid.width
+        last_row = len(cells) - width
+        moves = bytearray(len(cells))
+        root = self.positions[root_number]
+        if not grid.in_bounds(root) or cells[grid.index_of(root)]:
+            return moves
+        # Flat index -> position number for the positions this BFS has to report
+        targets = {grid.index_of(position): number for number, position in enumerate(self.positions)
+                   if grid.in_bounds(position)}
+
+        stats = self.stats
+        if stats is not None:
+            stats.start()
+        root_index = grid.index_of(root)
+        moves[root_index] = ROOT
+        self.distances[root_number][root_number] = 0
+        remaining = len(targets) - 1
+        frontier = [root_index]
+        distance = 0
+        pushes = 1
+        while frontier and remaining:
+            distance += 1
+            next_frontier = []
+            queued = len(frontier)
+            for index in frontier:
+                if stats is not None:
+                    queued -= 1
+                    stats.expand(grid.position_of(index), queued + len(next_frontier))
+                x = index % width
+                # A cell discovered from its right neighbor has to move right (code 2) to get back, and so on
+                if x > 0 and not cells[index - 1] and not moves[index - 1]:
+                    moves[index - 1] = 2
+                    next_frontier.append(index - 1)
+                if x < width - 1 and not cells[index + 1] and not moves[index + 1]:
+                    moves[index + 1] = 1
+                    next_frontier.append(index + 1)
+                if index >= width and not cells[index - width] and not moves[index - width]:
+                    moves[index - width] = 4
+                    next_frontier.append(index - width)
+                if index < last_row and not cells[index + width] and not moves[index + width]:
+                    moves[index + width] = 3
+                    next_frontier.append(index + width)
+            for index in next_frontier:
+                number = targets.get(index)
+                if number is not None:
+                    self.distances[number][root_number] = distance
+                    remaining -= 1
+            pushes += len(next_frontier)
+            frontier = next_frontier
+        if stats is not None:
+            stats.finish(pushes)
+        return moves
+
+    def distance(self, origin, target):
+        """Returns the number of moves from origin to target, or None if the target is unreachable."""
+        return self.distances[self.position_numbers[origin]][self.position_numbers[target]]
+
+    def path(self, origin, target):
+        """Returns a shortest path from origin to target, including both ends, or None if there is none."""
+        key = (origin, target)
+        if key not in self.path_cache:
+            self.path_cache[key] = self.walk_tree(origin, target)
+        path = self.path_cache[key]
+        return list(path) if path is not None else None
+
+    def walk_tree(self, origin, target):
+        grid = self.grid
+        if self.distance(origin, target) is None:
+            return None
+        moves = self.trees[self.position_numbers[target]]
+        offsets = grid.neighbor_offsets
+        index = grid.index_of(origin)
+        path = [origin]
+        while moves[index] != ROOT:
+            index += offsets[moves[index] - 1]
+            path.append(grid.position_of(index))
+        return path
+
+    def nearest(self, origin, candidates):
+        """Returns the reachable candidate closest to origin by true distance (ties by position), or None."""
+        best = None
+        for candidate in candidates:
+            distance = self.distance(origin, candidate)
+            if distance is not None and (best is None or (distance, candidate) < best):
+                best = (distance, candidate)
+        return best[1] if best is not None else None
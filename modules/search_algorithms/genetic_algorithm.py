@@ -0,0 +1,281 @@
+# modules/search_algorithms/genetic_algorithm.py
+
+import multiprocessing
+import os
+import queue
+import time
+
+import numpy as np
+
+# Genetic algorithm for N-Queens that evolves the whole population as one (P, N) array.
+# Gene i of an individual is the row of the queen in column i, as in local_search.generate_individual.
+
+RESULT_POLL_INTERVAL = 0.1  # Seconds run_islands waits for a report before checking that the islands are alive
+
+
+def max_fitness(n):
+    """Fitness of a solution: the number of queen pairs, none of which may attack each other."""
+    return n * (n - 1) // 2
+
+
+def line_counts(population):
+    """Returns the number of queens on every line of every individual as a (P, 5N - 2) array.
+
+    Columns [0, N) count the rows, [N, 3N - 1) the falling diagonals (row - column)
+    and [3N - 1, 5N - 2) the rising diagonals (row + column). All of them come from
+    a single bincount over the whole population, with every individual offset into
+    its own block of bins.
+    """
+    size, n = population.shape
+    lines = 5 * n - 2
+    columns = np.arange(n)
+    offsets = (np.arange(size, dtype=np.intp) * lines)[:, None]
+    indices = np.empty((size, 3 * n), dtype=np.intp)
+    np.add(population, offsets, out=indices[:, :n])
+    np.add(population, offsets + (2 * n - 1) - columns, out=indices[:, n:2 * n])
+    np.add(population, offsets + (3 * n - 1) + columns, out=indices[:, 2 * n:])
+    return np.bincount(indices.ravel(), minlength=size * lines).reshape(size, lines)
+
+
+def population_fitness(population):
+    """Fitness of every individual: max_fitness(N) minus the number of attacking pairs.
+
+    A line holding k queens contributes k(k - 1)/2 attacking pairs. Every queen lies
+    on exactly three lines, so summed over the lines k(k - 1)/2 = (k² - k)/2 becomes
+    (sum of k² - 3N)/2, which costs O(N) per individual instead of comparing all pairs.
+    """
+    n = population.shape[1]
+    counts = line_counts(population)
+    return max_fitness(n) - (np.einsum('ij,ij->i', counts, counts) - 3 * n) // 2
+
+
+class QueensGA:
+    """Genetic algorithm for N-Queens with batched selection, crossover and mutation.
+
+    Every generation keeps the elite individuals, fills the rest of the population
+    with one-point crossovers of tournament winners and mutates the children. Besides
+    moving a queen to a random row, a child may instead move a random queen to the
+    row where it has the fewest conflicts (min_conflict_rate), which large boards
+    need to converge in a reasonable number of generations.
+
+    Usage: ga = QueensGA(64, population_size=10000, seed=1); solution = ga.run(1000)
+    """
+
+    def __init__(self, n=8, population_size=100, mutation_rate=0.1, min_conflict_rate=0.1, elite_size=2,
+                 tournament_size=3, seed=None):
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        if population_size < 2:
+            raise ValueError("population_size must be at least 2")
+        self.n = n
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.min_conflict_rate = min_conflict_rate
+        self.elite_size = min(elite_size, population_size)
+        self.tournament_size = tournament_size
+        self.rng = np.random.default_rng(seed)
+        self.max_fitness = max_fitness(n)
+        self.generation = 0
+        self.population = self.rng.integers(0, n, size=(population_size, n), dtype=np.int32)
+        self.fitness = population_fitness(self.population)
+
+    def best(self):
+        """Returns the fittest individual as a list of rows, and its fitness."""
+        index = int(self.fitness.argmax())
+        return self.population[index].tolist(), int(self.fitness[index])
+
+    def solved(self):
+        return int(self.fitness.max()) == self.max_fitness
+
+    def step(self):
+        """Replaces the population with the next generation."""
+        rng = self.rng
+        size = self.population_size
+        n = self.n
+        population = self.population
+        fitness = self.fitness
+        children = size - self.elite_size
+
+        # Tournament selection: each parent is the fittest of tournament_size random individuals
+        entrants = rng.integers(0, size, size=(2 * children, self.tournament_size))
+        winners = entrants[np.arange(2 * children), fitness[entrants].argmax(axis=1)]
+        first, second = population[winners[:children]], population[winners[children:]]
+
+        # One-point crossover: genes before the point come from the first parent
+        points = rng.integers(0, n + 1, size=children)
+        offspring = np.where(np.arange(n) < points[:, None], first, second)
+
+        # Random-reset mutation
+        mutated = np.flatnonzero(rng.random(children) < self.mutation_rate)
+        offspring[mutated, rng.integers(0, n, size=len(mutated))] = rng.integers(0, n, size=len(mutated))
+        if self.min_conflict_rate > 0:
+            self.min_conflict_mutation(offspring, np.flatnonzero(rng.random(children) < self.min_conflict_rate))
+
+        elite = np.argpartition(fitness, size - self.elite_size)[size - self.elite_size:] if self.elite_size else []
+        self.population = np.concatenate((population[elite], offspring))
+        self.fitness = population_fitness(self.population)
+        self.generation += 1
+
+    def min_conflict_mutation(self, population, selected):
+        """Moves one random queen of each selected individual to the row where it has the fewest conflicts."""
+        if not len(selected):
+            return
+        n = self.n
+        individuals = population[selected]
+        counts = line_counts(individuals)
+        count = len(selected)
+        everyone = np.arange(count)[:, None]
+        columns = self.rng.integers(0, n, size=count)[:, None]
+        current = individuals[everyone, columns]
+        # Take the queen off the board so it does not count against its own lines
+        counts[everyone, current] -= 1
+        counts[everyone, current - columns + (2 * n - 1)] -= 1
+        counts[everyone, current + columns + (3 * n - 1)] -= 1
+        candidates = np.arange(n)
+        conflicts = (counts[:, :n]
+                     + counts[everyone, candidates - columns + (2 * n - 1)]
+                     + counts[everyone, candidates + columns + (3 * n - 1)])
+        # Break ties at random so queens do not all pile onto the lowest free row
+        conflicts = conflicts + self.rng.random((count, n))
+        population[selected, columns[:, 0]] = conflicts.argmin(axis=1)
+
+    def emigrants(self, count):
+        """Returns copies of the count fittest individuals, to send to another population."""
+        count = min(count, self.population_size)
+        fittest = np.argpartition(self.fitness, self.population_size - count)[self.population_size - count:]
+        return self.population[fittest].copy()
+
+    def immigrate(self, individuals):
+        """Replaces the least fit individuals with the given ones."""
+        count = min(len(individuals), self.population_size)
+        if not count:
+            return
+        weakest = np.argpartition(self.fitness, count - 1)[:count]
+        self.population[weakest] = individuals[:count]
+        self.fitness[weakest] = population_fitness(self.population[weakest])
+
+    def run(self, max_generations=1000, time_limit=None):
+        """Evolves until a solution is found, max_generations have run or time_limit seconds have passed.
+
+        Returns the solution as a list of rows, or None.
+        """
+        started = time.perf_counter()
+        while not self.solved():
+            if self.generation >= max_generations:
+                return None
+            if time_limit is not None and time.perf_counter() - started >= time_limit:
+                return None
+            self.step()
+        return self.best()[0]
+
+
+class IslandResult:
+    """The outcome of an island-model run."""
+
+    def __init__(self, solution, island, generations, wall_time):
+        self.solution = solution  # Rows of the first solution found, or None
+        self.island = island  # Number of the island that found it, or None
+        self.generations = generations  # Generations each island completed
+        self.wall_time = wall_time  # Seconds from starting the islands until all of them stopped
+
+    @property
+    def generations_per_second(self):
+        """Generations completed by all islands together, per second of wall time."""
+        return sum(self.generations) / self.wall_time if self.wall_time > 0 else 0.0
+
+    def __repr__(self):
+        return (f"IslandResult(solved={self.solution is not None}, island={self.island}, "
+                f"generations={self.generations}, wall_time={self.wall_time:.3f}s)")
+
+
+def run_islands(n=8, islands=None, population_size=100, migration_interval=20, migrants=2, max_generations=1000,
+                time_limit=None, seed=None, **options):
+    """Evolves separate QueensGA populations (islands) in worker processes, with migration.
+
+    The islands form a ring: every migration_interval generations each island
+    sends copies of its migrants fittest individuals to the next one, where they
+    replace the least fit. Migration never blocks; an island takes in whatever
+    has arrived when it next migrates. As soon as one island finds a solution all
+    of them stop. options are passed on to QueensGA; island i is seeded with
+    seed + i. islands defaults to the number of CPUs, and islands=1 runs in the
+    calling process.
+    """
+    if islands is None:
+        islands = os.cpu_count() or 1
+    seeds = [None if seed is None else seed + island for island in range(islands)]
+    started = time.perf_counter()
+
+    if islands <= 1:
+        ga = QueensGA(n, population_size, seed=seeds[0], **options)
+        solution = ga.run(max_generations, time_limit)
+        return IslandResult(solution, 0 if solution is not None else None, [ga.generation],
+                            time.perf_counter() - started)
+
+    # Invalid options raise here instead of in every island process
+    QueensGA(n, population_size, **options)
+
+    inboxes = [multiprocessing.Queue() for _ in range(islands)]
+    results = multiprocessing.Queue()
+    stop = multiprocessing.Event()
+    workers = [multiprocessing.Process(target=_run_island,
+                                       args=(island, n, population_size, options, seeds[island], max_generations,
+                                             time_limit, migration_interval, migrants, inboxes[island],
+                                             inboxes[(island + 1) % islands], stop, results))
+               for island in range(islands)]
+    for worker in workers:
+        worker.start()
+    try:
+        reports = _collect_reports(workers, results)
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+    wall_time = time.perf_counter() - started
+
+    generations = [0] * islands
+    solution = island = None
+    for number, rows, generation in reports:
+        generations[number] = generation
+        if rows is not None and solution is None:
+            solution, island = rows, number  # Reports arrive in the order the islands stopped
+    return IslandResult(solution, island, generations, wall_time)
+
+
+def _collect_reports(workers, results):
+    """Waits for one report per island; raises RuntimeError if an island process dies without reporting."""
+    reports = []
+    while len(reports) < len(workers):
+        try:
+            reports.append(results.get(timeout=RESULT_POLL_INTERVAL))
+            continue
+        except queue.Empty:
+            pass
+        reported = {report[0] for report in reports}
+        for island, worker in enumerate(workers):
+            # An island that exits cleanly has put its report first, so only a failed exit loses it
+            if island not in reported and not worker.is_alive() and worker.exitcode != 0:
+                raise RuntimeError(f"Island {island} exited with code {worker.exitcode} without reporting")
+    return reports
+
+
+def _run_island(number, n, population_size, options, seed, max_generations, time_limit, migration_interval,
+                migrants, inbox, outbox, stop, results):
+    # Migrants left in the pipe when the run stops are not needed; do not wait for them to be read
+    outbox.cancel_join_thread()
+    ga = QueensGA(n, population_size, seed=seed, **options)
+    started = time.perf_counter()
+    while not ga.solved() and not stop.is_set() and ga.generation < max_generations:
+        if time_limit is not None and time.perf_counter() - started >= time_limit:
+            break
+        ga.step()
+        if migration_interval and ga.generation % migration_interval == 0:
+            outbox.put(ga.emigrants(migrants))
+            while True:
+                try:
+                    ga.immigrate(inbox.get_nowait())
+                except queue.Empty:
+                    break
+    solved = ga.solved()
+    if solved:
+        stop.set()
+    results.put((number, ga.best()[0] if solved else None, ga.generation))
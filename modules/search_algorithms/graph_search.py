@@ -0,0 +1,336 @@
+# modules/search_algorithms/graph_search.py
+
+from collections import deque
+import heapq
+from array import array
+
+from modules.utils.graph import grid_graph
+from .search_core import as_grid, new_parents, UNREACHED
+
+# The search algorithms over a CSRGraph. Vertices are numbers, paths are lists of
+# vertices, and neighbor lookups are slices of the graph's target array, so the
+# same code runs on grids (through grid_graph) and on graphs loaded from edge lists.
+# With stats given, expansions are recorded with the vertex number as position.
+# Graphs whose weights are small integers (every grid graph) keep their frontier in
+# a ring of buckets like the grid ucs and astar; other weights use a binary heap.
+
+INFINITY = float('inf')
+
+
+def graph_dfs(graph, source, target, stats=None):
+    if stats is not None:
+        stats.start()
+    offsets = graph.offsets
+    targets = graph.targets
+    parents = new_parents(graph.vertex_count)
+    # Each stack entry is (vertex, predecessor); the first time a vertex is popped fixes its predecessor
+    stack = [(source, source)]
+    pushes = 1
+    while stack:
+        (vertex, parent) = stack.pop()
+        if parents[vertex] == -1:
+            parents[vertex] = parent
+            if vertex == target:
+                if stats is not None:
+                    stats.finish(pushes)
+                return vertex_path(parents, target)
+            if stats is not None:
+                stats.expand(vertex, len(stack))
+            for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                stack.append((neighbor, vertex))
+                pushes += 1
+    if stats is not None:
+        stats.finish(pushes)
+    return None
+
+
+def graph_bfs(graph, source, target, stats=None):
+    """Fewest edges from source to target, ignoring weights."""
+    if stats is not None:
+        stats.start()
+    offsets = graph.offsets
+    targets = graph.targets
+    parents = new_parents(graph.vertex_count)
+    parents[source] = source
+    queue = deque([source])
+    pushes = 1
+    while queue:
+        vertex = queue.popleft()
+        if vertex == target:
+            if stats is not None:
+                stats.finish(pushes)
+            return vertex_path(parents, target)
+        if stats is not None:
+            stats.expand(vertex, len(queue))
+        for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+            if parents[neighbor] == -1:
+                parents[neighbor] = vertex
+                queue.append(neighbor)
+                pushes += 1
+    if stats is not None:
+        stats.finish(pushes)
+    return None
+
+
+def graph_ucs(graph, source, target, stats=None):
+    """Dijkstra's algorithm: the cheapest path by edge weight (every edge costs 1 on unweighted graphs)."""
+    bucket_weights = graph.bucket_weights()
+    if bucket_weights is not None:
+        return _bucket_ucs(graph, source, target, stats, *bucket_weights)
+    if stats is not None:
+        stats.start()
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    parents = new_parents(graph.vertex_count)
+    queue = [(0, source, source)]
+    pushes = 1
+    while queue:
+        (cost, vertex, parent) = heapq.heappop(queue)
+        if parents[vertex] == -1:
+            parents[vertex] = parent
+            if vertex == target:
+                if stats is not None:
+                    stats.finish(pushes)
+                return vertex_path(parents, target)
+            if stats is not None:
+                stats.expand(vertex, len(queue))
+            for edge in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = targets[edge]
+                if parents[neighbor] == -1:
+                    heapq.heappush(queue, (cost + (weights[edge] if weights is not None else 1), neighbor, vertex))
+                    pushes += 1
+    if stats is not None:
+        stats.finish(pushes)
+    return None
+
+
+def graph_astar(graph, source, target, stats=None, heuristic=None):
+    """A* over the graph. heuristic(vertex, target) must never overestimate the remaining cost.
+
+    Without a heuristic, graphs built from a grid use the Manhattan distance
+    (computed inline) and any other graph falls back to zero, i.e. Dijkstra.
+    Both are consistent integers, so with small integer weights the open set is
+    a ring of buckets indexed by f-score, as in the grid astar.
+    """
+    bucket_weights = graph.bucket_weights() if heuristic is None else None
+    if bucket_weights is not None:
+        return _bucket_astar(graph, source, target, stats, *bucket_weights)
+    width = graph.width
+    manhattan = heuristic is None and width is not None
+    if heuristic is None:
+        heuristic = _zero
+    target_x, target_y = (target % width, target // width) if manhattan else (0, 0)
+    if stats is not None:
+        stats.start()
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    size = graph.vertex_count
+    parents = new_parents(size)
+    parents[source] = source
+    g_scores = array('d', [INFINITY]) * size
+    g_scores[source] = 0
+    closed = bytearray(size) if stats is not None else None
+    if manhattan:
+        f_score = abs(source % width - target_x) + abs(source // width - target_y)
+    else:
+        f_score = heuristic(source, target)
+    open_set = [(f_score, 0, source)]
+    pushes = 1
+    reopenings = 0
+    while open_set:
+        (f_score, g_score, current) = heapq.heappop(open_set)
+        if current == target:
+            if stats is not None:
+                stats.finish(pushes, reopenings)
+            return vertex_path(parents, target)
+        if g_score > g_scores[current]:
+            continue  # Stale entry, the vertex was pushed again with a lower cost
+        if stats is not None:
+            if closed[current]:
+                reopenings += 1
+            closed[current] = 1
+            stats.expand(current, len(open_set))
+
+        for edge in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[edge]
+            tentative_g_score = g_score + (weights[edge] if weights is not None else 1)
+            if tentative_g_score < g_scores[neighbor]:
+                g_scores[neighbor] = tentative_g_score
+                parents[neighbor] = current
+                if manhattan:
+                    f_score = tentative_g_score + abs(neighbor % width - target_x) + abs(neighbor // width - target_y)
+                else:
+                    f_score = tentative_g_score + heuristic(neighbor, target)
+                heapq.heappush(open_set, (f_score, tentative_g_score, neighbor))
+                pushes += 1
+    if stats is not None:
+        stats.finish(pushes, reopenings)
+    return None
+
+
+def _bucket_ucs(graph, source, target, stats, weights, max_weight):
+    """graph_ucs with a ring of max_weight + 1 buckets indexed by path cost (Dial's algorithm)."""
+    if stats is not None:
+        stats.start()
+    offsets = graph.offsets
+    targets = graph.targets
+    size = graph.vertex_count
+    ring = max_weight + 1  # Every pending vertex costs between the current cost and max_weight more
+    buckets = [[] for _ in range(ring)]
+    parents = new_parents(size)
+    parents[source] = source
+    distances = array('i', [UNREACHED]) * size
+    distances[source] = 0
+    buckets[0].append(source)
+    pending = 1
+    pushes = 1
+    cost = 0
+    while pending:
+        bucket = buckets[cost % ring]
+        while bucket:
+            vertex = bucket.pop()
+            pending -= 1
+            if distances[vertex] != cost:
+                continue  # Stale entry, the vertex was pushed again with a lower cost
+            if vertex == target:
+                if stats is not None:
+                    stats.finish(pushes)
+                return vertex_path(parents, target)
+            if stats is not None:
+                stats.expand(vertex, pending)
+            if weights is None:
+                new_cost = cost + 1
+                next_bucket = buckets[new_cost % ring]
+                for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                    if new_cost < distances[neighbor]:
+                        distances[neighbor] = new_cost
+                        parents[neighbor] = vertex
+                        next_bucket.append(neighbor)
+                        pending += 1
+                        pushes += 1
+            else:
+                for edge in range(offsets[vertex], offsets[vertex + 1]):
+                    neighbor = targets[edge]
+                    new_cost = cost + weights[edge]
+                    if new_cost < distances[neighbor]:
+                        distances[neighbor] = new_cost
+                        parents[neighbor] = vertex
+                        buckets[new_cost % ring].append(neighbor)
+                        pending += 1
+                        pushes += 1
+        cost += 1
+    if stats is not None:
+        stats.finish(pushes)
+    return None
+
+
+def _bucket_astar(graph, source, target, stats, weights, max_weight):
+    """graph_astar with the default heuristic and a ring of max_weight + 2 buckets indexed by f-score.
+
+    Each bucket is popped last in, first out, which breaks ties toward the
+    vertices pushed most recently, i.e. deeper along the path.
+    """
+    width = graph.width
+    manhattan = width is not None
+    target_x, target_y = (target % width, target // width) if manhattan else (0, 0)
+    if stats is not None:
+        stats.start()
+    offsets = graph.offsets
+    targets = graph.targets
+    size = graph.vertex_count
+    ring = max_weight + 2
+    buckets = [[] for _ in range(ring)]
+    parents = new_parents(size)
+    parents[source] = source
+    g_scores = array('i', [UNREACHED]) * size
+    g_scores[source] = 0
+    closed = bytearray(size) if stats is not None else None
+    f_score = abs(source % width - target_x) + abs(source // width - target_y) if manhattan else 0
+    buckets[f_score % ring].append(source)
+    pending = 1
+    pushes = 1
+    reopenings = 0
+    while pending:
+        bucket = buckets[f_score % ring]
+        while bucket:
+            current = bucket.pop()
+            pending -= 1
+            g_score = g_scores[current]
+            if manhattan:
+                if g_score + abs(current % width - target_x) + abs(current // width - target_y) != f_score:
+                    continue  # Stale entry, the vertex was pushed again with a lower score
+            elif g_score != f_score:
+                continue
+            if current == target:
+                if stats is not None:
+                    stats.finish(pushes, reopenings)
+                return vertex_path(parents, target)
+            if stats is not None:
+                if closed[current]:
+                    reopenings += 1
+                closed[current] = 1
+                stats.expand(current, pending)
+
+            for edge in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[edge]
+                tentative_g_score = g_score + weights[edge] if weights is not None else g_score + 1
+                if tentative_g_score < g_scores[neighbor]:
+                    g_scores[neighbor] = tentative_g_score
+                    parents[neighbor] = current
+                    if manhattan:
+                        neighbor_f_score = (tentative_g_score + abs(neighbor % width - target_x)
+                                            + abs(neighbor // width - target_y))
+                    else:
+                        neighbor_f_score = tentative_g_score
+                    buckets[neighbor_f_score % ring].append(neighbor)
+                    pending += 1
+                    pushes += 1
+        f_score += 1
+    if stats is not None:
+        stats.finish(pushes, reopenings)
+    return None
+
+
+GRAPH_SEARCH_FUNCTIONS = {
+    'dfs': graph_dfs,
+    'bfs': graph_bfs,
+    'ucs': graph_ucs,
+    'astar': graph_astar,
+}
+
+
+def search_grid(algorithm, start, goal, grid, blocked_positions, grid_size, stats=None):
+    """Runs one of GRAPH_SEARCH_FUNCTIONS on the cached CSRGraph of a grid.
+
+    Takes the same arguments as the grid searches (after the algorithm name) and
+    returns the path as (x, y) positions. The graph is built once per grid
+    contents, so repeated searches on an unchanged grid skip the conversion.
+    """
+    grid = as_grid(grid, blocked_positions, grid_size)
+    if not grid.in_bounds(start) or not grid.in_bounds(goal):
+        return None
+    graph = grid_graph(grid)
+    source = graph.vertex_of(start)
+    if grid.cells[source]:
+        return None
+    path = GRAPH_SEARCH_FUNCTIONS[algorithm](graph, source, graph.vertex_of(goal), stats)
+    if path is None:
+        return None
+    return [graph.key_of(vertex) for vertex in path]
+
+
+def vertex_path(parents, target):
+    """Follows the predecessor array back from target and returns the vertices from the source."""
+    path = [target]
+    vertex = target
+    while parents[vertex] != vertex:
+        vertex = parents[vertex]
+        path.append(vertex)
+    path.reverse()
+    return path
+
+
+def _zero(vertex, target):
+    return 0
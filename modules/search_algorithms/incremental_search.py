@@ -0,0 +1,234 @@
+# modules/search_algorithms/incremental_search.py
+
+import heapq
+from array import array
+
+from modules.utils.grid import WALL
+from .search_core import as_grid
+
+UNREACHED = 2 ** 31 - 1
+
+
+class DStarLite:
+    """D* Lite planner that keeps its search state between calls.
+
+    The search runs backwards from the goal, so g[cell] is the true cost from a
+    cell to the goal and the path from the agent's current position is read off
+    by walking downhill in g. As in the other searches, a move costs the terrain
+    cost of the cell stepped onto (1 on grids without terrain). When cells are blocked or freed later (through
+    blocked_positions, the same argument every search takes) only the cells whose
+    distance actually changes are expanded again, and the agent can keep moving
+    between calls without throwing the search away.
+
+    Usage: plan once with replan(), then call replan(position, blocked_positions)
+    whenever the agent has moved or the set of dynamic obstacles has changed.
+    """
+
+    def __init__(self, start, goal, grid, blocked_positions=frozenset(), grid_size=None, stats=None):
+        if grid_size is None:
+            grid_size = max(len(grid), len(grid[0]))
+        self.base = as_grid(grid, (), grid_size)  # Static walls; never modified
+        self.grid = self.base.copy()  # Static walls plus the current dynamic obstacles
+        self.start = start
+        self.goal = goal
+        self.stats = stats
+        self.blocked_positions = set()
+        size = len(self.grid.cells)
+        self.g_scores = array('i', [UNREACHED]) * size
+        self.rhs = array('i', [UNREACHED]) * size  # One-step lookahead values of g
+        self.expanded = bytearray(size)  # Cells expanded at least once, for counting reopenings
+        self.open_set = []
+        self.key_modifier = 0  # km: how far the heuristic's origin has drifted since the first plan
+        self.last_start = start
+        self.pushes = 0
+        self.goal_index = self.grid.index_of(goal) if self.grid.in_bounds(goal) else None
+        if self.goal_index is not None:
+            self.rhs[self.goal_index] = 0
+            self.push(self.goal_index)
+        self.apply_blocked(blocked_positions)
+
+    def replan(self, position=None, blocked_positions=None):
+        """Moves the start to position, applies the new set of blocked positions and repairs the plan.
+
+        blocked_positions is the full set of dynamic obstacles; only the cells that
+        differ from the previous call are updated. Returns the path from position
+        to the goal (both included), or None if the goal cannot be reached.
+        """
+        if position is not None and position != self.start:
+            self.start = position
+            # Old keys were computed with a heuristic from last_start; raising km keeps them lower bounds
+            self.key_modifier += self.heuristic(self.last_start)
+            self.last_start = position
+        if blocked_positions is not None:
+            self.apply_blocked(blocked_positions)
+        if self.goal_index is None or not self.grid.in_bounds(self.start):
+            return None
+        self.compute_shortest_path()
+        return self.path()
+
+    def apply_blocked(self, blocked_positions):
+        """Updates the grid to a new set of dynamic obstacles and marks the affected cells inconsistent."""
+        blocked_positions = set(blocked_positions)
+        grid = self.grid
+        changed = []
+        for position in blocked_positions.symmetric_difference(self.blocked_positions):
+            if not grid.in_bounds(position):
+                continue
+            index = grid.index_of(position)
+            value = WALL if position in blocked_positions else self.base.cells[index]
+            if grid.cells[index] != value:
+                grid.cells[index] = value
+                changed.append(index)
+        self.blocked_positions = blocked_positions
+
+        # A flipped cell changes the cost of the edges to its neighbors, so both ends need new rhs values
+        for index in changed:
+            self.update_vertex(index)
+            for neighbor in self.adjacent(index):
+                self.update_vertex(neighbor)
+        return changed
+
+    def compute_shortest_path(self):
+        grid = self.grid
+        cells = grid.cells
+        costs = grid.costs
+        width = grid.width
+        g_scores = self.g_scores
+        rhs = self.rhs
+        open_set = self.open_set
+        stats = self.stats
+        start_x, start_y = self.start
+        start_index = grid.index_of(self.start)
+        key_modifier = self.key_modifier
+        heappush = heapq.heappush
+        pushes_before = self.pushes
+        pushes = 0  # Pushes made directly in this loop; update_vertex counts its own in self.pushes
+        reopenings = 0
+        if stats is not None:
+            stats.start()
+
+        while open_set:
+            top_f, top_distance, current = open_set[0]
+            g_score = g_scores[current]
+            rhs_score = rhs[current]
+            if g_score == rhs_score:
+                heapq.heappop(open_set)  # Stale entry, the cell became consistent after it was pushed
+                continue
+            # Same as calculate_key(current), inlined because this runs for every popped entry
+            distance = g_score if g_score < rhs_score else rhs_score
+            current_key = (distance + abs(current % width - start_x) + abs(current // width - start_y) + key_modifier,
+                           distance)
+            if (top_f, top_distance) < current_key:
+                # Pushed before km grew or before its values changed; requeue it with the up-to-date key
+                heapq.heapreplace(open_set, current_key + (current,))
+                pushes += 1
+                continue
+            start_distance = min(g_scores[start_index], rhs[start_index])
+            if (current_key >= (start_distance + key_modifier, start_distance)
+                    and rhs[start_index] == g_scores[start_index]):
+                break
+            heapq.heappop(open_set)
+            if stats is not None:
+                if self.expanded[current]:
+                    reopenings += 1
+                self.expanded[current] = 1
+                stats.expand(grid.position_of(current), len(open_set))
+
+            if g_score > rhs_score:
+                # Overconsistent: the cell got closer to the goal, settle it and relax its neighbors
+                g_scores[current] = rhs_score
+                if cells[current]:
+                    continue  # Only a blocked goal can get here; nothing may route through it
+                # Every neighbor reaches the goal through this cell by stepping onto it
+                distance = rhs_score + costs[current] if costs is not None else rhs_score + 1
+                for neighbor in grid.neighbors(current):
+                    if distance < rhs[neighbor]:
+                        rhs[neighbor] = distance
+                        if g_scores[neighbor] != distance:
+                            heappush(open_set, (distance + abs(neighbor % width - start_x)
+                                                + abs(neighbor // width - start_y) + key_modifier,
+                                                distance, neighbor))
+                            pushes += 1
+            else:
+                # Underconsistent: the cell got farther away, so every neighbor that relied on it needs a new rhs
+                old_distance = g_score + costs[current] if costs is not None else g_score + 1
+                g_scores[current] = UNREACHED
+                self.update_vertex(current)
+                for neighbor in grid.neighbors(current):
+                    if rhs[neighbor] == old_distance:
+                        self.update_vertex(neighbor)
+
+        self.pushes += pushes
+        if stats is not None:
+            stats.finish(self.pushes - pushes_before, reopenings)
+
+    def update_vertex(self, index):
+        """Recomputes rhs from the neighbors' g values and step costs and queues the cell if it is inconsistent."""
+        g_scores = self.g_scores
+        if index != self.goal_index:
+            best = UNREACHED
+            if not self.grid.cells[index]:
+                costs = self.grid.costs
+                for neighbor in self.grid.neighbors(index):
+                    if g_scores[neighbor] < UNREACHED:
+                        distance = g_scores[neighbor] + (costs[neighbor] if costs is not None else 1)
+                        if distance < best:
+                            best = distance
+            self.rhs[index] = best
+        if g_scores[index] != self.rhs[index]:
+            self.push(index)
+
+    def push(self, index):
+        heapq.heappush(self.open_set, self.calculate_key(index) + (index,))
+        self.pushes += 1
+
+    def calculate_key(self, index):
+        distance = min(self.g_scores[index], self.rhs[index])
+        return (distance + self.heuristic(self.grid.position_of(index)) + self.key_modifier, distance)
+
+    def heuristic(self, position):
+        """Manhattan distance from the current start, which is where the backward search is heading.
+
+        Every move costs at least 1, so it never overestimates on terrain either.
+        """
+        return abs(position[0] - self.start[0]) + abs(position[1] - self.start[1])
+
+    def adjacent(self, index):
+        """Returns the in-bounds neighbors of a flat index, walls included."""
+        width = self.grid.width
+        x = index % width
+        adjacent = []
+        if x > 0:
+            adjacent.append(index - 1)
+        if x < width - 1:
+            adjacent.append(index + 1)
+        if index >= width:
+            adjacent.append(index - width)
+        if index < len(self.grid.cells) - width:
+            adjacent.append(index + width)
+        return adjacent
+
+    def path(self):
+        """Walks from the start to the goal, always stepping to the neighbor with the smallest step cost plus g."""
+        grid = self.grid
+        costs = grid.costs
+        g_scores = self.g_scores
+        index = grid.index_of(self.start)
+        if grid.cells[index] or self.rhs[index] == UNREACHED:
+            return None
+        path = [self.start]
+        for _ in range(len(grid.cells)):
+            if index == self.goal_index:
+                return path
+            best = None
+            best_distance = UNREACHED
+            for neighbor in grid.neighbors(index):
+                if g_scores[neighbor] < UNREACHED:
+                    distance = g_scores[neighbor] + (costs[neighbor] if costs is not None else 1)
+                    if distance < best_distance:
+                        best, best_distance = neighbor, distance
+            if best is None:
+                return None
+            index = best
+            path.append(grid.position_of(index))
+        return None
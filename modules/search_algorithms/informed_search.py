@@ -1,47 +1,312 @@
 # modules/search_algorithms/informed_search.py
 
 import heapq
+from array import array
 
+from .search_core import as_grid, new_parents, reconstruct_path, UNREACHED
 
-def astar(start, goal, grid, blocked_positions, grid_size):
-    open_set = []
-    heapq.heappush(open_set, (0, start, [start]))
-    g_scores = {start: 0}
-    f_scores = {start: heuristic(start, goal)}
+
+def astar(start, goal, grid, blocked_positions, grid_size, stats=None):
+    """A* with the Manhattan distance over the cells' traversal costs (1 per move without terrain).
+
+    Costs are at least 1, so the heuristic stays consistent and the f-score of
+    a pushed cell lies between the current f-score and max_cost + 1 above it.
+    The open set is therefore a ring of max_cost + 2 buckets indexed by f-score.
+    Each bucket is a heap of x * height + y, so cells with equal f-scores are
+    expanded in (x, y) order, the tie-break of the heap of (f, position, path)
+    entries this replaced, and the same path is returned.
+    """
+    grid = as_grid(grid, blocked_positions, grid_size)
+    width = grid.width
+    if not grid.in_bounds(start) or not grid.in_bounds(goal):
+        return None
+    if stats is not None:
+        stats.start()
+    start_index = grid.index_of(start)
+    goal_index = grid.index_of(goal)
+    goal_x, goal_y = goal
+    height = grid.height
+    costs = grid.costs
+    ring = grid.max_cost + 2
+    buckets = [[] for _ in range(ring)]
+    parents = new_parents(len(grid.cells))
+    parents[start_index] = start_index
+    g_scores = array('i', [UNREACHED]) * len(grid.cells)
+    g_scores[start_index] = 0
+    f_score = heuristic(start, goal)
+    buckets[f_score % ring].append(start[0] * height + start[1])
+    closed = bytearray(len(grid.cells)) if stats is not None else None
+    heappush, heappop = heapq.heappush, heapq.heappop
+    pending = 1
+    pushes = 1
+    reopenings = 0
+
+    while pending:
+        bucket = buckets[f_score % ring]
+        while bucket:
+            key = heappop(bucket)
+            x = key // height
+            y = key - x * height
+            current = y * width + x
+            pending -= 1
+            g_score = g_scores[current]
+            if g_score + abs(x - goal_x) + abs(y - goal_y) != f_score:
+                continue  # Stale entry, the cell was pushed again with a lower score
+            if current == goal_index:
+                if stats is not None:
+                    stats.finish(pushes, reopenings)
+                return reconstruct_path(parents, goal_index, width)
+            if stats is not None:
+                if closed[current]:
+                    reopenings += 1
+                closed[current] = 1
+                stats.expand(grid.position_of(current), pending)
+
+            for neighbor in grid.neighbors(current):
+                tentative_g_score = g_score + costs[neighbor] if costs is not None else g_score + 1
+                if tentative_g_score < g_scores[neighbor]:
+                    g_scores[neighbor] = tentative_g_score
+                    parents[neighbor] = current
+                    neighbor_x, neighbor_y = neighbor % width, neighbor // width
+                    neighbor_f_score = tentative_g_score + abs(neighbor_x - goal_x) + abs(neighbor_y - goal_y)
+                    heappush(buckets[neighbor_f_score % ring], neighbor_x * height + neighbor_y)
+                    pending += 1
+                    pushes += 1
+        f_score += 1
+    if stats is not None:
+        stats.finish(pushes, reopenings)
+    return None
+
+
+def jps(start, goal, grid, blocked_positions, grid_size, stats=None):
+    """Jump Point Search for 4-connected grids.
+
+    Straight runs are skipped with jump(); only jump points (the goal, cells with a
+    forced neighbor, and vertical cells from which a horizontal jump succeeds) are
+    pushed to the open set. Returns an optimal path of the same length as astar.
+    Skipping cells is only sound when every move costs the same, so grids with
+    terrain costs are searched with astar instead.
+    """
+    grid = as_grid(grid, blocked_positions, grid_size)
+    if grid.costs is not None:
+        return astar(start, goal, grid, (), grid_size, stats)
+    width = grid.width
+    if not grid.in_bounds(start) or not grid.in_bounds(goal):
+        return None
+    if stats is not None:
+        stats.start()
+    start_index = grid.index_of(start)
+    goal_index = grid.index_of(goal)
+    goal_x, goal_y = goal
+    parents = new_parents(len(grid.cells))
+    parents[start_index] = start_index
+    g_scores = array('i', [UNREACHED]) * len(grid.cells)
+    g_scores[start_index] = 0
+    open_set = [(heuristic(start, goal), start_index)]
+    closed = bytearray(len(grid.cells)) if stats is not None else None
+    pushes = 1
+    reopenings = 0
 
     while open_set:
-        (_, current, path) = heapq.heappop(open_set)
-        if current == goal:
-            return path
-
-        neighbors = get_neighbors(current, grid, blocked_positions, grid_size)
-        for neighbor in neighbors:
-            tentative_g_score = g_scores[current] + 1
-            if neighbor in blocked_positions:
+        (f_score, current) = heapq.heappop(open_set)
+        if current == goal_index:
+            if stats is not None:
+                stats.finish(pushes, reopenings)
+            return expand_jump_path(parents, goal_index, width)
+        x, y = current % width, current // width
+        if f_score > g_scores[current] + abs(x - goal_x) + abs(y - goal_y):
+            continue  # Stale entry
+        if stats is not None:
+            if closed[current]:
+                reopenings += 1
+            closed[current] = 1
+            stats.expand((x, y), len(open_set))
+
+        for (dx, dy) in pruned_directions(grid, current, parents[current]):
+            jump_point = jump(grid, current, dx, dy, goal_index)
+            if jump_point == -1:
                 continue
-            if neighbor not in g_scores or tentative_g_score < g_scores[neighbor]:
-                g_scores[neighbor] = tentative_g_score
-                f_score = tentative_g_score + heuristic(neighbor, goal)
-                f_scores[neighbor] = f_score
-                heapq.heappush(open_set, (f_score, neighbor, path + [neighbor]))
+            jx, jy = jump_point % width, jump_point // width
+            tentative_g_score = g_scores[current] + abs(jx - x) + abs(jy - y)
+            if tentative_g_score < g_scores[jump_point]:
+                g_scores[jump_point] = tentative_g_score
+                parents[jump_point] = current
+                heapq.heappush(open_set, (tentative_g_score + abs(jx - goal_x) + abs(jy - goal_y), jump_point))
+                pushes += 1
+    if stats is not None:
+        stats.finish(pushes, reopenings)
     return None
 
 
+def pruned_directions(grid, index, parent):
+    """Returns the directions worth jumping in from index given the jump point it was reached from."""
+    cells = grid.cells
+    width = grid.width
+    x, y = index % width, index // width
+    if parent == index:
+        # The start node expands in every direction
+        candidates = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    else:
+        px, py = parent % width, parent // width
+        if px != x:
+            dx = 1 if x > px else -1
+            candidates = [(0, -1), (0, 1), (dx, 0)]
+        else:
+            dy = 1 if y > py else -1
+            candidates = [(-1, 0), (1, 0), (0, dy)]
+    directions = []
+    for (dx, dy) in candidates:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < width and 0 <= ny < grid.height and not cells[ny * width + nx]:
+            directions.append((dx, dy))
+    return directions
+
+
+def jump(grid, index, dx, dy, goal_index):
+    """Steps from index in direction (dx, dy) and returns the next jump point, or -1 if there is none."""
+    cells = grid.cells
+    width = grid.width
+    height = grid.height
+    x, y = index % width, index // width
+    while True:
+        x += dx
+        y += dy
+        if not (0 <= x < width and 0 <= y < height):
+            return -1
+        index = y * width + x
+        if cells[index]:
+            return -1
+        if index == goal_index:
+            return index
+        if dx:
+            # Horizontal move: a free cell above or below whose predecessor column is walled is forced
+            if y > 0 and not cells[index - width] and cells[index - width - dx]:
+                return index
+            if y < height - 1 and not cells[index + width] and cells[index + width - dx]:
+                return index
+        else:
+            # Vertical move: a free cell left or right whose predecessor row is walled is forced
+            if x > 0 and not cells[index - 1] and cells[index - 1 - dy * width]:
+                return index
+            if x < width - 1 and not cells[index + 1] and cells[index + 1 - dy * width]:
+                return index
+            # Vertical moves also stop where a horizontal jump would find something
+            if jump(grid, index, 1, 0, goal_index) != -1 or jump(grid, index, -1, 0, goal_index) != -1:
+                return index
+
+
+def expand_jump_path(parents, goal_index, width):
+    """Rebuilds the cell-by-cell path from a chain of jump points joined by straight segments."""
+    jump_points = reconstruct_path(parents, goal_index, width)
+    path = [jump_points[0]]
+    for (x2, y2) in jump_points[1:]:
+        x, y = path[-1]
+        dx = (x2 > x) - (x2 < x)
+        dy = (y2 > y) - (y2 < y)
+        while (x, y) != (x2, y2):
+            x += dx
+            y += dy
+            path.append((x, y))
+    return path
+
+
+def bidirectional_astar(start, goal, grid, blocked_positions, grid_size, stats=None):
+    """A* run from both ends at once, always expanding the side with the smaller open set.
+
+    Each side uses the Manhattan distance to the opposite end as its heuristic. The
+    search stops once either open set can no longer beat the best meeting point.
+    Moves cost the cost of the cell stepped onto, so the backward side pays for
+    the cell it leaves.
+    """
+    grid = as_grid(grid, blocked_positions, grid_size)
+    width = grid.width
+    if not grid.in_bounds(start) or not grid.in_bounds(goal):
+        return None
+    start_index = grid.index_of(start)
+    goal_index = grid.index_of(goal)
+    if grid.cells[goal_index]:
+        return None  # The backward side would otherwise start inside the wall
+    if start_index == goal_index:
+        return [start]
+    if stats is not None:
+        stats.start()
+    size = len(grid.cells)
+    costs = grid.costs
+    forward = _SearchSide(start_index, heuristic(start, goal), goal, size)
+    backward = _SearchSide(goal_index, heuristic(start, goal), start, size)
+    best_cost = UNREACHED
+    meeting = -1
+    pushes = 2
+
+    while True:
+        forward.discard_closed()
+        backward.discard_closed()
+        if not forward.open_set or not backward.open_set:
+            break
+        if forward.open_set[0][0] >= best_cost or backward.open_set[0][0] >= best_cost:
+            break
+        if len(forward.open_set) <= len(backward.open_set):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+        (_, current) = heapq.heappop(side.open_set)
+        side.closed[current] = 1
+        if stats is not None:
+            stats.expand(grid.position_of(current), len(forward.open_set) + len(backward.open_set))
+        if other.g_scores[current] != UNREACHED and side.g_scores[current] + other.g_scores[current] < best_cost:
+            best_cost = side.g_scores[current] + other.g_scores[current]
+            meeting = current
+
+        g_score = side.g_scores[current]
+        for neighbor in grid.neighbors(current):
+            if costs is None:
+                tentative_g_score = g_score + 1
+            else:
+                tentative_g_score = g_score + costs[neighbor if side is forward else current]
+            if side.closed[neighbor] or tentative_g_score >= side.g_scores[neighbor]:
+                continue
+            side.g_scores[neighbor] = tentative_g_score
+            side.parents[neighbor] = current
+            f_score = tentative_g_score + abs(neighbor % width - side.target_x) + abs(neighbor // width - side.target_y)
+            heapq.heappush(side.open_set, (f_score, neighbor))
+            pushes += 1
+            if other.g_scores[neighbor] != UNREACHED and tentative_g_score + other.g_scores[neighbor] < best_cost:
+                best_cost = tentative_g_score + other.g_scores[neighbor]
+                meeting = neighbor
+
+    if stats is not None:
+        stats.finish(pushes)
+    if meeting == -1:
+        return None
+    path = reconstruct_path(forward.parents, meeting, width)
+    index = meeting
+    while index != goal_index:
+        index = backward.parents[index]
+        path.append((index % width, index // width))
+    return path
+
+
+class _SearchSide:
+    """Open set, g-scores, parents and closed flags for one direction of bidirectional_astar."""
+
+    def __init__(self, root_index, root_f_score, target, size):
+        self.target_x, self.target_y = target
+        self.parents = new_parents(size)
+        self.parents[root_index] = root_index
+        self.g_scores = array('i', [UNREACHED]) * size
+        self.g_scores[root_index] = 0
+        self.closed = bytearray(size)
+        self.open_set = [(root_f_score, root_index)]
+
+    def discard_closed(self):
+        # Drop entries for cells that were already expanded through a cheaper route
+        open_set = self.open_set
+        while open_set and self.closed[open_set[0][1]]:
+            heapq.heappop(open_set)
+
+
 def heuristic(a, b):
     # Using Manhattan distance as heuristic
     (x1, y1) = a
     (x2, y2) = b
     return abs(x1 - x2) + abs(y1 - y2)
-
-
-def get_neighbors(position, grid, blocked_positions, grid_size):
-    x, y = position
-    neighbors = []
-    moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
-
-    for move in moves:
-        nx, ny = x + move[0], y + move[1]
-        if 0 <= nx < grid_size and 0 <= ny < grid_size:
-            if grid[ny][nx] == 0 and (nx, ny) not in blocked_positions:
-                neighbors.append((nx, ny))
-    return neighbors
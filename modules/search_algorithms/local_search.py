@@ -2,25 +2,37 @@
 
 import random
 import math
+from collections import OrderedDict
+
+from .search_core import get_neighbors
 
 # Existing local search algorithms
 
-def hill_climbing(start, goal, grid, blocked_positions, grid_size):
+def hill_climbing(start, goal, grid, blocked_positions, grid_size, stats=None):
+    if stats is not None:
+        stats.start()
     current = start
     path = [current]
 
     while current != goal:
         neighbors = get_neighbors(current, grid, blocked_positions, grid_size)
+        if stats is not None:
+            stats.expand(current, len(neighbors))
         if not neighbors:
-            return None  # No path found
+            path = None  # No path found
+            break
         next_node = min(neighbors, key=lambda n: heuristic(n, goal))
         if heuristic(next_node, goal) >= heuristic(current, goal):
-            return path  # Local maximum reached
+            break  # Local maximum reached
         current = next_node
         path.append(current)
+    if stats is not None:
+        stats.finish()
     return path
 
-def simulated_annealing(start, goal, grid, blocked_positions, grid_size):
+def simulated_annealing(start, goal, grid, blocked_positions, grid_size, stats=None):
+    if stats is not None:
+        stats.start()
     current = start
     path = [current]
     temperature = 1000
@@ -28,14 +40,18 @@ def simulated_annealing(start, goal, grid, blocked_positions, grid_size):
 
     while current != goal and temperature > 0.1:
         neighbors = get_neighbors(current, grid, blocked_positions, grid_size)
+        if stats is not None:
+            stats.expand(current, len(neighbors))
         if not neighbors:
-            return None  # No path found
+            break  # No path found
         next_node = random.choice(neighbors)
         delta_e = heuristic(current, goal) - heuristic(next_node, goal)
         if delta_e > 0 or math.exp(delta_e / temperature) > random.random():
             current = next_node
             path.append(current)
         temperature *= cooling_rate
+    if stats is not None:
+        stats.finish()
     if current == goal:
         return path
     else:
@@ -47,36 +63,76 @@ def heuristic(a, b):
     (x2, y2) = b
     return abs(x1 - x2) + abs(y1 - y2)
 
-def get_neighbors(position, grid, blocked_positions, grid_size):
-    x, y = position
-    neighbors = []
-    moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
-
-    for move in moves:
-        nx, ny = x + move[0], y + move[1]
-        if 0 <= nx < grid_size and 0 <= ny < grid_size:
-            if grid[ny][nx] == 0 and (nx, ny) not in blocked_positions:
-                neighbors.append((nx, ny))
-    return neighbors
-
 # Genetic Algorithm for 8-Queens problem
 
 # Population parameters
 POPULATION_SIZE = 100
 MUTATION_RATE = 0.1
+FITNESS_CACHE_SIZE = 10000  # Genomes whose fitness is remembered by the shared fitness_cache
 
 def generate_individual():
     """Generates an individual with random queen positions."""
     return [random.randint(0, 7) for _ in range(8)]
 
 def fitness(individual):
-    """Calculates the fitness score. Higher is better."""
-    conflicts = 0
-    for i in range(len(individual)):
-        for j in range(i + 1, len(individual)):
-            if individual[i] == individual[j] or abs(individual[i] - individual[j]) == abs(i - j):
-                conflicts += 1
-    return 28 - conflicts  # 28 is the maximum number of non-conflicting pairs
+    """Calculates the fitness score. Higher is better.
+
+    The score is the number of queen pairs that do not attack each other, so a
+    solution of N queens scores N(N - 1)/2 (28 for 8 queens). Conflicts are counted
+    per row and diagonal by a QueensBoard, in O(N) instead of comparing all pairs.
+    """
+    return QueensBoard(individual).fitness()
+
+class FitnessCache:
+    """Bounded LRU cache of fitness scores, keyed by the genome as a tuple.
+
+    Converging populations are full of identical genomes, so most lookups are
+    answered without evaluating anything. hits and misses count the lookups;
+    misses is the number of times the fitness function actually ran.
+    """
+
+    def __init__(self, maxsize=FITNESS_CACHE_SIZE, function=fitness):
+        self.maxsize = maxsize
+        self.function = function
+        self.scores = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, individual):
+        key = tuple(individual)
+        score = self.scores.get(key)
+        if score is not None:
+            self.hits += 1
+            self.scores.move_to_end(key)
+            return score
+        self.misses += 1
+        score = self.scores[key] = self.function(individual)
+        if len(self.scores) > self.maxsize:
+            self.scores.popitem(last=False)  # Drop the least recently used genome
+        return score
+
+    def __len__(self):
+        return len(self.scores)
+
+    @property
+    def lookups(self):
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def clear(self):
+        self.scores.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (f"FitnessCache(size={len(self.scores)}/{self.maxsize}, hits={self.hits}, misses={self.misses}, "
+                f"hit_rate={self.hit_rate:.1%})")
+
+# Shared by the GA functions below and examples/main_8_queen.py
+fitness_cache = FitnessCache()
 
 def crossover(parent1, parent2):
     """Performs crossover between two parents to create an offspring."""
@@ -89,7 +145,185 @@ def mutate(individual):
         index = random.randint(0, 7)
         individual[index] = random.randint(0, 7)
 
-def select_population(population):
-    """Selects the population based on fitness."""
-    population = sorted(population, key=lambda x: fitness(x), reverse=True)
+def select_population(population, cache=fitness_cache):
+    """Selects the population based on fitness, looking the scores up in cache."""
+    population = sorted(population, key=cache, reverse=True)
     return population[:POPULATION_SIZE]
+
+# Min-conflicts local search for N-Queens
+
+# Random unused rows tried for each column while building the initial permutation
+GREEDY_TRIES = 50
+# Random columns considered as swap partners for a conflicted queen
+SWAP_CANDIDATES = 32
+
+
+class QueensBoard:
+    """N-Queens board that keeps occupancy counters for every row and diagonal.
+
+    rows[column] is the row of the queen in that column. Because the counters are
+    kept up to date, moving one queen changes the number of attacking pairs in
+    O(1), and conflicts always holds the current total.
+    """
+
+    def __init__(self, rows):
+        self.n = n = len(rows)
+        self.rows = list(rows)
+        self.row_counts = [0] * n
+        self.falling = [0] * (2 * n - 1)  # Indexed by row - column + n - 1
+        self.rising = [0] * (2 * n - 1)  # Indexed by row + column
+        row_counts, falling, rising = self.row_counts, self.falling, self.rising
+        conflicts = 0
+        for column, row in enumerate(self.rows):
+            conflicts += row_counts[row] + falling[row - column + n - 1] + rising[row + column]
+            row_counts[row] += 1
+            falling[row - column + n - 1] += 1
+            rising[row + column] += 1
+        self.conflicts = conflicts  # Number of attacking pairs
+
+    def place(self, column, row):
+        """Puts the queen of column on row; the column must not hold a counted queen yet."""
+        falling = row - column + self.n - 1
+        rising = row + column
+        self.conflicts += self.row_counts[row] + self.falling[falling] + self.rising[rising]
+        self.row_counts[row] += 1
+        self.falling[falling] += 1
+        self.rising[rising] += 1
+        self.rows[column] = row
+
+    def remove(self, column):
+        """Takes the queen of column off the counters (its row stays in rows until it is placed again)."""
+        row = self.rows[column]
+        falling = row - column + self.n - 1
+        rising = row + column
+        self.row_counts[row] -= 1
+        self.falling[falling] -= 1
+        self.rising[rising] -= 1
+        self.conflicts -= self.row_counts[row] + self.falling[falling] + self.rising[rising]
+
+    def move(self, column, row):
+        self.remove(column)
+        self.place(column, row)
+
+    def swap(self, first, second):
+        """Exchanges the rows of two queens, which keeps every row count unchanged."""
+        first_row = self.rows[first]
+        self.move(first, self.rows[second])
+        self.move(second, first_row)
+
+    def attacks(self, column):
+        """Number of other queens attacking the queen of column."""
+        row = self.rows[column]
+        return (self.row_counts[row] + self.falling[row - column + self.n - 1]
+                + self.rising[row + column] - 3)
+
+    def fitness(self):
+        return self.n * (self.n - 1) // 2 - self.conflicts
+
+    def is_solution(self):
+        return self.conflicts == 0
+
+
+def greedy_permutation(n, rng=random):
+    """Returns a permutation of rows in which most queens are already free of diagonal conflicts.
+
+    Column by column, up to GREEDY_TRIES of the rows not used yet are tried at
+    random and the first one on two free diagonals is taken (or the last one tried,
+    if none is). Also returns the columns where no free row was found; every
+    attacking pair includes one of them, and for a million queens there are only
+    a few dozen.
+    """
+    rows = list(range(n))
+    falling = bytearray(2 * n - 1)
+    rising = bytearray(2 * n - 1)
+    random_fraction = rng.random
+    attacked = []
+    for column in range(n):
+        remaining = n - column
+        for _ in range(GREEDY_TRIES):
+            other = column + int(random_fraction() * remaining)
+            row = rows[other]
+            if not falling[row - column + n - 1] and not rising[row + column]:
+                break
+        else:
+            attacked.append(column)
+        rows[column], rows[other] = row, rows[column]
+        falling[row - column + n - 1] = 1
+        rising[row + column] = 1
+    return rows, attacked
+
+
+def min_conflicts(n, max_steps=None, seed=None, stats=None):
+    """Solves N-Queens with min-conflicts local search over permutations.
+
+    Starts from greedy_permutation, so no two queens ever share a row, then keeps
+    picking a random attacked queen and swapping rows with whichever of
+    SWAP_CANDIDATES random queens leaves the fewest diagonal attacks. Swapping keeps
+    every row count at one, so only the four diagonals involved are looked up per
+    candidate. When every candidate would make the board worse a random swap is
+    made instead, so the search cannot get stuck in a local minimum. Returns the
+    rows of a solution, or None if max_steps repair steps were not enough.
+
+    With stats given, each repair step counts as one expansion and only the repair
+    phase is timed, so stats.expansions_per_second reports the steps per second.
+    """
+    if n in (2, 3):
+        return None  # The only sizes without a solution
+    rng = random.Random(seed) if seed is not None else random
+    initial, conflicted = greedy_permutation(n, rng)
+    board = QueensBoard(initial)
+    if stats is not None:
+        stats.start()
+    rows = board.rows
+    falling = board.falling
+    rising = board.rising
+    offset = n - 1
+    random_fraction = rng.random
+    candidates = min(SWAP_CANDIDATES, n - 1)
+    steps = 0
+    while board.conflicts:
+        if not conflicted:
+            # The list only tracks the queens touched by swaps; a rescan finds any it missed
+            conflicted = [column for column in range(n) if board.attacks(column)]
+        if max_steps is not None and steps >= max_steps:
+            break
+        # Pop a random entry by moving the last one into its place
+        number = int(random_fraction() * len(conflicted))
+        column = conflicted[number]
+        conflicted[number] = conflicted[-1]
+        conflicted.pop()
+        if not board.attacks(column):
+            continue
+        steps += 1
+
+        # Estimate each swap from the diagonal counters instead of making it; the counts at a queen's
+        # own square include the queen itself, hence the - 2. Queens sharing a diagonal are slightly off.
+        row = rows[column]
+        current = falling[row - column + offset] + rising[row + column] - 2
+        best = None
+        best_delta = 0
+        for _ in range(candidates):
+            other = int(random_fraction() * n)
+            if other == column:
+                continue
+            other_row = rows[other]
+            delta = (falling[other_row - column + offset] + rising[other_row + column]
+                     + falling[row - other + offset] + rising[row + other]
+                     - falling[other_row - other + offset] - rising[other_row + other] + 2 - current)
+            if delta <= best_delta:
+                best, best_delta = other, delta
+        if best is None:
+            # Every candidate makes the board worse: take a random one anyway to get out of the local minimum
+            best = column
+            while best == column:
+                best = int(random_fraction() * n)
+        board.swap(column, best)
+        if board.attacks(column):
+            conflicted.append(column)
+        if board.attacks(best):
+            conflicted.append(best)
+
+    if stats is not None:
+        stats.expansions += steps
+        stats.finish()
+    return rows if board.is_solution() else None
@@ -0,0 +1,68 @@
+# modules/search_algorithms/search_core.py
+
+from array import array
+
+from modules.utils.grid import Grid
+
+# Shared helpers for the grid search algorithms.
+# Cells are addressed by a flat index (y * width + x) and every search keeps a
+# single predecessor per cell instead of carrying a copy of the path in its
+# frontier. The path is only rebuilt once the goal has been reached.
+
+NO_PARENT = -1
+UNREACHED = 2 ** 31 - 1
+
+
+def as_grid(grid, blocked_positions, grid_size):
+    """Returns a Grid view of the search space with blocked positions marked as walls.
+
+    A Grid that already fits inside grid_size and has nothing extra blocked is used
+    as is; lists of lists and cropped grids are converted once per search.
+    """
+    height = min(grid_size, len(grid))
+    width = min(grid_size, len(grid[0])) if height else 0
+    if not isinstance(grid, Grid) or grid.width != width or grid.height != height:
+        grid = Grid.from_rows(grid, width, height)
+    if blocked_positions:
+        return grid.with_blocked(blocked_positions)
+    return grid
+
+
+def new_parents(size):
+    """Returns a flat predecessor array with every cell unvisited."""
+    return array('i', [NO_PARENT]) * size
+
+
+def reconstruct_path(parents, goal_index, width):
+    """Follows the predecessor array back from the goal and returns the path as (x, y) tuples."""
+    path = []
+    index = goal_index
+    while True:
+        path.append((index % width, index // width))
+        parent = parents[index]
+        if parent == index:
+            break
+        index = parent
+    path.reverse()
+    return path
+
+
+def path_cost(grid, path):
+    """Returns the cost of walking a path of (x, y) positions: the costs of the cells entered after the first."""
+    if grid.costs is None:
+        return len(path) - 1 if path else 0
+    return sum(grid.costs[grid.index_of(position)] for position in path[1:])
+
+
+def get_neighbors(position, grid, blocked_positions, grid_size):
+    """Returns the free (x, y) neighbors of a position on a list-of-lists grid, for the position-based searches."""
+    x, y = position
+    neighbors = []
+    moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
+
+    for move in moves:
+        nx, ny = x + move[0], y + move[1]
+        if 0 <= nx < grid_size and 0 <= ny < grid_size:
+            if grid[ny][nx] == 0 and (nx, ny) not in blocked_positions:
+                neighbors.append((nx, ny))
+    return neighbors
@@ -0,0 +1,75 @@
+# modules/search_algorithms/search_stats.py
+
+import time
+
+
+class SearchStats:
+    """Work counters a search function fills in when it is passed as stats=...
+
+    Counters accumulate over every search the object is passed to, so one
+    instance can cover all legs of a multi-task route; call reset() to start
+    over. Searches only touch the object when one is given, so leaving stats
+    out costs a single `is not None` check per expansion.
+
+    With record_events=True every expansion is appended to events as
+    (position, frontier_size); on_expand, if given, is called with the same
+    two arguments as the search runs.
+    """
+
+    def __init__(self, record_events=False, on_expand=None):
+        self.record_events = record_events
+        self.on_expand = on_expand
+        self.reset()
+
+    def reset(self):
+        self.searches = 0  # Number of searches that reported into this object
+        self.expansions = 0  # Nodes whose neighbors were generated
+        self.pushes = 0  # Entries added to a frontier (stack, queue, heap or open set)
+        self.max_frontier = 0  # Largest frontier seen at an expansion
+        self.reopenings = 0  # Expansions of nodes that had been expanded before
+        self.elapsed = 0.0  # Seconds spent inside the searches
+        self.events = [] if self.record_events else None
+        self.started = None
+
+    @property
+    def emits_events(self):
+        return self.events is not None or self.on_expand is not None
+
+    def start(self):
+        self.searches += 1
+        self.started = time.perf_counter()
+
+    def expand(self, position, frontier_size):
+        """Records one expansion; position is only used for the event stream."""
+        self.expansions += 1
+        if frontier_size > self.max_frontier:
+            self.max_frontier = frontier_size
+        if self.events is not None:
+            self.events.append((position, frontier_size))
+        if self.on_expand is not None:
+            self.on_expand(position, frontier_size)
+
+    def finish(self, pushes=0, reopenings=0):
+        self.pushes += pushes
+        self.reopenings += reopenings
+        if self.started is not None:
+            self.elapsed += time.perf_counter() - self.started
+            self.started = None
+
+    @property
+    def expansions_per_second(self):
+        return self.expansions / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self):
+        return {
+            'searches': self.searches,
+            'expansions': self.expansions,
+            'pushes': self.pushes,
+            'max_frontier': self.max_frontier,
+            'reopenings': self.reopenings,
+            'elapsed': self.elapsed,
+        }
+
+    def __repr__(self):
+        return (f"SearchStats(expansions={self.expansions}, pushes={self.pushes}, "
+                f"max_frontier={self.max_frontier}, reopenings={self.reopenings}, elapsed={self.elapsed:.4f}s)")
@@ -0,0 +1,168 @@
+# modules/search_algorithms/tour_planner.py
+
+import time
+
+# Task counts up to this size are solved exactly with Held-Karp, larger ones heuristically
+HELD_KARP_LIMIT = 12
+
+
+class Tour:
+    """An open tour that starts at node 0 and visits the other nodes in order."""
+
+    def __init__(self, order, length, planning_time, method):
+        self.order = order  # Node numbers, starting with the start node
+        self.length = length  # Total number of moves along the tour
+        self.planning_time = planning_time  # Seconds spent planning
+        self.method = method  # 'held-karp' or 'nearest+2opt+oropt'
+
+    def __repr__(self):
+        return f"Tour(length={self.length}, nodes={len(self.order)}, method={self.method!r})"
+
+
+def plan_tour(distances, time_budget=1.0, exact_limit=HELD_KARP_LIMIT):
+    """Plans an open tour from node 0 through every node reachable from it.
+
+    distances is a square matrix (list of lists) of true path lengths where None
+    marks an unreachable pair, for example DistanceMatrix.distances. Small
+    instances use Held-Karp dynamic programming and return an optimal tour;
+    larger ones start from a nearest-neighbor tour and improve it with 2-opt and
+    Or-opt moves until no move helps or time_budget seconds have passed.
+    """
+    started = time.perf_counter()
+    nodes = [node for node in range(1, len(distances)) if distances[0][node] is not None]
+    if len(nodes) <= exact_limit:
+        order = held_karp(distances, nodes)
+        method = 'held-karp'
+    else:
+        deadline = started + time_budget
+        order = nearest_neighbor_tour(distances, nodes)
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = two_opt(order, distances, deadline)
+            improved = or_opt(order, distances, deadline) or improved
+        method = 'nearest+2opt+oropt'
+    return Tour(order, tour_length(order, distances), time.perf_counter() - started, method)
+
+
+def tour_length(order, distances):
+    return sum(distances[a][b] for a, b in zip(order, order[1:]))
+
+
+def held_karp(distances, nodes):
+    """Returns the shortest open tour from node 0 through all nodes using subset dynamic programming."""
+    count = len(nodes)
+    if count == 0:
+        return [0]
+    infinity = float('inf')
+    full = 1 << count
+    # cost[mask * count + j]: cheapest route from node 0 covering mask and ending at nodes[j]
+    cost = [infinity] * (full * count)
+    parent = [-1] * (full * count)
+    for j in range(count):
+        cost[(1 << j) * count + j] = distances[0][nodes[j]]
+
+    for mask in range(1, full):
+        base = mask * count
+        for j in range(count):
+            current = cost[base + j]
+            if current == infinity:
+                continue
+            row = distances[nodes[j]]
+            for k in range(count):
+                bit = 1 << k
+                if mask & bit:
+                    continue
+                candidate = current + row[nodes[k]]
+                slot = (mask | bit) * count + k
+                if candidate < cost[slot]:
+                    cost[slot] = candidate
+                    parent[slot] = j
+
+    last_mask = full - 1
+    last = min(range(count), key=lambda j: cost[last_mask * count + j])
+    order = []
+    mask = last_mask
+    while last != -1:
+        order.append(nodes[last])
+        previous = parent[mask * count + last]
+        mask ^= 1 << last
+        last = previous
+    order.append(0)
+    order.reverse()
+    return order
+
+
+def nearest_neighbor_tour(distances, nodes):
+    """Builds a tour from node 0 by always moving to the closest unvisited node."""
+    order = [0]
+    unvisited = set(nodes)
+    while unvisited:
+        row = distances[order[-1]]
+        nearest = min(unvisited, key=lambda node: (row[node], node))
+        order.append(nearest)
+        unvisited.remove(nearest)
+    return order
+
+
+def two_opt(order, distances, deadline):
+    """Reverses segments of the open tour in place while that shortens it. Returns True if anything changed."""
+    improved = False
+    count = len(order)
+    changed = True
+    while changed and time.perf_counter() < deadline:
+        changed = False
+        for i in range(1, count - 1):
+            a, b = order[i - 1], order[i]
+            row_a, row_b = distances[a], distances[b]
+            for j in range(i + 1, count):
+                c = order[j]
+                # Reversing order[i..j] replaces edges (a, b) and (c, d) with (a, c) and (b, d)
+                delta = row_a[c] - row_a[b]
+                if j + 1 < count:
+                    d = order[j + 1]
+                    delta += row_b[d] - distances[c][d]
+                if delta < 0:
+                    order[i:j + 1] = reversed(order[i:j + 1])
+                    b = order[i]
+                    row_b = distances[b]
+                    changed = improved = True
+            if time.perf_counter() >= deadline:
+                break
+    return improved
+
+
+def or_opt(order, distances, deadline):
+    """Moves segments of one to three nodes (optionally reversed) elsewhere in the open tour while that shortens it."""
+    improved = False
+    changed = True
+    while changed and time.perf_counter() < deadline:
+        changed = False
+        for length in (1, 2, 3):
+            i = 1
+            while i + length <= len(order):
+                segment = order[i:i + length]
+                before = order[i - 1]
+                after = order[i + length] if i + length < len(order) else None
+                removed_gain = distances[before][segment[0]]
+                if after is not None:
+                    removed_gain += distances[segment[-1]][after] - distances[before][after]
+                rest = order[:i] + order[i + length:]
+                best_delta, best_move = 0, None
+                for position in range(1, len(rest) + 1):
+                    left = rest[position - 1]
+                    right = rest[position] if position < len(rest) else None
+                    for candidate in (segment, segment[::-1]):
+                        added = distances[left][candidate[0]]
+                        if right is not None:
+                            added += distances[candidate[-1]][right] - distances[left][right]
+                        delta = added - removed_gain
+                        if delta < best_delta:
+                            best_delta, best_move = delta, (position, candidate)
+                if best_move is not None:
+                    position, candidate = best_move
+                    order[:] = rest[:position] + candidate + rest[position:]
+                    changed = improved = True
+                i += 1
+            if time.perf_counter() >= deadline:
+                return improved
+    return improved
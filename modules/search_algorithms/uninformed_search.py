@@ -1,69 +1,134 @@
 # modules/search_algorithms/uninformed_search.py
 
 from collections import deque
-import heapq
+from array import array
 
+from .search_core import as_grid, new_parents, reconstruct_path, UNREACHED
 
-def dfs(start, goal, grid, blocked_positions, grid_size):
-    stack = [(start, [start])]
-    visited = set()
+
+def dfs(start, goal, grid, blocked_positions, grid_size, stats=None):
+    if start in blocked_positions:
+        return None
+    grid = as_grid(grid, blocked_positions, grid_size)
+    width = grid.width
+    if not grid.in_bounds(start):
+        return None
+    if stats is not None:
+        stats.start()
+    start_index = grid.index_of(start)
+    goal_index = grid.index_of(goal) if grid.in_bounds(goal) else -1
+    parents = new_parents(len(grid.cells))
+    # Each stack entry is (cell, predecessor); the first time a cell is popped fixes its predecessor
+    stack = [(start_index, start_index)]
+    pushes = 1
 
     while stack:
-        (vertex, path) = stack.pop()
-        if vertex not in visited:
-            if vertex in blocked_positions:
-                continue
-            visited.add(vertex)
-            if vertex == goal:
-                return path
-            neighbors = get_neighbors(vertex, grid, blocked_positions, grid_size)
-            for neighbor in neighbors:
-                stack.append((neighbor, path + [neighbor]))
+        (vertex, parent) = stack.pop()
+        if parents[vertex] == -1:
+            parents[vertex] = parent
+            if vertex == goal_index:
+                if stats is not None:
+                    stats.finish(pushes)
+                return reconstruct_path(parents, goal_index, width)
+            if stats is not None:
+                stats.expand(grid.position_of(vertex), len(stack))
+            for neighbor in grid.neighbors(vertex):
+                stack.append((neighbor, vertex))
+                pushes += 1
+    if stats is not None:
+        stats.finish(pushes)
     return None
 
 
-def bfs(start, goal, grid, blocked_positions, grid_size):
-    queue = deque([(start, [start])])
-    visited = set([start])
+def bfs(start, goal, grid, blocked_positions, grid_size, stats=None):
+    grid = as_grid(grid, blocked_positions, grid_size)
+    width = grid.width
+    if not grid.in_bounds(start):
+        return None
+    if stats is not None:
+        stats.start()
+    start_index = grid.index_of(start)
+    goal_index = grid.index_of(goal) if grid.in_bounds(goal) else -1
+    parents = new_parents(len(grid.cells))
+    parents[start_index] = start_index
+    queue = deque([start_index])
+    pushes = 1
 
     while queue:
-        (vertex, path) = queue.popleft()
-        if vertex == goal:
-            return path
-        neighbors = get_neighbors(vertex, grid, blocked_positions, grid_size)
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
+        vertex = queue.popleft()
+        if vertex == goal_index:
+            if stats is not None:
+                stats.finish(pushes)
+            return reconstruct_path(parents, goal_index, width)
+        if stats is not None:
+            stats.expand(grid.position_of(vertex), len(queue))
+        for neighbor in grid.neighbors(vertex):
+            if parents[neighbor] == -1:
+                parents[neighbor] = vertex
+                queue.append(neighbor)
+                pushes += 1
+    if stats is not None:
+        stats.finish(pushes)
     return None
 
 
-def ucs(start, goal, grid, blocked_positions, grid_size):
-    queue = [(0, start, [start])]
-    visited = set()
-
-    while queue:
-        (cost, vertex, path) = heapq.heappop(queue)
-        if vertex not in visited:
-            if vertex in blocked_positions:
-                continue
-            visited.add(vertex)
-            if vertex == goal:
-                return path
-            neighbors = get_neighbors(vertex, grid, blocked_positions, grid_size)
-            for neighbor in neighbors:
-                heapq.heappush(queue, (cost + 1, neighbor, path + [neighbor]))
-    return None
-
+def ucs(start, goal, grid, blocked_positions, grid_size, stats=None):
+    """Dijkstra's algorithm over the cells' traversal costs, with a bucket queue (Dial's algorithm).
 
-def get_neighbors(position, grid, blocked_positions, grid_size):
-    x, y = position
-    neighbors = []
-    moves = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Left, Right, Up, Down
+    Stepping onto a cell costs grid.cost_of(cell), 1 on grids without terrain.
+    Costs are small integers, so the frontier is a ring of max_cost + 1 lists
+    indexed by path cost: a push is an append, and each bucket is worked
+    through in the order its cells were reached before the next one is taken.
+    Neighbors are visited in (x, y) order and the first cell to reach a
+    neighbor at its final cost becomes its parent. Without terrain this picks,
+    among equally cheap paths, the one whose positions compare smallest from
+    the start, as the heap of (cost, position, path) entries used to.
+    """
+    if start in blocked_positions:
+        return None
+    grid = as_grid(grid, blocked_positions, grid_size)
+    width = grid.width
+    if not grid.in_bounds(start):
+        return None
+    if stats is not None:
+        stats.start()
+    start_index = grid.index_of(start)
+    goal_index = grid.index_of(goal) if grid.in_bounds(goal) else -1
+    costs = grid.costs
+    ring = grid.max_cost + 1  # Every pending cell costs between the current cost and max_cost more
+    buckets = [[] for _ in range(ring)]
+    parents = new_parents(len(grid.cells))
+    parents[start_index] = start_index
+    distances = array('i', [UNREACHED]) * len(grid.cells)
+    distances[start_index] = 0
+    buckets[0].append(start_index)
+    pending = 1
+    pushes = 1
+    cost = 0
 
-    for move in moves:
-        nx, ny = x + move[0], y + move[1]
-        if 0 <= nx < grid_size and 0 <= ny < grid_size:
-            if grid[ny][nx] == 0 and (nx, ny) not in blocked_positions:
-                neighbors.append((nx, ny))
-    return neighbors
+    while pending:
+        bucket = buckets[cost % ring]
+        # Pushes only go to later buckets (every cost is at least 1), so this one does not grow meanwhile
+        for vertex in bucket:
+            pending -= 1
+            if distances[vertex] != cost:
+                continue  # Stale entry, the cell was pushed again with a lower cost
+            if vertex == goal_index:
+                if stats is not None:
+                    stats.finish(pushes)
+                return reconstruct_path(parents, goal_index, width)
+            if stats is not None:
+                stats.expand(grid.position_of(vertex), pending)
+            for neighbor in grid.neighbors_by_position(vertex):
+                new_cost = cost + costs[neighbor] if costs is not None else cost + 1
+                if new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parents[neighbor] = vertex
+                    buckets[new_cost % ring].append(neighbor)
+                    pending += 1
+                    pushes += 1
+        bucket.clear()
+        cost += 1
+    if stats is not None:
+        stats.finish(pushes)
+    return None
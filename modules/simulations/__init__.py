@@ -3,5 +3,6 @@
 from .simulation_base import SimulationBase
 from .search_simulation import SearchSimulation
 from .maze_simulation import MazeSimulation
+from .adversarial_simulation import AdversarialSimulation
 
-__all__ = ['SimulationBase', 'SearchSimulation', 'MazeSimulation']
+__all__ = ['SimulationBase', 'SearchSimulation', 'MazeSimulation', 'AdversarialSimulation']
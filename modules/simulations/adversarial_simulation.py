@@ -0,0 +1,200 @@
+# modules/simulations/adversarial_simulation.py
+
+import pygame
+import sys
+import os
+
+# Add the parent directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(parent_dir)
+
+from modules.simulations.simulation_base import SimulationBase, get_font
+from modules.simulations.search_simulation import Button
+from modules.adversarial_search import TicTacToe, ConnectFour, AlphaBeta
+from modules.utils.constants import (
+    WHITE, BLACK, BLUE, RED, YELLOW, DARK_BLUE, PANEL_WIDTH, LIGHT_GRAY
+)
+
+GAMES = {'connect4': ConnectFour, 'tictactoe': TicTacToe}
+PLAYER_COLORS = [RED, YELLOW]  # Connect Four pieces of players 0 and 1
+PLAYER_NAMES = ["Red", "Yellow"]
+TICTACTOE_NAMES = ["X", "O"]
+
+
+def make_engine(name, seed=None):
+    """Returns an engine with best_move(game, time_limit) and search(game, time_limit), or None for a human player."""
+    if name == 'human':
+        return None
+    if name == 'alphabeta':
+        return AlphaBeta()
+    if name == 'mcts':
+        # Imported here so the simulations package does not need numpy unless MCTS plays
+        from modules.adversarial_search.mcts import MCTS
+        return MCTS(seed=seed)
+    raise ValueError(f"Unknown player: {name}")
+
+
+class AdversarialSimulation(SimulationBase):
+    """Connect Four or tic-tac-toe between humans (who click a column or a cell) and search engines."""
+
+    def __init__(self, screen, game='connect4', players=('human', 'mcts'), move_time=1.0, seed=None):
+        super().__init__(screen)
+        self.game_name = game
+        self.players = list(players)
+        self.move_time = move_time  # Seconds each engine thinks per move
+        self.engines = [make_engine(name, seed) for name in self.players]
+
+        self.update_fonts(20)
+        self.update_layout()
+        self.reset_simulation()
+
+    def update_fonts(self, font_size):
+        self.font_size = font_size
+        self.font_medium = get_font(int(font_size * 1.2))
+
+    def update_layout(self):
+        """Fits the board to the window and places the Reset button."""
+        window_width, window_height = self.screen.get_size()
+        self.window_size = (window_width, window_height)
+        self.columns, self.rows = (ConnectFour.WIDTH, ConnectFour.HEIGHT) if self.game_name == 'connect4' else (3, 3)
+        self.cell_size = max(1, min((window_width - PANEL_WIDTH) // self.columns, window_height // self.rows))
+        self.board_width = self.columns * self.cell_size
+
+        button_width = 100
+        button_height = 40
+        margin = 10
+        self.reset_button = Button(pygame.Rect(window_width - PANEL_WIDTH + margin,
+                                               window_height - button_height - margin, button_width, button_height),
+                                   LIGHT_GRAY, "Reset", BLACK, self.font_medium)
+        self.redraw = True
+
+    def reset_simulation(self):
+        self.game = GAMES[self.game_name]()
+        self.last_results = [None, None]  # Latest search result of each player's engine
+        self.last_move = None
+        self.redraw = True
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.quit()
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if self.reset_button.is_clicked(event.pos):
+                    self.reset_simulation()
+                elif self.engines[self.game.player] is None and not self.game.is_over():
+                    self.play_clicked(event.pos)
+
+            # Exit on pressing ESC key
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.quit()
+
+    def play_clicked(self, mouse_position):
+        """Plays the column (Connect Four) or cell (tic-tac-toe) under the mouse if it is a legal move."""
+        x, y = mouse_position
+        if x >= self.board_width or y >= self.rows * self.cell_size:
+            return
+        column, row = x // self.cell_size, y // self.cell_size
+        move = column if self.game_name == 'connect4' else row * 3 + column
+        if move in self.game.legal_moves():
+            self.play(move)
+
+    def play(self, move):
+        self.game.play(move)
+        self.last_move = move
+        self.redraw = True
+
+    def update(self):
+        # Handle window resize
+        if self.screen.get_size() != self.window_size:
+            self.update_layout()
+
+        # The engine only starts thinking once the previous move is on the screen
+        engine = self.engines[self.game.player]
+        if engine is None or self.redraw or self.game.is_over():
+            return
+        player = self.game.player
+        result = engine.search(self.game, self.move_time)
+        self.last_results[player] = result
+        self.play(result.move)
+
+    def draw(self):
+        if not self.redraw:
+            return
+        self.screen.fill(WHITE)
+        if self.game_name == 'connect4':
+            self.draw_connect_four()
+        else:
+            self.draw_tictactoe()
+        self.draw_panel()
+        pygame.display.flip()
+        self.redraw = False
+
+    def draw_connect_four(self):
+        CELL_SIZE = self.cell_size
+        stride = ConnectFour.HEIGHT + 1
+        pygame.draw.rect(self.screen, BLUE, pygame.Rect(0, 0, self.board_width, self.rows * CELL_SIZE))
+        for column in range(self.columns):
+            for row in range(self.rows):
+                bit = 1 << column * stride + row
+                color = WHITE
+                for player in (0, 1):
+                    if self.game.masks[player] & bit:
+                        color = PLAYER_COLORS[player]
+                # Row 0 is the bottom of the board
+                center = (column * CELL_SIZE + CELL_SIZE // 2, (self.rows - 1 - row) * CELL_SIZE + CELL_SIZE // 2)
+                pygame.draw.circle(self.screen, color, center, CELL_SIZE * 2 // 5)
+        if self.last_move is not None:
+            # Mark the column of the last move
+            x = self.last_move * CELL_SIZE
+            pygame.draw.rect(self.screen, DARK_BLUE, pygame.Rect(x, 0, CELL_SIZE, self.rows * CELL_SIZE), 3)
+
+    def draw_tictactoe(self):
+        CELL_SIZE = self.cell_size
+        for cell in range(9):
+            row, column = divmod(cell, 3)
+            rect = pygame.Rect(column * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+            pygame.draw.rect(self.screen, DARK_BLUE if cell == self.last_move else BLACK, rect, 3)
+            for player in (0, 1):
+                if self.game.masks[player] >> cell & 1:
+                    text = self.render_text(TICTACTOE_NAMES[player], CELL_SIZE, PLAYER_COLORS[player])
+                    self.screen.blit(text, text.get_rect(center=rect.center))
+
+    def draw_panel(self):
+        panel_x = self.board_width + 20
+        y_offset = 20
+        names = PLAYER_NAMES if self.game_name == 'connect4' else TICTACTOE_NAMES
+        winner = self.game.winner()
+        if winner is not None:
+            status = f"{names[winner]} wins"
+        elif self.game.is_over():
+            status = "Draw"
+        else:
+            status = f"{names[self.game.player]} to move"
+        self.screen.blit(self.render_text(status, int(self.font_size * 1.2)), (panel_x, y_offset))
+        y_offset += int(self.font_size * 1.5)
+
+        for player in (0, 1):
+            line = f"{names[player]}: {self.players[player]}"
+            self.screen.blit(self.render_text(line, self.font_size), (panel_x, y_offset))
+            y_offset += int(self.font_size)
+            for line in self.describe(self.last_results[player]):
+                self.screen.blit(self.render_text(line, self.font_size), (panel_x + 10, y_offset))
+                y_offset += int(self.font_size)
+            y_offset += int(self.font_size * 0.5)
+
+        self.reset_button.draw(self.screen)
+
+    def describe(self, result):
+        """Panel lines for an engine's last search."""
+        if result is None:
+            return []
+        if hasattr(result, 'playouts'):
+            return [f"Move {result.move}, win rate {result.win_rate:.2f}",
+                    f"Playouts/s: {result.playouts_per_second:.0f}",
+                    f"Tree nodes: {result.nodes} ({result.bytes_per_node} B each)"]
+        return [f"Move {result.move}, score {result.score}",
+                f"Depth: {result.depth}",
+                f"Nodes/s: {result.nodes_per_second:.0f}"]
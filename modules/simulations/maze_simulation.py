@@ -9,29 +9,28 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(os.path.dirname(current_dir))
 sys.path.append(parent_dir)
 
-from modules.simulations.simulation_base import SimulationBase
+from modules.simulations.simulation_base import SimulationBase, get_font
 from modules.environments.maze_environment import MazeEnvironment
 from modules.agents.maze_agent import MazeAgent
 from modules.utils.constants import (
-    DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, WHITE, BLACK, BLUE, GREEN, RED,
-    PANEL_WIDTH, LIGHT_GRAY, BLACK, GRAY
+    WHITE, BLACK, BLUE, GREEN, RED,
+    PANEL_WIDTH, LIGHT_GRAY, BLACK, GRAY, BROWN
 )
 
 class MazeSimulation(SimulationBase):
     def __init__(self, screen, algorithm='dfs', maze_width=21, maze_height=21,
-                 complexity=0.75, density=0.75):
+                 complexity=0.75, density=0.75, maze_algorithm='backtracker', seed=None):
         super().__init__(screen)
         self.algorithm = algorithm
         self.maze_width = maze_width
         self.maze_height = maze_height
         self.complexity = complexity
         self.density = density
+        self.maze_algorithm = maze_algorithm  # Generator used by MazeEnvironment
+        self.seed = seed  # Seed of the first maze; each reset moves on to the next seed
 
         # Initialize fonts
-        self.font_size = 20
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
+        self.update_fonts(20)
 
         # Initialize clock for controlling animation speed
         self.clock = pygame.time.Clock()
@@ -79,6 +78,8 @@ class MazeSimulation(SimulationBase):
                         self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
                 elif self.reset_button.is_clicked(event.pos):
                     self.reset_simulation()
+                else:
+                    self.toggle_obstacle(event.pos)
 
             # Exit on pressing ESC key
             if event.type == pygame.KEYDOWN:
@@ -96,43 +97,74 @@ class MazeSimulation(SimulationBase):
                 else:
                     self.mouse_grid_pos = None  # Reset if mouse is outside the grid
 
+    def toggle_obstacle(self, mouse_position):
+        """Blocks or frees the clicked cell; a moving agent replans around the change."""
+        grid_x = mouse_position[0] // self.cell_size
+        grid_y = mouse_position[1] // self.cell_size
+        if grid_x >= self.maze_width or grid_y >= self.maze_height or self.grid[grid_y][grid_x] == 1:
+            return
+        cell = (int(grid_x), int(grid_y))
+        if cell == self.agent.position or cell == self.goal_pos:
+            return
+        self.blocked_positions ^= {cell}
+        self.dirty_cells.add(cell)
+        if self.animation_started:
+            self.agent.replan(self.grid, self.blocked_positions)
+        else:
+            self.agent.blocked_positions = set(self.blocked_positions)
+
     def reset_simulation(self):
         # Generate new maze and reset agent
         self.maze_env = MazeEnvironment(self.maze_width, self.maze_height,
-                                        complexity=self.complexity, density=self.density)
+                                        complexity=self.complexity, density=self.density,
+                                        seed=self.seed, algorithm=self.maze_algorithm)
+        if self.seed is not None:
+            self.seed += 1
         self.grid = self.maze_env.get_grid()
-        # Set cell size
-        self.cell_size = min((DEFAULT_WINDOW_WIDTH - PANEL_WIDTH) // self.maze_width, DEFAULT_WINDOW_HEIGHT // self.maze_height)
-        self.margin = 1
+        # Set cell size, fonts and buttons for the current window
+        self.update_layout()
         # Set start and goal positions
-        self.start_pos = (1, 0)
-        self.goal_pos = (self.maze_width - 2, self.maze_height - 1)
+        self.start_pos = self.maze_env.entrance_position
+        self.goal_pos = self.maze_env.exit_position
         # Initialize agent
         self.agent = MazeAgent(self.start_pos, self.goal_pos, algorithm=self.algorithm)
         self.animation_started = False
         self.agent.path_traveled = []
         self.agent.path = []
         self.path_length = None
-
-    def update(self):
-        # Handle window resize
+        self.blocked_positions = set()  # Obstacles added by clicking on the maze
+        # Rendering state: only cells listed in dirty_cells are redrawn on the next frame
+        self.traveled_cells = set()
+        self.drawn_steps = 0  # Entries of path_traveled already drawn
+        self.dirty_cells = set()
+        self.redraw_all = True
+
+    def update_fonts(self, font_size):
+        self.font_size = font_size
+        self.font_small = get_font(font_size)
+        self.font_medium = get_font(int(font_size * 1.2))
+        self.font_large = get_font(int(font_size * 1.5))
+
+    def update_layout(self):
+        """Fits the maze to the window; the cached background is rebuilt on the next frame."""
         window_width, window_height = self.screen.get_size()
+        self.window_size = (window_width, window_height)
         grid_width = window_width - PANEL_WIDTH
         grid_height = window_height
-        self.cell_size = min(grid_width // self.maze_width, grid_height // self.maze_height)
-        self.margin = 1
+        self.cell_size = max(1, min(grid_width // self.maze_width, grid_height // self.maze_height))
+        self.margin = 1 if self.cell_size > 2 else 0
 
-        # Update fonts based on cell_size
-        self.font_size = int(self.cell_size // 2)
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
-
-        self.start_button.font = self.font_medium
-        self.reset_button.font = self.font_medium
+        # Update fonts based on cell_size, keeping the panel readable on large mazes
+        self.update_fonts(max(12, int(self.cell_size // 2)))
 
         # Update button positions on resize
         self.update_buttons()
+        self.background = None
+
+    def update(self):
+        # Handle window resize
+        if self.screen.get_size() != self.window_size:
+            self.update_layout()
 
         if self.animation_started:
             self.agent.move()
@@ -143,42 +175,71 @@ class MazeSimulation(SimulationBase):
                 self.animation_started = False
 
     def draw(self):
-        self.screen.fill(WHITE)
-        self.draw_environment()
-        pygame.display.flip()
+        """Redraws what changed since the last frame and updates only those parts of the display."""
+        if self.background is None:
+            self.background = self.render_background()
+            self.redraw_all = True
+
+        # Cells the agent stepped on since the last frame
+        new_steps = self.agent.path_traveled[self.drawn_steps:]
+        self.drawn_steps = len(self.agent.path_traveled)
+        self.traveled_cells.update(new_steps)
+        self.dirty_cells.update(new_steps)
+
+        if self.redraw_all:
+            self.draw_environment()
+            dirty_rects = [self.screen.get_rect()]
+            self.redraw_all = False
+        else:
+            dirty_rects = [self.draw_cell(cell) for cell in self.dirty_cells]
+            dirty_rects.extend(self.draw_panel())
+            dirty_rects.append(self.draw_agent())
+        # The agent is drawn over its cell, which has to be restored once it moves on
+        self.dirty_cells = {self.agent.position}
+        pygame.display.update(dirty_rects)
 
     def draw_environment(self):
+        self.screen.fill(WHITE)
+        self.screen.blit(self.background, (0, 0))
+        for cell in self.blocked_positions | self.traveled_cells:
+            self.draw_cell(cell)
+        self.draw_panel()
+        self.draw_agent()
+
+    def render_background(self):
+        """Draws the static maze (walls, free cells and the goal) once onto an off-screen surface."""
         CELL_SIZE = self.cell_size
         MARGIN = self.margin
-
-        # Draw the maze grid
+        background = pygame.Surface((self.maze_width * CELL_SIZE, self.maze_height * CELL_SIZE))
+        background.fill(WHITE)
         for y in range(self.maze_height):
+            row = self.grid[y]
             for x in range(self.maze_width):
-                rect = pygame.Rect(
-                    x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-                )
-                if self.grid[y][x] == 1:
-                    pygame.draw.rect(self.screen, BLACK, rect)
-                else:
-                    pygame.draw.rect(self.screen, GRAY, rect)
+                color = BLACK if row[x] == 1 else GRAY
+                background.fill(color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN))
 
         # Draw the goal
         gx, gy = self.goal_pos
-        rect = pygame.Rect(
-            gx * CELL_SIZE, gy * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-        )
-        pygame.draw.rect(self.screen, RED, rect)
-
-        # Draw the path traveled
-        for pos in self.agent.path_traveled:
-            x, y = pos
-            rect = pygame.Rect(
-                x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-            )
+        background.fill(RED, (gx * CELL_SIZE, gy * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN))
+        return background
+
+    def draw_cell(self, cell):
+        """Restores one cell from the background and draws what covers it; returns the screen area."""
+        CELL_SIZE = self.cell_size
+        x, y = cell
+        area = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+        self.screen.blit(self.background, area, area)
+        rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - self.margin, CELL_SIZE - self.margin)
+        # The path traveled is drawn over the obstacles added later
+        if cell in self.traveled_cells:
             pygame.draw.rect(self.screen, GREEN, rect)
+        elif cell in self.blocked_positions:
+            pygame.draw.rect(self.screen, BROWN, rect)
+        return area
 
+    def draw_panel(self):
         # Draw right panel background
-        panel_rect = pygame.Rect(self.maze_width * CELL_SIZE, 0, PANEL_WIDTH, self.screen.get_height())
+        panel_rect = pygame.Rect(self.maze_width * self.cell_size, 0, PANEL_WIDTH, self.screen.get_height())
         pygame.draw.rect(self.screen, WHITE, panel_rect)
 
         # Draw UI elements on the right panel
@@ -187,41 +248,48 @@ class MazeSimulation(SimulationBase):
         # Draw Start and Reset buttons
         self.start_button.draw(self.screen)
         self.reset_button.draw(self.screen)
-
-        # Draw the agent
-        self.draw_agent()
+        return [panel_rect, self.start_button.rect, self.reset_button.rect]
 
     def draw_ui(self, panel_x, y_offset):
         # Display Agent Status
-        status_text = self.font_medium.render("Agent Status", True, BLACK)
+        status_text = self.render_text("Agent Status", int(self.font_size * 1.2))
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
-        position_text = self.font_small.render(f"Position: {self.agent.position}", True, BLACK)
+        position_text = self.render_text(f"Position: {self.agent.position}", self.font_size)
         self.screen.blit(position_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
         if self.animation_started:
-            status_text = self.font_small.render("Status: Moving", True, BLACK)
+            status_text = self.render_text("Status: Moving", self.font_size)
         else:
-            status_text = self.font_small.render("Status: Idle", True, BLACK)
+            status_text = self.render_text("Status: Idle", self.font_size)
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
         # Display Path Length
         if self.path_length is not None:
-            path_length_text = self.font_small.render(f"Path Length: {self.path_length}", True, BLACK)
+            path_length_text = self.render_text(f"Path Length: {self.path_length}", self.font_size)
             self.screen.blit(path_length_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
 
         # Display Algorithm Used
-        algorithm_text = self.font_small.render(f"Algorithm: {self.algorithm.upper()}", True, BLACK)
+        algorithm_text = self.render_text(f"Algorithm: {self.algorithm.upper()}", self.font_size)
         self.screen.blit(algorithm_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
+        # Display Search Statistics
+        stats = self.agent.stats
+        for label, value in (("Expanded", stats.expansions), ("Pushes", stats.pushes),
+                             ("Max Frontier", stats.max_frontier), ("Reopenings", stats.reopenings),
+                             ("Search Time", f"{stats.elapsed * 1000:.1f} ms")):
+            stats_text = self.render_text(f"{label}: {value}", self.font_size)
+            self.screen.blit(stats_text, (panel_x, y_offset))
+            y_offset += int(self.font_size)
+
         # Display Mouse Grid Position
         if self.mouse_grid_pos is not None:
-            mouse_pos_text = self.font_small.render(f"Cursor Position: {self.mouse_grid_pos}", True, BLACK)
+            mouse_pos_text = self.render_text(f"Cursor Position: {self.mouse_grid_pos}", self.font_size)
             self.screen.blit(mouse_pos_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
         else:
@@ -236,6 +304,7 @@ class MazeSimulation(SimulationBase):
             x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
         )
         pygame.draw.rect(self.screen, BLUE, rect)
+        return rect
 
     def run(self):
         """Main loop of the simulation."""
@@ -243,7 +312,6 @@ class MazeSimulation(SimulationBase):
             self.handle_events()
             self.update()
             self.draw()
-            pygame.display.flip()
             self.clock.tick(5)  # Set to 5 FPS to slow down the animation
 
     def quit(self):
@@ -257,12 +325,14 @@ class Button:
         self.text = text
         self.text_color = text_color
         self.font = font
+        self.text_surf = None  # Rendered once, on the first draw
 
     def draw(self, surface):
         pygame.draw.rect(surface, self.color, self.rect)
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        if self.text_surf is None:
+            self.text_surf = self.font.render(self.text, True, self.text_color)
+        text_rect = self.text_surf.get_rect(center=self.rect.center)
+        surface.blit(self.text_surf, text_rect)
 
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
@@ -9,27 +9,32 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(os.path.dirname(current_dir))
 sys.path.append(parent_dir)
 
-from modules.simulations.simulation_base import SimulationBase
+from modules.simulations.simulation_base import SimulationBase, get_font
 from modules.environments.grid_environment import GridEnvironment
 from modules.agents.robot_agent import RobotAgent
 from modules.utils.constants import (
-    DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, WHITE, BLACK, BLUE, GREEN, RED,
-    PANEL_WIDTH, LIGHT_GRAY, GRAY
+    WHITE, BLACK, BLUE, GREEN, RED,
+    PANEL_WIDTH, LIGHT_GRAY, GRAY, BROWN, TERRAIN_COLORS
 )
+from modules.search_algorithms.search_core import path_cost
+
+MIN_LABEL_SIZE = 8  # Task numbers are left out when cells get too small to read them
 
 class SearchSimulation(SimulationBase):
-    def __init__(self, screen, algorithm='astar', grid_size=16, num_tasks=5, nearest_task=False):
+    def __init__(self, screen, algorithm='astar', grid_size=16, num_tasks=5, nearest_task=False, tour=False,
+                 tour_time_budget=1.0, seed=None, terrain=False):
         super().__init__(screen)
         self.algorithm = algorithm
         self.grid_size = grid_size
         self.num_tasks = num_tasks
         self.nearest_task = nearest_task  # New parameter
+        self.tour = tour  # Visit tasks along a planned tour
+        self.tour_time_budget = tour_time_budget
+        self.seed = seed  # Seed of the first environment; each reset moves on to the next seed
+        self.terrain = terrain  # Generate terrain with per-cell movement costs
 
         # Initialize fonts
-        self.font_size = 20
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
+        self.update_fonts(20)
 
         # Initialize clock for controlling animation speed
         self.clock = pygame.time.Clock()
@@ -74,9 +79,11 @@ class SearchSimulation(SimulationBase):
                         print(f"No path found using {self.algorithm.upper()}")
                         self.animation_started = False
                     else:
-                        self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
+                        self.update_path_length()
                 elif self.reset_button.is_clicked(event.pos):
                     self.reset_simulation()
+                else:
+                    self.toggle_obstacle(event.pos)
 
             # Exit on pressing ESC key
             if event.type == pygame.KEYDOWN:
@@ -94,95 +101,168 @@ class SearchSimulation(SimulationBase):
                 else:
                     self.mouse_grid_pos = None  # Reset if mouse is outside the grid
 
+    def toggle_obstacle(self, mouse_position):
+        """Blocks or frees the clicked cell; a moving robot replans around the change."""
+        grid_x = mouse_position[0] // self.cell_size
+        grid_y = mouse_position[1] // self.cell_size
+        if grid_x >= self.grid_size or grid_y >= self.grid_size or self.grid[grid_y][grid_x] == 1:
+            return
+        cell = (int(grid_x), int(grid_y))
+        if cell == self.agent.position or cell in self.all_tasks:
+            return
+        self.blocked_positions ^= {cell}
+        self.dirty_cells.add(cell)
+        if self.animation_started:
+            self.agent.replan(self.blocked_positions)
+        else:
+            self.agent.blocked_positions = set(self.blocked_positions)
+
     def reset_simulation(self):
         # Generate new environment and reset agent
-        self.env = GridEnvironment(self.grid_size, num_tasks=self.num_tasks)
+        self.env = GridEnvironment(self.grid_size, num_tasks=self.num_tasks, seed=self.seed, terrain=self.terrain)
+        if self.seed is not None:
+            self.seed += 1
         self.grid = self.env.get_grid()
         self.tasks = self.env.get_tasks()
         # Keep a copy of all tasks and assign numbers
         self.all_tasks = self.tasks.copy()
         self.task_numbers = {task: i + 1 for i, task in enumerate(self.all_tasks)}
-        # Set cell size
-        self.cell_size = min((DEFAULT_WINDOW_WIDTH - PANEL_WIDTH) // self.grid_size,
-                             DEFAULT_WINDOW_HEIGHT // self.grid_size)
-        self.margin = 1
+        # Set cell size, fonts and buttons for the current window
+        self.update_layout()
         # Set start position
         self.start_pos = self.env.get_start_position()
         # Initialize agent
         self.agent = RobotAgent(self.start_pos, self.tasks.copy(), algorithm=self.algorithm,
-                                nearest_task=self.nearest_task)
+                                nearest_task=self.nearest_task, tour=self.tour,
+                                tour_time_budget=self.tour_time_budget)
         self.animation_started = False
         self.agent.path_traveled = []
         self.agent.path = []
         self.agent.completed_tasks = []
         self.path_length = None
-
-    def update(self):
-        # Handle window resize
+        self.path_cost = None  # Total terrain cost of the traveled and planned path
+        self.blocked_positions = set()  # Obstacles added by clicking on the grid
+        # Rendering state: only cells listed in dirty_cells are redrawn on the next frame
+        self.dirty_cells = set()
+        self.redraw_all = True
+
+    def update_fonts(self, font_size):
+        self.font_size = font_size
+        self.font_small = get_font(font_size)
+        self.font_medium = get_font(int(font_size * 1.2))
+        self.font_large = get_font(int(font_size * 1.5))
+
+    def update_layout(self):
+        """Fits the grid to the window; the cached background is rebuilt on the next frame."""
         window_width, window_height = self.screen.get_size()
+        self.window_size = (window_width, window_height)
         grid_width = window_width - PANEL_WIDTH
         grid_height = window_height
-        self.cell_size = min(grid_width // self.grid_size, grid_height // self.grid_size)
-        self.margin = 1
+        self.cell_size = max(1, min(grid_width // self.grid_size, grid_height // self.grid_size))
+        self.margin = 1 if self.cell_size > 2 else 0
 
-        # Update fonts based on cell_size
-        self.font_size = int(self.cell_size // 2)
-        self.font_small = pygame.font.SysFont(None, self.font_size)
-        self.font_medium = pygame.font.SysFont(None, int(self.font_size * 1.2))
-        self.font_large = pygame.font.SysFont(None, int(self.font_size * 1.5))
-
-        self.start_button.font = self.font_medium
-        self.reset_button.font = self.font_medium
+        # Update fonts based on cell_size, keeping the panel readable on large grids
+        self.label_size = int(self.cell_size // 2)  # Task numbers have to fit inside their cell
+        self.update_fonts(max(12, self.label_size))
 
         # Update button positions on resize
         self.update_buttons()
+        self.background = None
+
+    def update(self):
+        # Handle window resize
+        if self.screen.get_size() != self.window_size:
+            self.update_layout()
 
         if self.animation_started:
             self.agent.move()
-            # Update path length
-            self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
+            self.update_path_length()
             # Stop the simulation when all tasks are completed
             if len(self.agent.completed_tasks) == len(self.tasks):
                 self.animation_started = False
 
+    def update_path_length(self):
+        self.path_length = len(self.agent.path_traveled) + len(self.agent.path)
+        # Each leg starts where the previous one ended, so repeated positions are not moves
+        steps = [self.start_pos]
+        for position in self.agent.path_traveled + self.agent.path:
+            if position != steps[-1]:
+                steps.append(position)
+        self.path_cost = path_cost(self.grid, steps)
+
     def draw(self):
-        self.screen.fill(WHITE)
-        self.draw_environment()
-        pygame.display.flip()
+        """Redraws what changed since the last frame and updates only those parts of the display."""
+        if self.background is None:
+            self.background = self.render_background()
+            self.redraw_all = True
+
+        if self.redraw_all:
+            self.draw_environment()
+            dirty_rects = [self.screen.get_rect()]
+            self.redraw_all = False
+        else:
+            dirty_rects = [self.draw_cell(cell) for cell in self.dirty_cells]
+            dirty_rects.extend(self.draw_panel())
+            dirty_rects.append(self.draw_agent())
+        # The agent is drawn over its cell, which has to be restored once it moves on
+        self.dirty_cells = {self.agent.position}
+        pygame.display.update(dirty_rects)
 
     def draw_environment(self):
+        self.screen.fill(WHITE)
+        self.screen.blit(self.background, (0, 0))
+        for cell in self.blocked_positions.union(self.all_tasks):
+            self.draw_cell(cell)
+        self.draw_panel()
+        self.draw_agent()
+
+    def render_background(self):
+        """Draws the static grid (walls and free cells, colored by terrain) once onto an off-screen surface."""
         CELL_SIZE = self.cell_size
         MARGIN = self.margin
-
-        # Draw the grid
+        background = pygame.Surface((self.grid_size * CELL_SIZE, self.grid_size * CELL_SIZE))
+        background.fill(WHITE)
+        costs = self.grid.costs
+        darkest = TERRAIN_COLORS[max(TERRAIN_COLORS)]
         for y in range(self.grid_size):
+            row = self.grid[y]
             for x in range(self.grid_size):
-                rect = pygame.Rect(
-                    x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-                )
-                if self.grid[y][x] == 1:
-                    pygame.draw.rect(self.screen, BLACK, rect)
+                if row[x] == 1:
+                    color = BLACK
+                elif costs is not None:
+                    color = TERRAIN_COLORS.get(costs[y * self.grid_size + x], darkest)
                 else:
-                    pygame.draw.rect(self.screen, GRAY, rect)
-
-        # Draw all tasks (both completed and uncompleted)
-        for task in self.all_tasks:
-            tx, ty = task
-            rect = pygame.Rect(
-                tx * CELL_SIZE, ty * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
-            )
-            if task in self.agent.completed_tasks:
+                    color = GRAY
+                background.fill(color, (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN))
+        return background
+
+    def draw_cell(self, cell):
+        """Restores one cell from the background and draws what covers it; returns the screen area."""
+        CELL_SIZE = self.cell_size
+        x, y = cell
+        area = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+        self.screen.blit(self.background, area, area)
+        rect = pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - self.margin, CELL_SIZE - self.margin)
+        if cell in self.blocked_positions:
+            pygame.draw.rect(self.screen, BROWN, rect)
+        if cell in self.task_numbers:
+            # Completed tasks turn green
+            if cell in self.agent.completed_tasks:
                 pygame.draw.rect(self.screen, GREEN, rect)
             else:
                 pygame.draw.rect(self.screen, RED, rect)
-            # Draw task number
-            task_number = self.task_numbers[task]
-            text_surface = self.font_small.render(str(task_number), True, BLACK)
-            text_rect = text_surface.get_rect(center=rect.center)
-            self.screen.blit(text_surface, text_rect)
-
+            # Draw task number, clipped to the cell so that redrawing a neighbor never cuts into it
+            if self.label_size >= MIN_LABEL_SIZE:
+                text_surface = self.render_text(str(self.task_numbers[cell]), self.label_size)
+                text_rect = text_surface.get_rect(center=rect.center)
+                self.screen.set_clip(area)
+                self.screen.blit(text_surface, text_rect)
+                self.screen.set_clip(None)
+        return area
+
+    def draw_panel(self):
         # Draw right panel background
-        panel_rect = pygame.Rect(self.grid_size * CELL_SIZE, 0, PANEL_WIDTH, self.screen.get_height())
+        panel_rect = pygame.Rect(self.grid_size * self.cell_size, 0, PANEL_WIDTH, self.screen.get_height())
         pygame.draw.rect(self.screen, WHITE, panel_rect)
 
         # Draw UI elements on the right panel
@@ -191,47 +271,68 @@ class SearchSimulation(SimulationBase):
         # Draw Start and Reset buttons
         self.start_button.draw(self.screen)
         self.reset_button.draw(self.screen)
-
-        # Draw the agent
-        self.draw_agent()
+        return [panel_rect, self.start_button.rect, self.reset_button.rect]
 
     def draw_ui(self, panel_x, y_offset):
         # Display Agent Status
-        status_text = self.font_medium.render("Agent Status", True, BLACK)
+        status_text = self.render_text("Agent Status", int(self.font_size * 1.2))
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
-        position_text = self.font_small.render(f"Position: {self.agent.position}", True, BLACK)
+        position_text = self.render_text(f"Position: {self.agent.position}", self.font_size)
         self.screen.blit(position_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
         if self.animation_started:
-            status_text = self.font_small.render("Status: Moving", True, BLACK)
+            status_text = self.render_text("Status: Moving", self.font_size)
         else:
-            status_text = self.font_small.render("Status: Idle", True, BLACK)
+            status_text = self.render_text("Status: Idle", self.font_size)
         self.screen.blit(status_text, (panel_x, y_offset))
         y_offset += int(self.font_size * 1.5)
 
         # Display Path Length
         if self.path_length is not None:
-            path_length_text = self.font_small.render(f"Path Length: {self.path_length}", True, BLACK)
+            path_length_text = self.render_text(f"Path Length: {self.path_length}", self.font_size)
             self.screen.blit(path_length_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
+            if self.grid.costs is not None:
+                path_cost_text = self.render_text(f"Path Cost: {self.path_cost}", self.font_size)
+                self.screen.blit(path_cost_text, (panel_x, y_offset))
+                y_offset += int(self.font_size)
 
         # Display Algorithm Used
-        algorithm_text = self.font_small.render(f"Algorithm: {self.algorithm.upper()}", True, BLACK)
+        algorithm_text = self.render_text(f"Algorithm: {self.algorithm.upper()}", self.font_size)
         self.screen.blit(algorithm_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
+        # Display Search Statistics
+        stats = self.agent.stats
+        for label, value in (("Expanded", stats.expansions), ("Pushes", stats.pushes),
+                             ("Max Frontier", stats.max_frontier), ("Reopenings", stats.reopenings),
+                             ("Search Time", f"{stats.elapsed * 1000:.1f} ms")):
+            stats_text = self.render_text(f"{label}: {value}", self.font_size)
+            self.screen.blit(stats_text, (panel_x, y_offset))
+            y_offset += int(self.font_size)
+
+        # Display Planned Tour
+        if self.agent.tour_length is not None:
+            tour_text = self.render_text(f"Tour Length: {self.agent.tour_length}", self.font_size)
+            self.screen.blit(tour_text, (panel_x, y_offset))
+            y_offset += int(self.font_size)
+            planning_text = self.render_text(f"Planning Time: {self.agent.planning_time * 1000:.1f} ms",
+                                             self.font_size)
+            self.screen.blit(planning_text, (panel_x, y_offset))
+            y_offset += int(self.font_size)
+
         # Display Tasks Remaining
         tasks_remaining = len(self.tasks) - len(self.agent.completed_tasks)
-        tasks_remaining_text = self.font_small.render(f"Tasks Remaining: {tasks_remaining}", True, BLACK)
+        tasks_remaining_text = self.render_text(f"Tasks Remaining: {tasks_remaining}", self.font_size)
         self.screen.blit(tasks_remaining_text, (panel_x, y_offset))
         y_offset += int(self.font_size)
 
         # Display Mouse Grid Position
         if self.mouse_grid_pos is not None:
-            mouse_pos_text = self.font_small.render(f"Cursor Position: {self.mouse_grid_pos}", True, BLACK)
+            mouse_pos_text = self.render_text(f"Cursor Position: {self.mouse_grid_pos}", self.font_size)
             self.screen.blit(mouse_pos_text, (panel_x, y_offset))
             y_offset += int(self.font_size)
         else:
@@ -246,6 +347,7 @@ class SearchSimulation(SimulationBase):
             x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE - MARGIN, CELL_SIZE - MARGIN
         )
         pygame.draw.rect(self.screen, BLUE, rect)
+        return rect
 
     def run(self):
         """Main loop of the simulation."""
@@ -253,7 +355,6 @@ class SearchSimulation(SimulationBase):
             self.handle_events()
             self.update()
             self.draw()
-            pygame.display.flip()
             self.clock.tick(5)  # Set to 5 FPS to slow down the animation
 
     def quit(self):
@@ -267,12 +368,14 @@ class Button:
         self.text = text
         self.text_color = text_color
         self.font = font
+        self.text_surf = None  # Rendered once, on the first draw
 
     def draw(self, surface):
         pygame.draw.rect(surface, self.color, self.rect)
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        if self.text_surf is None:
+            self.text_surf = self.font.render(self.text, True, self.text_color)
+        text_rect = self.text_surf.get_rect(center=self.rect.center)
+        surface.blit(self.text_surf, text_rect)
 
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
@@ -2,21 +2,48 @@
 
 import pygame
 
+from modules.utils.constants import BLACK
+
+# Rendered text surfaces kept per simulation; the cache is cleared when it grows past this
+TEXT_CACHE_LIMIT = 512
+
+# pygame.font.SysFont is slow (it looks up the system fonts), so each size is created once
+_fonts = {}
+
+
+def get_font(size):
+    """Returns the default font at the given size, creating it on first use."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.SysFont(None, size)
+    return font
+
+
 class SimulationBase:
     def __init__(self, screen):
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.running = True
+        self.text_cache = {}
 
     def run(self):
-        """Main loop of the simulation."""
+        """Main loop of the simulation. draw() is responsible for updating the display."""
         while self.running:
             self.handle_events()
             self.update()
             self.draw()
-            pygame.display.flip()
             self.clock.tick(60)  # Adjust the frame rate as needed
 
+    def render_text(self, text, size, color=BLACK):
+        """Returns a rendered text surface, reusing the one from an earlier frame when the text is unchanged."""
+        key = (text, size, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_LIMIT:
+                self.text_cache.clear()
+            surface = self.text_cache[key] = get_font(size).render(text, True, color)
+        return surface
+
     def handle_events(self):
         """Handle user input and system events."""
         raise NotImplementedError("Subclasses should implement this method.")
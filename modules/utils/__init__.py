@@ -4,8 +4,11 @@ from .constants import (
     PANEL_WIDTH, DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT,
     WHITE, GRAY, GREEN, BLUE, PURPLE, BLACK, YELLOW, BROWN, LIGHT_GRAY
 )
+from .grid import Grid
+from .graph import CSRGraph, grid_graph, clear_graph_cache
 
 __all__ = [
     'PANEL_WIDTH', 'DEFAULT_WINDOW_WIDTH', 'DEFAULT_WINDOW_HEIGHT',
-    'WHITE', 'GRAY', 'GREEN', 'BLUE', 'PURPLE', 'BLACK', 'YELLOW', 'BROWN', 'LIGHT_GRAY'
+    'WHITE', 'GRAY', 'GREEN', 'BLUE', 'PURPLE', 'BLACK', 'YELLOW', 'BROWN', 'LIGHT_GRAY',
+    'Grid', 'CSRGraph', 'grid_graph', 'clear_graph_cache'
 ]
@@ -21,3 +21,11 @@ DARK_BLUE = (0, 0, 139)
 # Additional colors
 RED = (255, 0, 0)  # For the goal position in the maze
 
+
+# Terrain colors by the cost of stepping onto a cell; costlier cells are darker
+TERRAIN_COLORS = {
+    1: GRAY,             # Floor
+    2: (170, 205, 130),  # Grass
+    4: (225, 200, 140),  # Sand
+    8: (150, 115, 75),   # Mud
+}
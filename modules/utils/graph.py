@@ -0,0 +1,208 @@
+# modules/utils/graph.py
+
+import zlib
+from array import array
+
+# Compressed sparse row (CSR) adjacency shared by the graph search algorithms.
+# The neighbors of vertex v are targets[offsets[v]:offsets[v + 1]], so looking them
+# up is one array slice instead of bounds and wall checks on every expansion.
+# Grids convert with one vertex per cell (vertex = flat index y * width + x; walls
+# get no edges); any other graph can be loaded from an edge list file.
+
+# Grid graphs kept by grid_graph(); the oldest are dropped beyond this many, or beyond this many bytes
+GRAPH_CACHE_SIZE = 8
+GRAPH_CACHE_BYTES = 256 * 1024 * 1024
+# Graphs whose weights are all integers from 1 to this (as grid costs are) are searched with a ring of buckets
+MAX_BUCKET_WEIGHT = 255
+
+_grid_graphs = {}
+
+
+class CSRGraph:
+    def __init__(self, offsets, targets, weights=None, labels=None, width=None):
+        self.offsets = offsets  # array('i') of vertex_count + 1 edge offsets
+        self.targets = targets  # array('i') of edge targets
+        self.weights = weights  # array('d') of edge weights parallel to targets, or None when every edge costs 1
+        self.labels = labels  # Names of the vertices (edge list graphs), or None
+        self.label_index = {label: vertex for vertex, label in enumerate(labels)} if labels is not None else None
+        self.width = width  # Grid width for graphs built from a grid, or None
+        self._bucket_weights = None  # Result of bucket_weights(), once computed
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Builds the 4-connected graph of a Grid's free cells, neighbors in Left, Right, Up, Down order.
+
+        On grids with terrain, every edge weighs the cost of the cell it leads to.
+        """
+        cells = grid.cells
+        width = grid.width
+        size = len(cells)
+        last_row = size - width
+        offsets = array('i', [0]) * (size + 1)
+        targets = array('i')
+        append = targets.append
+        for index in range(size):
+            if not cells[index]:
+                x = index % width
+                if x > 0 and not cells[index - 1]:
+                    append(index - 1)
+                if x < width - 1 and not cells[index + 1]:
+                    append(index + 1)
+                if index >= width and not cells[index - width]:
+                    append(index - width)
+                if index < last_row and not cells[index + width]:
+                    append(index + width)
+            offsets[index + 1] = len(targets)
+        weights = None
+        if grid.costs is not None:
+            costs = grid.costs
+            weights = array('d', [costs[target] for target in targets])
+        return cls(offsets, targets, weights, width=width)
+
+    @classmethod
+    def from_edges(cls, vertex_count, edges, directed=False, labels=None):
+        """Builds a graph from (source, target) or (source, target, weight) tuples of vertex numbers.
+
+        Undirected graphs get both directions of every edge. Weights are kept only
+        if at least one edge has one; missing weights count as 1.
+        """
+        weighted = False
+        arcs = []
+        for edge in edges:
+            source, target = edge[0], edge[1]
+            weight = 1.0
+            if len(edge) > 2:
+                weight = float(edge[2])
+                weighted = True
+            arcs.append((source, target, weight))
+            if not directed:
+                arcs.append((target, source, weight))
+        arcs.sort(key=lambda arc: arc[0])
+
+        offsets = array('i', [0]) * (vertex_count + 1)
+        for source, _, _ in arcs:
+            offsets[source + 1] += 1
+        for vertex in range(vertex_count):
+            offsets[vertex + 1] += offsets[vertex]
+        targets = array('i', [target for _, target, _ in arcs])
+        weights = array('d', [weight for _, _, weight in arcs]) if weighted else None
+        return cls(offsets, targets, weights, labels)
+
+    @classmethod
+    def from_edge_list(cls, path, directed=False):
+        """Loads a graph from a text file with one 'source target [weight]' edge per line.
+
+        Vertices may be named by any token (road network dumps typically use
+        numbers); they are numbered in order of first appearance and the names are
+        kept in labels. Blank lines and lines starting with # or % are skipped.
+        """
+        labels = []
+        numbers = {}
+        edges = []
+        with open(path) as file:
+            for line in file:
+                fields = line.split()
+                if not fields or fields[0][0] in '#%':
+                    continue
+                if len(fields) < 2:
+                    raise ValueError(f"Malformed edge line: {line.strip()!r}")
+                ends = []
+                for label in fields[:2]:
+                    vertex = numbers.get(label)
+                    if vertex is None:
+                        vertex = numbers[label] = len(labels)
+                        labels.append(label)
+                    ends.append(vertex)
+                edges.append((ends[0], ends[1], fields[2]) if len(fields) > 2 else (ends[0], ends[1]))
+        return cls.from_edges(len(labels), edges, directed, labels)
+
+    @property
+    def vertex_count(self):
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self):
+        """Number of directed edges (an undirected edge counts twice)."""
+        return len(self.targets)
+
+    def bucket_weights(self):
+        """Returns (weights, max_weight) if every edge weight is an integer from 1 to MAX_BUCKET_WEIGHT, else None.
+
+        weights is an array('i') parallel to targets (None on unweighted graphs,
+        where max_weight is 1). The check runs once per graph.
+        """
+        if self._bucket_weights is None:
+            weights = self.weights
+            if weights is None:
+                self._bucket_weights = (None, 1)
+            elif (not weights or 1 <= min(weights) and max(weights) <= MAX_BUCKET_WEIGHT
+                  and all(weight.is_integer() for weight in weights)):
+                self._bucket_weights = (array('i', map(int, weights)), int(max(weights, default=1)))
+            else:
+                self._bucket_weights = False
+        return self._bucket_weights or None
+
+    @property
+    def nbytes(self):
+        """Bytes held by the adjacency arrays (and the integer weights, once bucket_weights() made them)."""
+        total = len(self.offsets) * self.offsets.itemsize + len(self.targets) * self.targets.itemsize
+        if self.weights is not None:
+            total += len(self.weights) * self.weights.itemsize
+        if self._bucket_weights and self._bucket_weights[0] is not None:
+            total += len(self._bucket_weights[0]) * self._bucket_weights[0].itemsize
+        return total
+
+    def neighbors(self, vertex):
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def edges(self, vertex):
+        """Returns (neighbor, weight) pairs of the edges leaving vertex."""
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        if self.weights is None:
+            return [(target, 1) for target in self.targets[start:end]]
+        return list(zip(self.targets[start:end], self.weights[start:end]))
+
+    def vertex_of(self, key):
+        """Returns the vertex for a grid position (x, y) or an edge list label."""
+        if self.width is not None:
+            x, y = key
+            return y * self.width + x
+        return self.label_index[key]
+
+    def key_of(self, vertex):
+        """Inverse of vertex_of: the grid position or label of a vertex."""
+        if self.width is not None:
+            return (vertex % self.width, vertex // self.width)
+        return self.labels[vertex] if self.labels is not None else vertex
+
+    def __repr__(self):
+        return f"CSRGraph(vertices={self.vertex_count}, edges={self.edge_count})"
+
+
+def grid_graph(grid):
+    """Returns the CSRGraph of a Grid, reusing the one built earlier for the same grid contents.
+
+    Graphs are cached by the grid's dimensions and a CRC32 of its cells (and
+    terrain costs); a hit is confirmed against a copy of them, so a grid that has
+    been edited since (a new version) always gets a graph of its own. The oldest
+    graphs are dropped once more than GRAPH_CACHE_SIZE of them, or more than
+    GRAPH_CACHE_BYTES, are kept; the graph just built always stays.
+    """
+    contents = bytes(grid.cells) if grid.costs is None else bytes(grid.cells) + bytes(grid.costs)
+    key = (grid.width, grid.height, zlib.crc32(contents))
+    entry = _grid_graphs.get(key)
+    if entry is not None and entry[0] == contents:
+        return entry[1]
+    graph = CSRGraph.from_grid(grid)
+    _grid_graphs[key] = (contents, graph)
+    cached_bytes = sum(len(cached_contents) + cached_graph.nbytes
+                       for cached_contents, cached_graph in _grid_graphs.values())
+    while len(_grid_graphs) > 1 and (len(_grid_graphs) > GRAPH_CACHE_SIZE or cached_bytes > GRAPH_CACHE_BYTES):
+        oldest_contents, oldest_graph = _grid_graphs.pop(next(iter(_grid_graphs)))
+        cached_bytes -= len(oldest_contents) + oldest_graph.nbytes
+    return graph
+
+
+def clear_graph_cache():
+    """Drops every graph kept by grid_graph(), e.g. after searching a batch of large grids."""
+    _grid_graphs.clear()
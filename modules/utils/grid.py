@@ -0,0 +1,217 @@
+# modules/utils/grid.py
+
+from itertools import compress
+
+# Compact occupancy grid shared by the environments and the search algorithms.
+# Cells live in one contiguous bytearray (0 = free, 1 = wall) addressed by the
+# flat index y * width + x. Indexing a Grid with a row number returns a writable
+# memoryview of that row, so code written for lists of lists (grid[y][x],
+# len(grid), iterating over rows) keeps working unchanged.
+# Grids may also carry terrain: a second bytearray with the cost (1-255) of
+# stepping onto each cell. Without it every move costs 1.
+
+FREE = 0
+WALL = 1
+
+# Maps every non-zero byte to WALL
+_NORMALIZE = bytes([FREE] + [WALL] * 255)
+
+
+class Grid:
+    def __init__(self, width, height, fill=FREE):
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+        self.costs = None  # Traversal cost of every cell, or None when every move costs 1
+        # Flat index offsets for Left, Right, Up, Down
+        self.neighbor_offsets = (-1, 1, -width, width)
+
+    @classmethod
+    def from_buffer(cls, width, height, buffer, costs=None):
+        """Wraps an existing writable buffer (for example shared memory) without copying it."""
+        grid = cls(0, 0)
+        grid.width = width
+        grid.height = height
+        grid.cells = buffer
+        grid.costs = costs
+        grid.neighbor_offsets = (-1, 1, -width, width)
+        return grid
+
+    @classmethod
+    def from_rows(cls, rows, width=None, height=None):
+        """Builds a Grid from a list of lists (or any sequence of rows), optionally cropped."""
+        if height is None:
+            height = len(rows)
+        if width is None:
+            width = len(rows[0]) if height else 0
+        grid = cls(width, height)
+        cells = grid.cells
+        for y in range(height):
+            cells[y * width:(y + 1) * width] = bytes(rows[y][:width]).translate(_NORMALIZE)
+        return grid
+
+    def to_rows(self):
+        """Returns the grid as a list of lists of ints."""
+        width = self.width
+        return [list(self.cells[y * width:(y + 1) * width]) for y in range(self.height)]
+
+    def copy(self):
+        grid = Grid(self.width, self.height)
+        grid.cells[:] = self.cells
+        if self.costs is not None:
+            grid.costs = bytearray(self.costs)
+        return grid
+
+    def set_costs(self, costs):
+        """Sets the cost of stepping onto every cell from a flat sequence of integers 1-255, or clears it with None."""
+        if costs is None:
+            self.costs = None
+            return
+        costs = bytearray(costs)
+        if len(costs) != len(self.cells):
+            raise ValueError(f"Expected {len(self.cells)} costs, got {len(costs)}")
+        if 0 in costs:
+            raise ValueError("Cell costs must be at least 1")
+        self.costs = costs
+
+    def cost_of(self, index):
+        return self.costs[index] if self.costs is not None else 1
+
+    @property
+    def max_cost(self):
+        """The highest cost of any cell (1 without terrain), which bounds the bucket queues of ucs and astar."""
+        return max(self.costs) if self.costs else 1
+
+    def with_blocked(self, blocked_positions):
+        """Returns a copy of the grid with the given positions marked as walls."""
+        grid = self.copy()
+        for position in blocked_positions:
+            if grid.in_bounds(position):
+                grid.cells[grid.index_of(position)] = WALL
+        return grid
+
+    def index_of(self, position):
+        x, y = position
+        return y * self.width + x
+
+    def position_of(self, index):
+        return (index % self.width, index // self.width)
+
+    def in_bounds(self, position):
+        x, y = position
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_passable(self, index):
+        return not self.cells[index]
+
+    def neighbors(self, index):
+        """Returns the passable neighbors of a flat index in Left, Right, Up, Down order."""
+        cells = self.cells
+        width = self.width
+        neighbors = []
+        x = index % width
+        if x > 0 and not cells[index - 1]:
+            neighbors.append(index - 1)
+        if x < width - 1 and not cells[index + 1]:
+            neighbors.append(index + 1)
+        if index >= width and not cells[index - width]:
+            neighbors.append(index - width)
+        if index < len(cells) - width and not cells[index + width]:
+            neighbors.append(index + width)
+        return neighbors
+
+    def neighbors_by_position(self, index):
+        """Returns the passable neighbors of a flat index sorted by (x, y), i.e. in Left, Up, Down, Right order."""
+        cells = self.cells
+        width = self.width
+        neighbors = []
+        x = index % width
+        if x > 0 and not cells[index - 1]:
+            neighbors.append(index - 1)
+        if index >= width and not cells[index - width]:
+            neighbors.append(index - width)
+        if index < len(cells) - width and not cells[index + width]:
+            neighbors.append(index + width)
+        if x < width - 1 and not cells[index + 1]:
+            neighbors.append(index + 1)
+        return neighbors
+
+    def reachable_mask(self, index):
+        """Returns a bytearray with 1 for every free cell 4-connected to index (index included), 0 elsewhere.
+
+        The flood fill runs on a padded copy of the cells with a wall row above
+        and below and a wall column after every row, in which walls count as
+        already seen. Each neighbor then takes a single byte test, with no
+        bounds or row-edge checks.
+        """
+        cells = self.cells
+        size = len(cells)
+        if cells[index]:
+            return bytearray(size)
+        width = self.width
+        stride = width + 1
+        blocked = bytes(cells).translate(_NORMALIZE)  # Walls as 1 whatever their byte value
+        border = bytes([WALL]) * stride
+        seen = bytearray(border)
+        seen += bytes([WALL]).join(blocked[start:start + width] for start in range(0, size, width))
+        seen += border
+        first = stride + index + index // width
+        seen[first] = 1
+        region = [first]
+        append = region.append
+        for current in region:
+            neighbor = current - 1
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                append(neighbor)
+            neighbor = current + 1
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                append(neighbor)
+            neighbor = current - stride
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                append(neighbor)
+            neighbor = current + stride
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                append(neighbor)
+        # Unpad: seen now marks walls and reached cells, so removing the walls leaves the reached ones
+        rows = range(stride, stride + self.height * stride, stride)
+        seen_or_wall = b''.join(seen[start:start + width] for start in rows)
+        reached = int.from_bytes(seen_or_wall, 'little') ^ int.from_bytes(blocked, 'little')
+        return bytearray(reached.to_bytes(size, 'little'))
+
+    def reachable_from(self, index):
+        """Returns the flat indices of all free cells 4-connected to index (index included), in increasing order."""
+        return list(compress(range(len(self.cells)), self.reachable_mask(index)))
+
+    @property
+    def nbytes(self):
+        return len(self.cells) + (len(self.costs) if self.costs is not None else 0)
+
+    # List-of-lists adapter
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("grid row index out of range")
+        start = y * self.width
+        return memoryview(self.cells)[start:start + self.width]
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield self[y]
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return (self.width == other.width and self.height == other.height and self.cells == other.cells
+                    and self.costs == other.costs)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Grid(width={self.width}, height={self.height})"